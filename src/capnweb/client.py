@@ -5,15 +5,15 @@ from __future__ import annotations
 import asyncio
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Self
 
 from capnweb.error import ErrorCode, RpcError
 from capnweb.hooks import ErrorStubHook, PayloadStubHook, TargetStubHook
-from capnweb.ids import ExportId
 from capnweb.payload import RpcPayload
 from capnweb.pipeline import PendingCall, PipelineBatch, PipelinePromise
 from capnweb.resume import ResumeToken  # noqa: TC001
-from capnweb.session import RpcSession
+from capnweb.session import PendingPipelineOp, RpcSession
 from capnweb.stubs import RpcStub
 from capnweb.transports import (
     HttpBatchTransport,
@@ -32,20 +32,41 @@ from capnweb.wire import (
     WireReject,
     WireRelease,
     WireResolve,
-    parse_wire_batch,
-    serialize_wire_batch,
+    parse_wire_batch_bytes,
+    property_key,
+    serialize_wire_batch_bytes,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
     from capnweb.types import RpcTarget
 
 
+@lru_cache(maxsize=1024)
+def _property_path(path: tuple[str | int, ...]) -> list[PropertyKey]:
+    """Get the shared wire property path for a call or property path.
+
+    Repeated calls to the same remote method reuse one list of frozen
+    PropertyKeys instead of allocating a key per segment per call. The
+    returned list is shared, so it must be treated as read-only.
+
+    Args:
+        path: The property path (+ method name for calls)
+
+    Returns:
+        The path as PropertyKeys
+    """
+    return [property_key(p) for p in path]
+
+
 @dataclass
 class ClientConfig:
     """Configuration for the Cap'n Web client."""
 
     url: str
     timeout: float = 30.0
+    release_delay: float = 0.0
 
 
 class Client(RpcSession):
@@ -58,10 +79,13 @@ class Client(RpcSession):
     def __init__(self, config: ClientConfig) -> None:
         super().__init__()
         self.config = config
+        self.release_delay = config.release_delay
         self._transport: (
             HttpBatchTransport | WebSocketTransport | WebTransportTransport | None
         ) = None
         self._import_ref_counts: dict[int, int] = {}
+        # Fire-and-forget sends still in flight, awaited by close()
+        self._background_sends: set[asyncio.Task[None]] = set()
 
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
@@ -75,7 +99,17 @@ class Client(RpcSession):
         await self.close()
 
     async def close(self) -> None:
-        """Close the client connection."""
+        """Close the client connection.
+
+        Pipelined operations and releases that are still queued are sent
+        first, and background sends are awaited, so nothing queued before
+        closing is dropped.
+        """
+        self._flush_pending_ops()
+        self._flush_releases()
+        if self._background_sends:
+            await asyncio.gather(*self._background_sends, return_exceptions=True)
+
         if self._transport:
             await self._transport.close()
             self._transport = None
@@ -113,9 +147,8 @@ class Client(RpcSession):
         # Import IDs start from 1 for each batch
         import_id = 1
 
-        # Build property path including method name
-        full_path = (property_path or []) + [method]
-        path_keys = [PropertyKey(p) for p in full_path]
+        # Property path including method name, shared across repeated calls
+        path_keys = _property_path((*(property_path or ()), method))
 
         # Serialize arguments using the new serializer
         args_payload = RpcPayload.from_app_params(args)
@@ -135,21 +168,18 @@ class Client(RpcSession):
         pull_msg = WirePull(import_id)
 
         # Send the batch
-        batch = serialize_wire_batch([push_msg, pull_msg])
+        batch = serialize_wire_batch_bytes([push_msg, pull_msg])
 
         try:
-            # Use transport abstraction
-            response_bytes = await self._transport.send_and_receive(
-                batch.encode("utf-8")
-            )
-            response_text = response_bytes.decode("utf-8")
+            # Use transport abstraction; batches stay as bytes both ways
+            response_bytes = await self._transport.send_and_receive(batch)
 
-            if not response_text:
+            if not response_bytes:
                 # No content - call succeeded but no response
                 return None
 
             # Parse responses
-            messages = parse_wire_batch(response_text)
+            messages = parse_wire_batch_bytes(response_bytes)
 
             # Process responses and extract result
             result = None
@@ -179,10 +209,10 @@ class Client(RpcSession):
         """Process a response message from the server."""
         match msg:
             case WireResolve(export_id, value):
-                await self._handle_resolve(ExportId(export_id), value)
+                await self._handle_resolve(export_id, value)
 
             case WireReject(export_id, error):
-                await self._handle_reject(ExportId(export_id), error)
+                await self._handle_reject(export_id, error)
 
             case WireAbort(error):
                 await self._handle_abort(error)
@@ -191,10 +221,17 @@ class Client(RpcSession):
                 # Other message types not expected in client responses
                 pass
 
-    async def _handle_resolve(self, export_id: ExportId, value: Any) -> None:
+    async def _handle_resolve(self, export_id: int, value: Any) -> None:
         """Handle a resolve message from the server."""
         # Convert export ID to import ID (they're negatives of each other)
-        import_id = -export_id.value
+        import_id = -export_id
+
+        # Nobody is waiting any more (e.g. the call was cancelled), so don't
+        # pay for parsing a result that would be dropped
+        future = self._pending_promises.get(import_id)
+        if future is None or future.done():
+            self._pending_promises.pop(import_id, None)
+            return
 
         # Parse the value using the parser
         result_payload = self.parser.parse(value)
@@ -208,18 +245,19 @@ class Client(RpcSession):
         if isinstance(error_expr, WireError):
             # Try to map error type to ErrorCode, default to INTERNAL if unknown
             error_type = error_expr.error_type.lower().replace(" ", "_")
-            try:
-                code = ErrorCode(error_type)
-            except ValueError:
-                # Unknown error code, use INTERNAL
-                code = ErrorCode.INTERNAL
+            code = ErrorCode.from_wire(error_type)
             return RpcError(code, error_expr.message, error_expr.stack)
         return RpcError.internal(f"Unknown error: {error_expr}")
 
-    async def _handle_reject(self, export_id: ExportId, error_expr: Any) -> None:
+    async def _handle_reject(self, export_id: int, error_expr: Any) -> None:
         """Handle a reject message from the server."""
         # Convert export ID to import ID
-        import_id = -export_id.value
+        import_id = -export_id
+
+        future = self._pending_promises.get(import_id)
+        if future is None or future.done():
+            self._pending_promises.pop(import_id, None)
+            return
 
         # Parse error
         error = self._parse_error(error_expr)
@@ -252,23 +290,43 @@ class Client(RpcSession):
         Args:
             import_id: The import ID to release
         """
+        self._send_release_messages([import_id])
+
+    def _send_release_messages(self, import_ids: list[int]) -> None:
+        """Send release messages for several imports in a single batch.
+
+        Args:
+            import_ids: The import IDs to release
+        """
         if not self._transport:
             return
 
-        # Get reference count
-        refcount = self._import_ref_counts.pop(import_id, 1)
+        # Get reference counts
+        release_msgs = [
+            WireRelease(import_id, self._import_ref_counts.pop(import_id, 1))
+            for import_id in import_ids
+        ]
 
-        # Send release message (best-effort, non-blocking)
+        # Send release messages (best-effort, non-blocking)
         async def send_release():
             if self._transport:
-                release_msg = WireRelease(import_id, refcount)
-                batch = serialize_wire_batch([release_msg])
+                batch = serialize_wire_batch_bytes(release_msgs)
 
                 with suppress(Exception):
-                    await self._transport.send_and_receive(batch.encode("utf-8"))
+                    await self._transport.send_and_receive(batch)
 
         # Schedule the release to run in the background
-        asyncio.create_task(send_release())
+        self._send_in_background(send_release())
+
+    def _send_in_background(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a send as a background task that close() waits for.
+
+        Args:
+            coro: The send coroutine
+        """
+        task = asyncio.create_task(coro)
+        self._background_sends.add(task)
+        task.add_done_callback(self._background_sends.discard)
 
     def register_capability(self, export_id: int, target: RpcTarget) -> None:
         """Register a local capability that can be called by the server.
@@ -400,7 +458,7 @@ class Client(RpcSession):
     def send_pipeline_call(
         self,
         import_id: int,
-        path: list[str | int],
+        path: tuple[str | int, ...],
         args: RpcPayload,
         result_import_id: int,
     ) -> None:
@@ -416,64 +474,119 @@ class Client(RpcSession):
             args: Arguments for the call
             result_import_id: Import ID for the result
         """
-        # For HTTP batch, we can't truly pipeline - we have to send immediately
-        # Create a task that will be resolved when the result comes back
+        self.send_pipeline_batch([
+            PendingPipelineOp(import_id, path, args, result_import_id)
+        ])
 
-        # Build property path for the wire message
-        path_keys = [PropertyKey(p) for p in path]
+    def send_pipeline_batch(self, ops: list[PendingPipelineOp]) -> None:
+        """Send several pipelined operations in a single batch.
 
-        # Serialize arguments
-        serialized_args = self.serializer.serialize_payload(args)
+        All push messages come first, followed by one pull per operation,
+        so the whole set costs one round trip.
 
-        # Create pipeline expression
-        pipeline_expr = WirePipeline(
-            import_id=import_id,
-            property_path=path_keys,
-            args=serialized_args,
-        )
+        The server numbers the pushes of each request 1, 2, 3... and looks
+        a push's target up among the earlier pushes before its exports. The
+        pushes are therefore pulled by position, and the replies are mapped
+        back to each operation's result import ID. An operation whose target
+        ID would name an earlier push starts a new request instead.
 
-        # Create push and pull messages
-        push_msg = WirePush(pipeline_expr)
-        pull_msg = WirePull(result_import_id)
+        Args:
+            ops: The queued operations, in the order they were made
+        """
+        # For HTTP batch, we can't truly pipeline - we have to send immediately
+        # Build every request first, so a serialization error sends nothing
+        requests: list[tuple[list[PendingPipelineOp], list[WireMessage]]] = []
+        for group in _push_groups(ops):
+            messages: list[WireMessage] = []
+            for op in group:
+                # Property gets are sent as calls with no arguments
+                args = op.args if op.args is not None else RpcPayload.owned([])
+                pipeline_expr = WirePipeline(
+                    import_id=op.import_id,
+                    property_path=_property_path(op.path),
+                    args=self.serializer.serialize_payload(args),
+                )
+                messages.append(WirePush(pipeline_expr))
+            messages.extend(WirePull(position) for position in range(1, len(group) + 1))
+            requests.append((group, messages))
+
+        # Send each request in a background task
+        for group, messages in requests:
+            self._send_in_background(self._send_push_group(group, messages))
+
+    async def _send_push_group(
+        self, ops: list[PendingPipelineOp], messages: list[WireMessage]
+    ) -> None:
+        """Send one request of pushes and pulls and settle the results.
 
-        # Send immediately in a background task
-        async def send_and_handle():
-            if not self._transport:
-                return
+        Every operation's promise is settled: from its reply, or rejected if
+        the request fails or the server does not answer it.
 
-            batch = serialize_wire_batch([push_msg, pull_msg])
+        Args:
+            ops: The operations, in push order
+            messages: The push and pull messages for the operations
+        """
+        try:
+            if not self._transport:
+                msg = "No transport available"
+                raise RpcError.internal(msg)
             response_bytes = await self._transport.send_and_receive(
-                batch.encode("utf-8")
+                serialize_wire_batch_bytes(messages)
             )
-            response_text = response_bytes.decode("utf-8")
+            replies = parse_wire_batch_bytes(response_bytes) if response_bytes else []
+        except Exception as e:
+            for op in ops:
+                error = (
+                    e
+                    if isinstance(e, RpcError)
+                    else RpcError.internal(f"Transport error: {e}")
+                )
+                self.reject_promise(op.result_import_id, error)
+            return
 
-            # Parse response and resolve the pending import
-            messages = parse_wire_batch(response_text)
-            for msg in messages:
-                if isinstance(msg, WireResolve) and msg.export_id == -result_import_id:
-                    result_payload = self.parser.parse(msg.value)
-                    # Get the future for this import
-                    if result_import_id in self._pending_promises:
-                        future = self._pending_promises.pop(result_import_id)
-                        if not future.done():
-                            # Create hook from the payload
-                            result_hook = PayloadStubHook(result_payload)
-                            future.set_result(result_hook)
-                elif isinstance(msg, WireReject) and msg.export_id == -result_import_id:
-                    error = self._parse_error(msg.error)
-                    if result_import_id in self._pending_promises:
-                        future = self._pending_promises.pop(result_import_id)
-                        if not future.done():
-                            error_hook = ErrorStubHook(error)
-                            future.set_result(error_hook)
+        for msg in replies:
+            if not isinstance(msg, WireResolve | WireReject):
+                continue
+            # Pulls are answered with the push position, and a push that
+            # fails is rejected with its negation
+            position = abs(msg.export_id)
+            if 0 < position <= len(ops):
+                self._settle_pipeline_result(ops[position - 1].result_import_id, msg)
+
+        # Anything still pending was not answered
+        for op in ops:
+            if op.result_import_id in self._pending_promises:
+                msg = "No response for pipelined call"
+                self.reject_promise(op.result_import_id, RpcError.internal(msg))
+
+    def _settle_pipeline_result(
+        self, result_import_id: int, msg: WireResolve | WireReject
+    ) -> None:
+        """Settle a pipelined operation's promise from the server's reply.
 
-        # Schedule the task
-        asyncio.create_task(send_and_handle())
+        Args:
+            result_import_id: The operation's result import ID
+            msg: The resolve or reject answering the operation
+        """
+        future = self._pending_promises.get(result_import_id)
+        if future is None or future.done():
+            self._pending_promises.pop(result_import_id, None)
+            return
+        if isinstance(msg, WireReject):
+            error = self._parse_error(msg.error)
+            self.resolve_promise(result_import_id, ErrorStubHook.of(error))
+            return
+        try:
+            result_payload = self.parser.parse(msg.value)
+        except Exception as e:
+            self.reject_promise(result_import_id, e)
+            return
+        self.resolve_promise(result_import_id, PayloadStubHook(result_payload))
 
     def send_pipeline_get(
         self,
         import_id: int,
-        path: list[str | int],
+        path: tuple[str | int, ...],
         result_import_id: int,
     ) -> None:
         """Send a pipelined property get message.
@@ -506,17 +619,16 @@ class Client(RpcSession):
             raise RpcError.internal(msg)
 
         pull_msg = WirePull(import_id)
-        batch = serialize_wire_batch([pull_msg])
+        batch = serialize_wire_batch_bytes([pull_msg])
 
-        response_bytes = await self._transport.send_and_receive(batch.encode("utf-8"))
-        response_text = response_bytes.decode("utf-8")
+        response_bytes = await self._transport.send_and_receive(batch)
 
-        if not response_text:
+        if not response_bytes:
             msg = "Empty response from pull"
             raise RpcError.internal(msg)
 
         # Parse responses
-        messages = parse_wire_batch(response_text)
+        messages = parse_wire_batch_bytes(response_bytes)
 
         for msg in messages:
             if isinstance(msg, WireResolve) and msg.export_id == -import_id:
@@ -528,3 +640,28 @@ class Client(RpcSession):
 
         msg = "No response for pull"
         raise RpcError.internal(msg)
+
+
+def _push_groups(ops: list[PendingPipelineOp]) -> list[list[PendingPipelineOp]]:
+    """Split pipelined operations into requests whose push targets are unambiguous.
+
+    The server resolves a push target against the pushes already made in
+    the same request before its exports, so push N + 1 can only target
+    capability IDs above N (or 0 and below).
+
+    Args:
+        ops: The operations, in the order they were made
+
+    Returns:
+        The operations grouped into requests, keeping their order
+    """
+    groups: list[list[PendingPipelineOp]] = []
+    current: list[PendingPipelineOp] = []
+    for op in ops:
+        if 0 < op.import_id <= len(current):
+            groups.append(current)
+            current = []
+        current.append(op)
+    if current:
+        groups.append(current)
+    return groups
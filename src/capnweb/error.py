@@ -20,6 +20,26 @@ class ErrorCode(Enum):
     def __str__(self) -> str:
         return self.value
 
+    @classmethod
+    def from_wire(cls, value: object) -> ErrorCode:
+        """Look up the code for a wire error type, defaulting to INTERNAL.
+
+        Unknown types are common when peers run different versions, so this
+        uses a plain dict lookup instead of catching ValueError.
+
+        Args:
+            value: The error type string received on the wire
+
+        Returns:
+            The matching ErrorCode, or ErrorCode.INTERNAL if unrecognized
+        """
+        if type(value) is not str:
+            return cls.INTERNAL
+        return _CODES_BY_VALUE.get(value, cls.INTERNAL)
+
+
+_CODES_BY_VALUE: dict[str, ErrorCode] = {code.value: code for code in ErrorCode}
+
 
 @dataclass
 class RpcError(Exception):
@@ -18,12 +18,17 @@ import inspect
 from abc import ABC, abstractmethod
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Self
+from weakref import WeakKeyDictionary
 
-from capnweb.error import RpcError
-from capnweb.payload import RpcPayload
+from capnweb.error import ErrorCode, RpcError
+from capnweb.payload import PayloadSource, RpcPayload
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from capnweb.session import RpcSession
     from capnweb.types import RpcTarget
 
@@ -38,12 +43,14 @@ class StubHook(ABC):
     implements these methods according to its specific semantics.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    async def call(self, path: list[str | int], args: RpcPayload) -> StubHook:
+    async def call(self, path: tuple[str | int, ...], args: RpcPayload) -> StubHook:
         """Call a method through this hook.
 
         Args:
-            path: Property path to navigate before calling (e.g., ["user", "profile", "getName"])
+            path: Property path to navigate before calling (e.g., ("user", "profile", "getName"))
             args: Arguments wrapped in RpcPayload
 
         Returns:
@@ -52,11 +59,11 @@ class StubHook(ABC):
         ...
 
     @abstractmethod
-    def get(self, path: list[str | int]) -> StubHook:
+    def get(self, path: tuple[str | int, ...]) -> StubHook:
         """Get a property through this hook.
 
         Args:
-            path: Property path to navigate (e.g., ["user", "id"])
+            path: Property path to navigate (e.g., ("user", "id"))
 
         Returns:
             A new StubHook representing the property value
@@ -64,14 +71,18 @@ class StubHook(ABC):
         ...
 
     @abstractmethod
-    async def pull(self) -> RpcPayload:
+    def pull(self) -> RpcPayload | Awaitable[RpcPayload]:
         """Pull the final value from this hook.
 
         This is what happens when you await a promise. It resolves the
         value (possibly waiting for network I/O) and returns the payload.
 
+        Hooks whose value is already available locally return the payload
+        directly instead of a coroutine; callers must only await the result
+        when it is not already an RpcPayload.
+
         Returns:
-            The resolved payload
+            The resolved payload, or an awaitable resolving to it
 
         Raises:
             RpcError: If the capability is in an error state
@@ -99,25 +110,74 @@ class StubHook(ABC):
         ...
 
 
-@dataclass
 class ErrorStubHook(StubHook):
     """A hook that holds an error.
 
     All operations on this hook either return itself or raise the error.
     This is useful for representing failed promises or broken capabilities.
+
+    Since dispose() is a no-op and dup() returns self, error hooks can be
+    shared freely; use ErrorStubHook.shared() for constant errors built by
+    the library to reuse one hook per distinct error instead of allocating a
+    new one on every failure.
     """
 
-    error: RpcError
+    __slots__ = ("error",)
+
+    def __init__(self, error: RpcError) -> None:
+        """Initialize with an error.
+
+        Args:
+            error: The error this hook holds
+        """
+        self.error = error
+
+    @classmethod
+    def of(cls, error: RpcError) -> ErrorStubHook:
+        """Get a hook holding an error raised or received by the caller.
+
+        The error is kept as-is, so its subclass, cause and notes reach
+        whoever pulls the hook. It is never interned.
+
+        Args:
+            error: The error to wrap
+
+        Returns:
+            An ErrorStubHook for the error
+        """
+        return cls(error)
 
-    async def call(self, path: list[str | int], args: RpcPayload) -> StubHook:
+    @classmethod
+    def shared(cls, code: ErrorCode, message: str) -> ErrorStubHook:
+        """Get the interned hook for a constant error built by the library.
+
+        One hook is kept per (code, message). Only the hook is shared: each
+        pull() raises a new RpcError, so tasks never share an exception.
+        Messages that embed per-failure text would only churn the cache, so
+        wrap those in a plain ErrorStubHook instead.
+
+        Args:
+            code: The error code
+            message: The error message
+
+        Returns:
+            An ErrorStubHook for the error
+        """
+        return _shared_error_hook(code, message)
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"ErrorStubHook(error={self.error!r})"
+
+    async def call(self, path: tuple[str | int, ...], args: RpcPayload) -> StubHook:
         """Always returns self (errors propagate through chains)."""
         return self
 
-    def get(self, path: list[str | int]) -> StubHook:
+    def get(self, path: tuple[str | int, ...]) -> StubHook:
         """Always returns self (errors propagate through chains)."""
         return self
 
-    async def pull(self) -> RpcPayload:
+    def pull(self) -> RpcPayload:
         """Raises the error."""
         raise self.error
 
@@ -129,6 +189,106 @@ class ErrorStubHook(StubHook):
         return self
 
 
+class _SharedErrorStubHook(ErrorStubHook):
+    """An interned error hook that raises a new error on every pull."""
+
+    __slots__ = ()
+
+    def pull(self) -> RpcPayload:
+        """Raises a new copy of the error."""
+        raise RpcError(self.error.code, self.error.message)
+
+
+@lru_cache(maxsize=256)
+def _shared_error_hook(code: ErrorCode, message: str) -> ErrorStubHook:
+    """Build the interned hook for ErrorStubHook.shared()."""
+    return _SharedErrorStubHook(RpcError(code, message))
+
+
+# Underlying function -> whether it is a coroutine function
+_async_cache: WeakKeyDictionary[Any, bool] = WeakKeyDictionary()
+
+
+def _is_async(fn: Any) -> bool:
+    """Check whether a callable is a coroutine function, caching the answer.
+
+    inspect.iscoroutinefunction() unwraps partials and decorators on every
+    call, while the answer never changes for a given function. Bound
+    methods are created afresh on each attribute access, so the cache is
+    keyed on the function behind them.
+
+    Args:
+        fn: The callable to classify
+
+    Returns:
+        True if calling fn returns a coroutine
+    """
+    key = getattr(fn, "__func__", fn)
+    try:
+        return _async_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable (or unhashable): classify without caching
+        return inspect.iscoroutinefunction(fn)
+
+    result = inspect.iscoroutinefunction(fn)
+    with suppress(TypeError):
+        _async_cache[key] = result
+    return result
+
+
+def _key_or_attr(segment: str) -> Callable[[Any], Any]:
+    """Build a navigation step for a string path segment."""
+
+    def step(current: Any) -> Any:
+        if isinstance(current, dict):
+            # Dictionary key
+            return current[segment]
+        # Object attribute
+        return getattr(current, segment)
+
+    return step
+
+
+def _identity(value: Any) -> Any:
+    """Resolver for the empty path."""
+    return value
+
+
+@lru_cache(maxsize=512)
+def _compile_path(path: tuple[str | int, ...]) -> Callable[[Any], Any]:
+    """Build (and cache) a resolver for a property path.
+
+    Clients tend to access the same paths repeatedly, so each segment's
+    type is inspected once per distinct path rather than on every access.
+    Segments are bound into closures rather than generated source, since
+    they come straight off the wire.
+
+    Args:
+        path: Property names (dict key or attribute) and array indices
+
+    Returns:
+        A function that navigates from a root value along the path
+    """
+    steps = tuple(
+        # Array index
+        itemgetter(segment) if isinstance(segment, int) else _key_or_attr(segment)
+        for segment in path
+    )
+    if not steps:
+        return _identity
+    if len(steps) == 1:
+        return steps[0]
+
+    def resolve(current: Any) -> Any:
+        for step in steps:
+            current = step(current)
+        return current
+
+    return resolve
+
+
 class PayloadStubHook(StubHook):
     """A hook that wraps locally-resolved data.
 
@@ -137,6 +297,8 @@ class PayloadStubHook(StubHook):
     object tree.
     """
 
+    __slots__ = ("payload",)
+
     def __init__(self, payload: RpcPayload) -> None:
         """Initialize with a payload.
 
@@ -144,10 +306,12 @@ class PayloadStubHook(StubHook):
             payload: The payload this hook wraps
         """
         self.payload = payload
-        # Ensure payload is owned before use
-        self.payload.ensure_deep_copied()
+        # Ensure payload is owned before use (most payloads reaching a hook
+        # already are, so skip the call for them)
+        if payload.source is not PayloadSource.OWNED:
+            payload.ensure_deep_copied()
 
-    async def call(self, path: list[str | int], args: RpcPayload) -> StubHook:
+    async def call(self, path: tuple[str | int, ...], args: RpcPayload) -> StubHook:
         """Navigate the path and call as a function.
 
         Args:
@@ -162,11 +326,12 @@ class PayloadStubHook(StubHook):
 
         # If target is callable, call it
         if callable(target):
-            args.ensure_deep_copied()
+            if args.source is not PayloadSource.OWNED:
+                args.ensure_deep_copied()
 
             # Check if target is async
 
-            if inspect.iscoroutinefunction(target):
+            if _is_async(target):
                 # Handle async callables
                 async def call_async():
                     try:
@@ -198,7 +363,7 @@ class PayloadStubHook(StubHook):
         error = RpcError.bad_request(f"Target at {path} is not callable")
         return ErrorStubHook(error)
 
-    def get(self, path: list[str | int]) -> StubHook:
+    def get(self, path: tuple[str | int, ...]) -> StubHook:
         """Navigate the path and return the property.
 
         Args:
@@ -214,11 +379,11 @@ class PayloadStubHook(StubHook):
             error = RpcError.not_found(f"Property {path} not found: {e}")
             return ErrorStubHook(error)
 
-    def _navigate(self, path: list[str | int]) -> Any:
+    def _navigate(self, path: tuple[str | int, ...]) -> Any:
         """Navigate through the payload's value using the path.
 
         Args:
-            path: List of property names/indices to navigate
+            path: Property names/indices to navigate
 
         Returns:
             The value at the end of the path
@@ -226,22 +391,13 @@ class PayloadStubHook(StubHook):
         Raises:
             KeyError, IndexError, AttributeError: If navigation fails
         """
-        current = self.payload.value
-
-        for segment in path:
-            if isinstance(segment, int):
-                # Array index
-                current = current[segment]
-            elif isinstance(current, dict):
-                # Dictionary key
-                current = current[segment]
-            else:
-                # Object attribute
-                current = getattr(current, segment)
+        # Paths are normally tuples already; lists are accepted for callers
+        # that build them dynamically
+        if type(path) is not tuple:
+            path = tuple(path)
+        return _compile_path(path)(self.payload.value)
 
-        return current
-
-    async def pull(self) -> RpcPayload:
+    def pull(self) -> RpcPayload:
         """Return the payload directly (already resolved)."""
         return self.payload
 
@@ -255,7 +411,21 @@ class PayloadStubHook(StubHook):
         return PayloadStubHook(self.payload)  # type: ignore[return-value]
 
 
-@dataclass
+def _property_error_hook(error: Exception) -> ErrorStubHook:
+    """Wrap an exception raised by get_property() in an error hook.
+
+    Args:
+        error: The exception raised while reading the property
+
+    Returns:
+        An ErrorStubHook carrying the RpcError (or an internal error)
+    """
+    if isinstance(error, RpcError):
+        return ErrorStubHook.of(error)
+    return ErrorStubHook(RpcError.internal(f"Property access failed: {error}"))
+
+
+@dataclass(slots=True)
 class TargetStubHook(StubHook):
     """A hook that wraps a local RpcTarget object.
 
@@ -266,11 +436,11 @@ class TargetStubHook(StubHook):
     target: RpcTarget
     ref_count: int = 1  # For disposal tracking
 
-    async def _navigate_to_target(self, property_path: list[str | int]) -> Any:
+    async def _navigate_to_target(self, property_path: tuple[str | int, ...]) -> Any:
         """Navigate through properties to reach the target object.
 
         Args:
-            property_path: List of properties to navigate
+            property_path: Properties to navigate
 
         Returns:
             The target object after navigation
@@ -278,27 +448,37 @@ class TargetStubHook(StubHook):
         Raises:
             RpcError: If navigation fails
         """
-        current_obj = self.target
-        for prop in property_path:
-            try:
-                prop_value = await current_obj.get_property(str(prop))
-                current_obj = prop_value
-            except Exception as e:
-                if isinstance(e, RpcError):
-                    raise
-                msg = f"Property navigation failed at path {property_path}: {e}"
-                raise RpcError.not_found(msg) from e
-        return current_obj
+        names = [prop if type(prop) is str else str(prop) for prop in property_path]
+        try:
+            # Targets that can resolve a whole path at once (e.g. with a
+            # single query) opt in by defining get_property_path()
+            get_property_path = getattr(self.target, "get_property_path", None)
+            if get_property_path is not None:
+                return await get_property_path(names)
+
+            # Each step navigates from the previous result, so the
+            # get_property() calls are inherently sequential
+            current_obj: Any = self.target
+            for name in names:
+                current_obj = current_obj.get_property(name)
+                if inspect.isawaitable(current_obj):
+                    current_obj = await current_obj
+            return current_obj
+        except RpcError:
+            raise
+        except Exception as e:
+            msg = f"Property navigation failed at path {property_path}: {e}"
+            raise RpcError.not_found(msg) from e
 
     async def _invoke_method(
-        self, target: Any, method_name: str, args: RpcPayload
+        self, target: Any, method_name: str, args: list[Any]
     ) -> Any:
         """Invoke a method on the target object.
 
         Args:
             target: The target object
             method_name: Name of the method to call
-            args: Arguments for the method
+            args: Positional arguments for the method
 
         Returns:
             The method result
@@ -307,11 +487,9 @@ class TargetStubHook(StubHook):
             RpcError: If the method call fails
         """
         # If target is an RpcTarget, use its call method
-        if hasattr(target, "call") and callable(target.call):
-            return await target.call(  # type: ignore[misc]
-                method_name,
-                args.value if isinstance(args.value, list) else [args.value],
-            )
+        target_call = getattr(target, "call", None)
+        if callable(target_call):
+            return await target_call(method_name, args)
 
         # Otherwise, try to call the method directly on the object
         method = getattr(target, method_name)
@@ -320,18 +498,11 @@ class TargetStubHook(StubHook):
             raise RpcError.bad_request(msg)
 
         # Handle async and sync methods
-        if inspect.iscoroutinefunction(method):
-            return (
-                await method(*args.value)
-                if isinstance(args.value, list)
-                else await method(args.value)
-            )
-
-        return (
-            method(*args.value) if isinstance(args.value, list) else method(args.value)
-        )
+        if _is_async(method):
+            return await method(*args)
+        return method(*args)
 
-    async def call(self, path: list[str | int], args: RpcPayload) -> StubHook:
+    async def call(self, path: tuple[str | int, ...], args: RpcPayload) -> StubHook:
         """Call a method on the target.
 
         Args:
@@ -341,35 +512,44 @@ class TargetStubHook(StubHook):
         Returns:
             A new hook with the result
         """
-        args.ensure_deep_copied()
+        if args.source is not PayloadSource.OWNED:
+            args.ensure_deep_copied()
 
         if not path:
-            error = RpcError.bad_request("Cannot call target without method name")
-            return ErrorStubHook(error)
+            return ErrorStubHook.shared(
+                ErrorCode.BAD_REQUEST, "Cannot call target without method name"
+            )
+
+        # Determine method name and target object. Segments decoded from the
+        # wire are already strings, so only coerce the rare non-str segment.
+        method_name = path[-1]
+        if type(method_name) is not str:
+            method_name = str(method_name)
 
-        # Determine method name and target object
         if len(path) == 1:
-            method_name = str(path[0])
             current_target = self.target
         else:
             property_path = path[:-1]
-            method_name = str(path[-1])
             try:
                 current_target = await self._navigate_to_target(property_path)
             except RpcError as e:
-                return ErrorStubHook(e)
+                return ErrorStubHook.of(e)
+
+        # A list payload is the argument list; anything else is one argument
+        value = args.value
+        invoke_args = value if isinstance(value, list) else [value]
 
         # Invoke the method
         try:
-            result = await self._invoke_method(current_target, method_name, args)
+            result = await self._invoke_method(current_target, method_name, invoke_args)
             return PayloadStubHook(RpcPayload.from_app_return(result))
         except RpcError as e:
-            return ErrorStubHook(e)
+            return ErrorStubHook.of(e)
         except Exception as e:
             error = RpcError.internal(f"Target call failed: {e}")
             return ErrorStubHook(error)
 
-    def get(self, path: list[str | int]) -> StubHook:
+    def get(self, path: tuple[str | int, ...]) -> StubHook:
         """Get a property from the target.
 
         Args:
@@ -381,16 +561,26 @@ class TargetStubHook(StubHook):
 
         # For now, delegate to target.get_property for simple case
         if len(path) == 1:
+            name = path[0]
+            if type(name) is not str:
+                name = str(name)
 
-            async def get_property_async():
+            try:
+                result = self.target.get_property(name)
+            except Exception as e:
+                return _property_error_hook(e)
+
+            # A synchronous get_property() already has the value, so there
+            # is no need for a task and a promise around it
+            if not inspect.isawaitable(result):
+                return PayloadStubHook(RpcPayload.from_app_return(result))
+
+            async def get_property_async() -> StubHook:
                 try:
-                    result = await self.target.get_property(str(path[0]))
-                    return PayloadStubHook(RpcPayload.from_app_return(result))
+                    value = await result
+                    return PayloadStubHook(RpcPayload.from_app_return(value))
                 except Exception as e:
-                    if isinstance(e, RpcError):
-                        return ErrorStubHook(e)
-                    error = RpcError.internal(f"Property access failed: {e}")
-                    return ErrorStubHook(error)
+                    return _property_error_hook(e)
 
             # Return a promise hook that will resolve to the property
             future: asyncio.Future[StubHook] = asyncio.ensure_future(
@@ -398,12 +588,11 @@ class TargetStubHook(StubHook):
             )
             return PromiseStubHook(future)
 
-        error = RpcError.not_found(
-            "Complex property paths not yet supported on targets"
+        return ErrorStubHook.shared(
+            ErrorCode.NOT_FOUND, "Complex property paths not yet supported on targets"
         )
-        return ErrorStubHook(error)
 
-    async def pull(self) -> RpcPayload:
+    def pull(self) -> RpcPayload:
         """Targets can't be pulled directly."""
 
         msg = "Cannot pull a target object"
@@ -411,6 +600,10 @@ class TargetStubHook(StubHook):
 
     def dispose(self) -> None:
         """Decrement reference count and notify target if disposable."""
+        # Extra dispose() calls must not drive the count negative or notify
+        # the target twice.
+        if self.ref_count <= 0:
+            return
         self.ref_count -= 1
 
         # Notify target when refcount reaches 0 if it implements disposal
@@ -429,7 +622,7 @@ class TargetStubHook(StubHook):
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class RpcImportHook(StubHook):
     """A hook representing a remote capability.
 
@@ -441,7 +634,7 @@ class RpcImportHook(StubHook):
     import_id: int
     ref_count: int = 1
 
-    async def call(self, path: list[str | int], args: RpcPayload) -> StubHook:
+    async def call(self, path: tuple[str | int, ...], args: RpcPayload) -> StubHook:
         """Call a method on the remote capability.
 
         Args:
@@ -451,22 +644,16 @@ class RpcImportHook(StubHook):
         Returns:
             A PromiseStubHook for the result
         """
-        # Create a new import ID for the result
-        result_import_id = self.session.allocate_import_id()
-
-        # Create a future for the result
-        future: asyncio.Future[StubHook] = asyncio.Future()
-
-        # Register the future with the session
-        self.session.register_pending_import(result_import_id, future)
+        # Allocate an import ID for the result with its registered future
+        result_import_id, future = self.session.create_pending_import()
 
-        # Send a pipeline call message
-        # This will be handled by the session
-        self.session.send_pipeline_call(self.import_id, path, args, result_import_id)
+        # Queue a pipeline call message; the session sends every operation
+        # queued during this event-loop turn together
+        self.session.queue_pipeline_op(self.import_id, path, args, result_import_id)
 
         return PromiseStubHook(future)
 
-    def get(self, path: list[str | int]) -> StubHook:
+    def get(self, path: tuple[str | int, ...]) -> StubHook:
         """Get a property from the remote capability.
 
         Args:
@@ -476,10 +663,8 @@ class RpcImportHook(StubHook):
             A PromiseStubHook for the property
         """
         # Similar to call, but no arguments
-        result_import_id = self.session.allocate_import_id()
-        future: asyncio.Future[StubHook] = asyncio.Future()
-        self.session.register_pending_import(result_import_id, future)
-        self.session.send_pipeline_get(self.import_id, path, result_import_id)
+        result_import_id, future = self.session.create_pending_import()
+        self.session.queue_pipeline_op(self.import_id, path, None, result_import_id)
         return PromiseStubHook(future)
 
     async def pull(self) -> RpcPayload:
@@ -493,9 +678,12 @@ class RpcImportHook(StubHook):
 
     def dispose(self) -> None:
         """Decrement refcount and send release if needed."""
+        # Guard against over-disposal so the release is queued exactly once.
+        if self.ref_count <= 0:
+            return
         self.ref_count -= 1
         if self.ref_count == 0:
-            self.session.release_import(self.import_id)
+            self.session.queue_release(self.import_id)
 
     def dup(self) -> Self:
         """Increment refcount."""
@@ -503,7 +691,69 @@ class RpcImportHook(StubHook):
         return self
 
 
-@dataclass
+async def _maybe_await(payload: RpcPayload | Awaitable[RpcPayload]) -> RpcPayload:
+    """Get the payload from the result of StubHook.pull().
+
+    Args:
+        payload: The payload, or an awaitable resolving to it
+
+    Returns:
+        The payload
+    """
+    if isinstance(payload, RpcPayload):
+        return payload
+    return await payload
+
+
+def _copy_future_state(source: asyncio.Future[Any], dest: asyncio.Future[Any]) -> None:
+    """Copy the outcome of a completed future into a pending one."""
+    if dest.done():
+        return
+    if source.cancelled():
+        dest.cancel()
+        return
+    exc = source.exception()
+    if exc is not None:
+        dest.set_exception(exc)
+    else:
+        dest.set_result(source.result())
+
+
+def _forward_get(
+    chained: asyncio.Future[StubHook],
+    path: tuple[str | int, ...],
+    source: asyncio.Future[StubHook],
+) -> None:
+    """Done-callback: get a property on the hook a promise resolved to."""
+    if chained.done():
+        return
+    if source.cancelled() or source.exception() is not None:
+        _copy_future_state(source, chained)
+        return
+    try:
+        chained.set_result(source.result().get(path))
+    except Exception as e:
+        chained.set_exception(e)
+
+
+def _forward_call(
+    chained: asyncio.Future[StubHook],
+    path: tuple[str | int, ...],
+    args: RpcPayload,
+    source: asyncio.Future[StubHook],
+) -> None:
+    """Done-callback: call a method on the hook a promise resolved to."""
+    if chained.done():
+        return
+    if source.cancelled() or source.exception() is not None:
+        _copy_future_state(source, chained)
+        return
+    # StubHook.call is a coroutine, so it still needs a task once resolved
+    task = asyncio.ensure_future(source.result().call(path, args))
+    task.add_done_callback(partial(_copy_future_state, dest=chained))
+
+
+@dataclass(slots=True)
 class PromiseStubHook(StubHook):
     """A hook wrapping a future that will resolve to another hook.
 
@@ -513,7 +763,7 @@ class PromiseStubHook(StubHook):
 
     future: asyncio.Future[StubHook]
 
-    async def call(self, path: list[str | int], args: RpcPayload) -> StubHook:
+    async def call(self, path: tuple[str | int, ...], args: RpcPayload) -> StubHook:
         """Wait for the promise to resolve, then call on the result.
 
         Args:
@@ -523,15 +773,19 @@ class PromiseStubHook(StubHook):
         Returns:
             A new PromiseStubHook for the chained result
         """
+        resolved = self._resolved_hook()
+        if resolved is not None:
+            return await resolved.call(path, args)
 
-        async def chained_call():
-            resolved_hook = await self.future
-            return await resolved_hook.call(path, args)
-
-        chained_future: asyncio.Future[StubHook] = asyncio.ensure_future(chained_call())
+        chained_future: asyncio.Future[StubHook] = (
+            self.future.get_loop().create_future()
+        )
+        self.future.add_done_callback(
+            partial(_forward_call, chained_future, path, args)
+        )
         return PromiseStubHook(chained_future)
 
-    def get(self, path: list[str | int]) -> StubHook:
+    def get(self, path: tuple[str | int, ...]) -> StubHook:
         """Wait for the promise to resolve, then get property on the result.
 
         Args:
@@ -540,22 +794,46 @@ class PromiseStubHook(StubHook):
         Returns:
             A new PromiseStubHook for the chained result
         """
+        resolved = self._resolved_hook()
+        if resolved is not None:
+            return resolved.get(path)
 
-        async def chained_get():
-            resolved_hook = await self.future
-            return resolved_hook.get(path)
-
-        chained_future: asyncio.Future[StubHook] = asyncio.ensure_future(chained_get())
+        chained_future: asyncio.Future[StubHook] = (
+            self.future.get_loop().create_future()
+        )
+        self.future.add_done_callback(partial(_forward_get, chained_future, path))
         return PromiseStubHook(chained_future)
 
-    async def pull(self) -> RpcPayload:
-        """Wait for the promise to resolve, then pull from the result.
+    def pull(self) -> RpcPayload | Awaitable[RpcPayload]:
+        """Pull from the resolved hook, waiting for resolution if needed.
+
+        When the future has already resolved, this delegates straight to the
+        resolved hook so no task suspension is needed.
 
         Returns:
-            The final payload
+            The final payload, or an awaitable producing it
         """
+        resolved = self._resolved_hook()
+        if resolved is not None:
+            return resolved.pull()
+        return self._pull_pending()
+
+    async def _pull_pending(self) -> RpcPayload:
+        """Wait for the promise to resolve, then pull from the result."""
         resolved_hook = await self.future
-        return await resolved_hook.pull()
+        return await _maybe_await(resolved_hook.pull())
+
+    def _resolved_hook(self) -> StubHook | None:
+        """Return the resolved hook if the future completed successfully.
+
+        Returns:
+            The resolved hook, or None if the future is pending, cancelled,
+            or failed (those cases take the normal awaiting path)
+        """
+        future = self.future
+        if not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
 
     def dispose(self) -> None:
         """Cancel the promise if not resolved, or dispose the result if resolved."""
@@ -8,12 +8,12 @@ Import/Export IDs use a bidirectional numbering scheme:
 
 from __future__ import annotations
 
-import threading
+import itertools
 from dataclasses import dataclass
 from typing import Final
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportId:
     """Import ID - represents an entry in the import table.
 
@@ -26,8 +26,8 @@ class ImportId:
 
     @staticmethod
     def main() -> ImportId:
-        """Create the main interface ID (0)."""
-        return ImportId(0)
+        """Return the main interface ID (0)."""
+        return _MAIN_IMPORT
 
     def is_main(self) -> bool:
         """Check if this is the main interface ID."""
@@ -49,7 +49,7 @@ class ImportId:
         return f"Import#{self.value}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExportId:
     """Export ID - represents an entry in the export table.
 
@@ -62,8 +62,8 @@ class ExportId:
 
     @staticmethod
     def main() -> ExportId:
-        """Create the main interface ID (0)."""
-        return ExportId(0)
+        """Return the main interface ID (0)."""
+        return _MAIN_EXPORT
 
     def is_main(self) -> bool:
         """Check if this is the main interface ID."""
@@ -85,6 +85,11 @@ class ExportId:
         return f"Export#{self.value}"
 
 
+# IDs are immutable, so the main interface IDs are shared singletons
+_MAIN_IMPORT: Final = ImportId(0)
+_MAIN_EXPORT: Final = ExportId(0)
+
+
 class IdAllocator:
     """Thread-safe allocator for import and export IDs.
 
@@ -94,23 +99,18 @@ class IdAllocator:
     """
 
     def __init__(self) -> None:
-        self._next_positive: int = 1
-        self._next_negative: int = -1
-        self._lock: Final = threading.Lock()
+        # count.__next__ runs in C without releasing the GIL, so each
+        # allocation is atomic without taking a lock
+        self._positive_ids: Final = itertools.count(1)
+        self._negative_ids: Final = itertools.count(-1, -1)
 
     def allocate_import(self) -> ImportId:
         """Allocate a new local import ID (positive)."""
-        with self._lock:
-            import_id = ImportId(self._next_positive)
-            self._next_positive += 1
-            return import_id
+        return ImportId(next(self._positive_ids))
 
     def allocate_export(self) -> ExportId:
         """Allocate a new local export ID (negative)."""
-        with self._lock:
-            export_id = ExportId(self._next_negative)
-            self._next_negative -= 1
-            return export_id
+        return ExportId(next(self._negative_ids))
 
     def register_remote_import(self, value: int) -> ImportId:
         """Register a remote import ID (negative from our perspective)."""
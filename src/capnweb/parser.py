@@ -16,10 +16,10 @@ from capnweb.hooks import (
 )
 from capnweb.payload import RpcPayload
 from capnweb.stubs import RpcPromise, RpcStub
-from capnweb.wire import WireError, WireExport
-from capnweb.wire import WirePromise as WirePromiseType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from capnweb.hooks import StubHook
 
 
@@ -73,6 +73,11 @@ class Parser:
             importer: The RpcSession that manages import IDs
         """
         self.importer = importer
+        # Per-instance table of bound handlers, so dispatching a tagged wire
+        # expression costs a single dict lookup
+        self._wire_dispatch: dict[str, Callable[[list[Any]], Any]] = {
+            tag: handler.__get__(self) for tag, handler in _WIRE_HANDLERS.items()
+        }
 
     def parse(self, wire_value: Any) -> RpcPayload:
         """Parse a wire expression into a Python value wrapped in RpcPayload.
@@ -89,8 +94,24 @@ class Parser:
         parsed = self._parse_value(wire_value)
         return RpcPayload.owned(parsed)
 
+    def parse_many(self, wire_values: Iterable[Any]) -> list[RpcPayload]:
+        """Parse several wire expressions, e.g. the values of a batch.
+
+        Args:
+            wire_values: The wire expressions to parse
+
+        Returns:
+            One RpcPayload.owned() per input value, in order
+        """
+        parse_value = self._parse_value
+        owned = RpcPayload.owned
+        return [owned(parse_value(wire_value)) for wire_value in wire_values]
+
     def _parse_value(self, value: Any) -> Any:
-        """Parse a single wire value recursively.
+        """Parse a wire value without recursing into nested containers.
+
+        Containers are walked with an explicit worklist, so deeply nested
+        payloads use a single Python frame and cannot hit the recursion limit.
 
         Args:
             value: The wire value to parse
@@ -99,50 +120,66 @@ class Parser:
             The parsed Python value
         """
         # Handle None and primitives
-        if value is None or isinstance(value, (bool, int, float, str)):
+        if type(value) in _SCALAR_TYPES:
             return value
 
-        # Handle lists - could be wire expressions or arrays
-        if isinstance(value, list):
-            if len(value) >= 2 and isinstance(value[0], str):
-                # This might be a wire expression like ["export", id]
-                wire_type = value[0]
+        # Each work item is (container to write into, slot, wire value)
+        root: list[Any] = [None]
+        stack: list[tuple[Any, Any, Any]] = [(root, 0, value)]
+        push = stack.append
+        pop = stack.pop
+        wire_dispatch = self._wire_dispatch
+
+        while stack:
+            container, slot, node = pop()
+
+            # Decoded JSON only contains exact built-in types, so identity
+            # checks on the type cover the common case without isinstance
+            node_type = type(node)
+            if node_type is not list and node_type is not dict:
+                if isinstance(node, list):
+                    node_type = list
+                elif isinstance(node, dict):
+                    node_type = dict
+                else:
+                    # Primitives and other types are kept as-is
+                    container[slot] = node
+                    continue
+
+            if node_type is list:
+                if len(node) >= 2 and type(node[0]) is str:
+                    # This might be a wire expression like ["export", id]
+                    wire_handler = wire_dispatch.get(node[0])
+                    if wire_handler is not None:
+                        container[slot] = wire_handler(node)
+                        continue
+
+                # Regular array - parse each non-scalar element
+                container[slot] = _expand(node, enumerate(node), list, push)
+
+            else:
+                container[slot] = _expand(node, node.items(), dict, push)
+
+        return root[0]
+
+    def _parse_pipeline(self, wire_expr: list[Any]) -> Any:
+        """Parse a pipeline expression.
+
+        ["pipeline", import_id, [...path], args] is handled by the session,
+        not here, so it is treated as an error.
 
-                if wire_type == "export":
-                    # ["export", export_id]
-                    return self._parse_export(value)
-
-                if wire_type == "import":
-                    # ["import", import_id]
-                    return self._parse_import(value)
-
-                if wire_type == "promise":
-                    # ["promise", promise_id]
-                    return self._parse_promise(value)
-
-                if wire_type == "error":
-                    # ["error", type, message, ...]
-                    return self._parse_error(value)
-
-                if wire_type == "pipeline":
-                    # ["pipeline", import_id, [...path], args]
-                    # This is handled by the session, not here
-                    # For now, treat as error
-
-                    error = RpcError.bad_request(
-                        "Pipeline expressions should not appear in parse input"
-                    )
-                    return RpcStub(ErrorStubHook(error))
-
-            # Regular array - parse each element
-            return [self._parse_value(item) for item in value]
-
-        # Handle dicts - parse each value
-        if isinstance(value, dict):
-            return {key: self._parse_value(val) for key, val in value.items()}
+        Args:
+            wire_expr: ["pipeline", import_id, path?, args?]
 
-        # For other types, return as-is
-        return value
+        Returns:
+            An error stub (pipelines shouldn't appear in received data)
+        """
+        return RpcStub(
+            ErrorStubHook.shared(
+                ErrorCode.BAD_REQUEST,
+                "Pipeline expressions should not appear in parse input",
+            )
+        )
 
     def _parse_export(self, wire_expr: list[Any]) -> Any:
         """Parse an export expression.
@@ -156,9 +193,11 @@ class Parser:
         Returns:
             An RpcStub wrapping an RpcImportHook
         """
-
-        wire_export = WireExport.from_json(wire_expr)
-        export_id = wire_export.export_id
+        # Read the ID straight off the list rather than building a WireExport
+        if len(wire_expr) != 2:
+            msg = "Export expression requires exactly 2 elements"
+            raise ValueError(msg)
+        export_id = wire_expr[1]
 
         # The export ID becomes our import ID
         # (we're importing what they're exporting)
@@ -179,10 +218,12 @@ class Parser:
             An error stub (imports shouldn't appear in received data)
         """
 
-        error = RpcError.bad_request(
-            "Import expressions should not appear in parse input"
+        return RpcStub(
+            ErrorStubHook.shared(
+                ErrorCode.BAD_REQUEST,
+                "Import expressions should not appear in parse input",
+            )
         )
-        return RpcStub(ErrorStubHook(error))
 
     def _parse_promise(self, wire_expr: list[Any]) -> Any:
         """Parse a promise expression.
@@ -196,9 +237,10 @@ class Parser:
         Returns:
             An RpcPromise wrapping a PromiseStubHook
         """
-
-        wire_promise = WirePromiseType.from_json(wire_expr)
-        promise_id = wire_promise.promise_id
+        if len(wire_expr) != 2:
+            msg = "Promise expression requires exactly 2 elements"
+            raise ValueError(msg)
+        promise_id = wire_expr[1]
 
         # Create a promise hook that will resolve when the promise settles
         promise_hook = self.importer.create_promise_hook(promise_id)
@@ -216,25 +258,30 @@ class Parser:
         Returns:
             An RpcStub wrapping an ErrorStubHook
         """
+        # Same layout as WireError.from_json, without the intermediate object
+        if len(wire_expr) < 3:
+            msg = "Error expression requires at least 3 elements"
+            raise ValueError(msg)
+        error_type = wire_expr[1]
+        message = wire_expr[2]
+        data = (
+            wire_expr[4]
+            if len(wire_expr) > 4 and isinstance(wire_expr[4], dict)
+            else None
+        )
 
-        wire_error = WireError.from_json(wire_expr)
-
-        # Convert string error type to ErrorCode enum
-        try:
-            error_code = ErrorCode(wire_error.error_type)
-        except ValueError:
-            # If unknown error type, default to internal
-            error_code = ErrorCode.INTERNAL
+        # Convert string error type to ErrorCode enum (unknown -> internal)
+        error_code = ErrorCode.from_wire(error_type)
 
         # Create RpcError from wire error
         error = RpcError(
             code=error_code,
-            message=wire_error.message,
-            data=wire_error.data,
+            message=message,
+            data=data,
         )
 
         # Wrap in ErrorStubHook and return as stub
-        return RpcStub(ErrorStubHook(error))
+        return RpcStub(ErrorStubHook.of(error))
 
     def parse_payload_value(self, wire_value: Any) -> RpcPayload:
         """Parse a wire value and return as owned payload.
@@ -249,3 +296,46 @@ class Parser:
             An RpcPayload.owned() containing the parsed value
         """
         return self.parse(wire_value)
+
+
+_SCALAR_TYPES: frozenset[type] = frozenset({type(None), bool, int, float, str})
+
+
+def _expand(
+    node: Any,
+    items: Iterable[tuple[Any, Any]],
+    container_type: Callable[[Any], Any],
+    push: Callable[[tuple[Any, Any, Any]], None],
+) -> Any:
+    """Queue the non-scalar children of a container for parsing.
+
+    Containers holding only primitives need no conversion; the wire value is
+    freshly decoded, so it is handed over without a copy. Otherwise a copy is
+    made and each non-scalar child is queued to be parsed into its slot.
+
+    Args:
+        node: The wire list or dict
+        items: (slot, value) pairs of the container
+        container_type: list or dict, used to copy the container
+        push: Appends a (container, slot, value) work item
+
+    Returns:
+        The container to store in the parent slot
+    """
+    result = None
+    for slot, item in items:
+        if type(item) not in _SCALAR_TYPES:
+            if result is None:
+                result = container_type(node)
+            push((result, slot, item))
+    return node if result is None else result
+
+
+# Wire expression tag -> handler
+_WIRE_HANDLERS: dict[str, Callable[[Parser, list[Any]], Any]] = {
+    "export": Parser._parse_export,
+    "import": Parser._parse_import,
+    "promise": Parser._parse_promise,
+    "error": Parser._parse_error,
+    "pipeline": Parser._parse_pipeline,
+}
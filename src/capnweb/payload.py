@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
 from enum import Enum, auto
+from functools import cache
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from capnweb.hooks import StubHook
     from capnweb.stubs import RpcPromise, RpcStub
 
@@ -16,15 +20,17 @@ class PayloadSource(Enum):
     This tells us where the data came from and how we can safely use it:
     - PARAMS: From application as call parameters. Must be deep-copied before use.
     - RETURN: From application as return value. We take ownership.
+    - IMMUTABLE: From application, but deeply immutable. Can be shared as-is.
     - OWNED: Deserialized or already copied. We own it and can modify safely.
     """
 
     PARAMS = auto()  # From app as call parameters. Must be copied.
     RETURN = auto()  # From app as a return value. We take ownership.
+    IMMUTABLE = auto()  # From app, but read-only. Shared without copying.
     OWNED = auto()  # Deserialized or copied. We own it.
 
 
-@dataclass
+@dataclass(slots=True)
 class RpcPayload:
     """Wraps data with explicit ownership semantics for RPC transmission.
 
@@ -57,13 +63,13 @@ class RpcPayload:
     value: Any
     source: PayloadSource
     # These are only populated when source is OWNED (after deep copy)
-    # They track all RPC references within this payload for lifecycle management
-    stubs: list[RpcStub] = field(
-        default_factory=list
-    )  # All RpcStub instances found in value
-    promises: list[tuple[Any, str | int, RpcPromise]] = field(
-        default_factory=list
-    )  # (parent, property, promise)
+    # They track all RPC references within this payload for lifecycle management.
+    # Both stay a shared empty tuple until the first reference is found, so
+    # pure-data payloads allocate no lists
+    stubs: list[RpcStub] | tuple[()] = ()  # All RpcStub instances found in value
+    promises: (
+        list[tuple[Any, str | int, RpcPromise]] | tuple[()]
+    ) = ()  # (parent, property, promise)
 
     @classmethod
     def from_app_params(cls, value: Any) -> RpcPayload:
@@ -80,6 +86,21 @@ class RpcPayload:
         """
         return cls(value, PayloadSource.PARAMS)
 
+    @classmethod
+    def from_app_params_immutable(cls, value: Any) -> RpcPayload:
+        """Create a payload from parameters the application will not mutate.
+
+        This marks the data as IMMUTABLE: the caller promises the value is
+        never modified, so it is shared instead of deep-copied.
+
+        Args:
+            value: The read-only parameter value from the application
+
+        Returns:
+            A new RpcPayload with source=IMMUTABLE
+        """
+        return cls(value, PayloadSource.IMMUTABLE)
+
     @classmethod
     def from_app_return(cls, value: Any) -> RpcPayload:
         """Create a payload from a return value provided by the application.
@@ -101,20 +122,31 @@ class RpcPayload:
 
         This is used for deserialized data or data that has been deep-copied.
 
+        Common constants (None, booleans, small ints, a few short strings)
+        get a shared, interned payload: an owned payload of an immutable
+        value is never mutated and holds no stubs, so it is safe to share.
+
         Args:
             value: The owned value
 
         Returns:
-            A new RpcPayload with source=OWNED
+            An RpcPayload with source=OWNED
         """
+        value_type = type(value)
+        if cls is RpcPayload and value_type in _CONSTANT_TYPES:
+            interned = _CONSTANT_PAYLOADS.get((value_type, value))
+            if interned is not None:
+                return interned
         return cls(value, PayloadSource.OWNED)
 
     def ensure_deep_copied(self) -> None:
         """Ensure this payload owns its data through deep copying if needed.
 
         This is the most critical method for correctness. It:
-        1. Deep-copies the value if source is PARAMS (to prevent mutation bugs)
-        2. Takes ownership if source is RETURN (no copy needed)
+        1. Deep-copies the value if source is PARAMS (to prevent mutation bugs),
+           unless the value is deeply immutable (tuples/frozensets of
+           primitives, frozen dataclasses), which is shared as-is
+        2. Takes ownership if source is RETURN or IMMUTABLE (no copy needed)
         3. Finds and tracks all RpcStub/RpcPromise instances
         4. Transitions source to OWNED
 
@@ -126,95 +158,188 @@ class RpcPayload:
                 # Already owned, nothing to do
                 return
             case PayloadSource.PARAMS:
-                # Must deep-copy to prevent mutating application data
-                self.value = self._deep_copy_and_track(self.value)
-            case PayloadSource.RETURN:
+                # Must deep-copy to prevent mutating application data; values
+                # that cannot be mutated hold no stubs and need no copy
+                if not _is_deeply_immutable(self.value):
+                    self.value = self._deep_copy_and_track(self.value)
+            case PayloadSource.RETURN | PayloadSource.IMMUTABLE:
                 # Application gave us ownership, but we still need to track stubs/promises
                 self._track_references(self.value)
 
         # Now we own this data
         self.source = PayloadSource.OWNED
 
-    def _deep_copy_and_track(self, obj: Any) -> Any:
+    def _deep_copy_and_track(self, obj: Any, memo: dict[int, Any] | None = None) -> Any:
         """Deep copy an object while tracking all RPC references.
 
+        The object graph is walked with an explicit worklist instead of
+        recursion, so deep payloads need no Python frame per level and
+        cannot hit the recursion limit.
+
         Args:
             obj: The object to copy
+            memo: Objects already copied during this pass, keyed by id(), so
+                shared and self-referencing instances are copied only once
 
         Returns:
             A deep copy with all RPC references tracked
         """
-        # Import here to avoid circular dependency
-        from capnweb.stubs import RpcPromise, RpcStub  # noqa: PLC0415
+        # Primitive leaves dominate real payloads; return them (and empty
+        # immutable collections, which have nothing to copy) before any
+        # other dispatch
+        obj_type = type(obj)
+        if obj_type in _ATOMIC_TYPES or (obj_type in _EMPTY_IMMUTABLE and not obj):
+            return obj
+
+        if memo is None:
+            memo = {}
+
+        # Each work item is (copy to write into, slot, original value).
+        # Containers are copied shallowly and their non-primitive children
+        # queued, so every slot is overwritten with its copy in turn.
+        root: list[Any] = [None]
+        stack: list[tuple[Any, Any, Any]] = [(root, 0, obj)]
+        pop = stack.pop
+        copy_node = self._copy_node
+        while stack:
+            container, slot, node = pop()
+            container[slot] = copy_node(node, stack, memo)
+        return root[0]
+
+    def _copy_node(
+        self, obj: Any, stack: list[tuple[Any, Any, Any]], memo: dict[int, Any]
+    ) -> Any:
+        """Copy a single value, queueing its children on the worklist.
 
-        # Handle RpcStub and RpcPromise specially - don't copy them,
-        # but track them and duplicate their hooks
-        match obj:
-            case RpcStub():
-                # Create a duplicate (shares the hook, increments refcount)
+        Args:
+            obj: The value to copy
+            stack: The worklist that children of containers are added to
+            memo: Objects already copied during this pass, keyed by id()
 
-                dup: StubHook = obj._hook.dup()  # type: ignore[assignment]
-                new_stub = RpcStub(dup)
-                self.stubs.append(new_stub)
-                return new_stub
+        Returns:
+            The copy to store in the parent slot
+        """
+        obj_type = type(obj)
+        if obj_type in _ATOMIC_TYPES:
+            return obj
 
-            case RpcPromise():
-                # Create a duplicate (shares the hook, increments refcount)
+        # Exact types (the common case) dispatch with a single dict lookup
+        copier = _copy_dispatch().get(obj_type)
+        if copier is not None:
+            return copier(self, obj, stack, memo)
 
-                dup: StubHook = obj._hook.dup()  # type: ignore[assignment]
-                new_promise = RpcPromise(dup)
-                # Note: parent and property tracking would happen at the container level
-                return new_promise
+        # Application types with a registered cloner
+        cloner = _cloners.get(obj_type)
+        if cloner is not None:
+            return cloner(obj, self)
 
-            case None | bool() | int() | float() | str() | bytes():
-                # Handle primitive types - return as-is (immutable)
-                return obj
+        # Subclasses and everything else
+        RpcStub, RpcPromise = _stub_types()  # noqa: N806
 
+        match obj:
             case list():
-                # Handle lists
-                return [self._deep_copy_and_track(item) for item in obj]
+                return _copy_list(self, obj, stack, memo)
 
             case dict():
-                # Handle dicts
-                return {
-                    key: self._deep_copy_and_track(value) for key, value in obj.items()
-                }
+                return _copy_dict(self, obj, stack, memo)
+
+            case None | bool() | int() | float() | str() | bytes():
+                # Subclasses of primitive types - return as-is (immutable)
+                return obj
+
+            # Handle RpcStub and RpcPromise specially - don't copy them,
+            # but track them and duplicate their hooks
+            case RpcStub():
+                return _copy_stub(self, obj, stack, memo)
+
+            case RpcPromise():
+                return _copy_promise(self, obj, stack, memo)
+
+            case _ if _is_plain_instance(type(obj)):
+                # Plain class instances (e.g. dataclasses): copying the
+                # instance dict is much cheaper than copy.deepcopy() and also
+                # tracks stubs held in attributes
+                return self._copy_instance(obj, stack, memo)
 
             case _:
-                # For other types, try to copy using copy module
+                # For other types (custom __deepcopy__/__reduce__, slots,
+                # extension types), fall back to the copy module
+                return _deepcopy_or_share(obj)
+
+    def _copy_instance(
+        self, obj: Any, stack: list[tuple[Any, Any, Any]], memo: dict[int, Any]
+    ) -> Any:
+        """Copy a plain class instance by deep-copying its ``__dict__``.
 
-                try:
-                    return copy.deepcopy(obj)
-                except Exception:
-                    # If deepcopy fails, return as-is and hope it's immutable
-                    return obj
+        Args:
+            obj: The instance to copy
+            stack: The worklist that attribute values are added to
+            memo: Objects already copied during this pass, keyed by id()
 
-    def _track_references(
-        self, obj: Any, parent: Any = None, key: str | int | None = None
-    ) -> None:
+        Returns:
+            A new instance of the same class with copied attributes
+        """
+        copied = memo.get(id(obj))
+        if copied is not None:
+            return copied
+
+        cls = type(obj)
+        if _is_frozen_dataclass(cls) and _is_deeply_immutable(obj):
+            # Read-only values can be shared instead of copied
+            return obj
+
+        copied = cls.__new__(cls)
+        memo[id(obj)] = copied
+        attributes = copied.__dict__
+        attributes.update(obj.__dict__)
+        _queue_children(attributes, obj.__dict__.items(), stack)
+        return copied
+
+    def _track_references(self, obj: Any) -> None:
         """Track all RPC references in an object without copying.
 
+        Like the copy path, this walks the object graph with an explicit
+        worklist rather than one Python call per node.
+
         Args:
             obj: The object to scan
-            parent: The parent container (for promise tracking)
-            key: The key/index in parent (for promise tracking)
         """
-        from capnweb.stubs import RpcPromise, RpcStub  # noqa: PLC0415
-
-        match obj:
-            case RpcStub():
-                self.stubs.append(obj)
-            case RpcPromise():
-                if parent is not None and key is not None:
-                    self.promises.append((parent, key, obj))
-            case list():
-                # Recursively track in lists
-                for i, item in enumerate(obj):
-                    self._track_references(item, obj, i)
-            case dict():
-                # Recursively track in dicts
-                for k, v in obj.items():
-                    self._track_references(v, obj, k)
+        if type(obj) in _ATOMIC_TYPES:
+            return
+
+        RpcStub, RpcPromise = _stub_types()  # noqa: N806
+
+        # Work items are (parent, key, node); the parent and key locate
+        # promises for later substitution
+        stack: list[tuple[Any, Any, Any]] = [(None, None, obj)]
+        # ids of containers already scanned, so a shared or self-referencing
+        # container is walked once instead of forever
+        seen: set[int] = set()
+        while stack:
+            parent, key, node = stack.pop()
+            match node:
+                case RpcStub():
+                    self._add_stub(node)
+                    continue
+                case RpcPromise():
+                    if parent is not None:
+                        self._add_promise(parent, key, node)
+                    continue
+                case list():
+                    values, items = node, enumerate(node)
+                case dict():
+                    values, items = node.values(), node.items()
+                case _:
+                    continue
+
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+
+            # Containers of only primitives (the common pure-data return)
+            # hold no references; the type scan runs in C
+            if not _ATOMIC_TYPES.issuperset(map(type, values)):
+                _queue_children(node, items, stack)
 
     def dispose(self) -> None:
         """Recursively dispose all RPC stubs and promises in this payload.
@@ -234,10 +359,329 @@ class RpcPayload:
         for _parent, _key, promise in self.promises:
             promise.dispose()
 
-        # Clear tracking lists
-        self.stubs.clear()
-        self.promises.clear()
+        # Drop the tracking lists
+        self.stubs = ()
+        self.promises = ()
+
+    def _add_stub(self, stub: RpcStub) -> None:
+        """Track a stub, creating the stub list on first use."""
+        if self.stubs:
+            self.stubs.append(stub)
+        else:
+            self.stubs = [stub]
+
+    def _add_promise(self, parent: Any, key: str | int, promise: RpcPromise) -> None:
+        """Track a promise and its location, creating the list on first use."""
+        if self.promises:
+            self.promises.append((parent, key, promise))
+        else:
+            self.promises = [(parent, key, promise)]
 
     def __repr__(self) -> str:
         """Return a readable representation for debugging."""
         return f"RpcPayload(source={self.source.name}, value={self.value!r})"
+
+
+@cache
+def _stub_types() -> tuple[type[RpcStub], type[RpcPromise]]:
+    """Return the RpcStub and RpcPromise classes, importing them only once.
+
+    capnweb.stubs imports this module, so the import has to be deferred;
+    caching it keeps the import machinery off the recursive copy path.
+
+    Returns:
+        A tuple of (RpcStub, RpcPromise)
+    """
+    from capnweb.stubs import RpcPromise, RpcStub  # noqa: PLC0415
+
+    return RpcStub, RpcPromise
+
+
+_ATOMIC_TYPES: frozenset[type] = frozenset({
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+})
+
+_EMPTY_IMMUTABLE: frozenset[type] = frozenset({tuple, frozenset})
+
+
+def _queue_children(
+    result: Any, items: Iterable[tuple[Any, Any]], stack: list[tuple[Any, Any, Any]]
+) -> Any:
+    """Queue the non-primitive children of a shallow container copy.
+
+    Children are pushed in reverse so they are popped, and their stubs
+    tracked, in their original order.
+
+    Args:
+        result: The shallow copy whose slots will receive the child copies
+        items: (slot, value) pairs of the original container
+        stack: The worklist to add (result, slot, value) items to
+
+    Returns:
+        The shallow copy, for storing in the parent slot
+    """
+    atomic_types = _ATOMIC_TYPES
+    pending = [
+        (result, slot, item) for slot, item in items if type(item) not in atomic_types
+    ]
+    if pending:
+        pending.reverse()
+        stack.extend(pending)
+    return result
+
+
+def _copy_list(
+    payload: RpcPayload,
+    obj: list[Any],
+    stack: list[tuple[Any, Any, Any]],
+    memo: dict[int, Any],
+) -> list[Any]:
+    """Copy a list shallowly and queue its children."""
+    # Bulk data (e.g. numeric arrays) is all primitives: the type scan and
+    # the copy then both run in C, with no per-item Python bytecode
+    if _ATOMIC_TYPES.issuperset(map(type, obj)):
+        return list(obj)
+    # Only lists with container children can be shared or part of a cycle;
+    # recording the copy before queueing the children ends a cycle at the
+    # copy instead of walking it forever
+    copied = memo.get(id(obj))
+    if copied is None:
+        copied = memo[id(obj)] = list(obj)
+        _queue_children(copied, enumerate(obj), stack)
+    return copied
+
+
+def _copy_dict(
+    payload: RpcPayload,
+    obj: dict[Any, Any],
+    stack: list[tuple[Any, Any, Any]],
+    memo: dict[int, Any],
+) -> dict[Any, Any]:
+    """Copy a dict shallowly and queue its values."""
+    if _ATOMIC_TYPES.issuperset(map(type, obj.values())):
+        return dict(obj)
+    # Memoized like lists, so cyclic and shared dicts are copied once
+    copied = memo.get(id(obj))
+    if copied is None:
+        copied = memo[id(obj)] = dict(obj)
+        _queue_children(copied, obj.items(), stack)
+    return copied
+
+
+def _copy_stub(
+    payload: RpcPayload,
+    obj: RpcStub,
+    stack: list[tuple[Any, Any, Any]],
+    memo: dict[int, Any],
+) -> RpcStub:
+    """Duplicate a stub (sharing its hook) and track the duplicate."""
+    rpc_stub = _stub_types()[0]
+    # Create a duplicate (shares the hook, increments refcount)
+    dup: StubHook = obj._hook.dup()  # type: ignore[assignment]
+    new_stub = rpc_stub(dup)
+    payload._add_stub(new_stub)
+    return new_stub
+
+
+def _copy_promise(
+    payload: RpcPayload,
+    obj: RpcPromise,
+    stack: list[tuple[Any, Any, Any]],
+    memo: dict[int, Any],
+) -> RpcPromise:
+    """Duplicate a promise, sharing its hook."""
+    rpc_promise = _stub_types()[1]
+    # Create a duplicate (shares the hook, increments refcount)
+    dup: StubHook = obj._hook.dup()  # type: ignore[assignment]
+    # Note: parent and property tracking would happen at the container level
+    return rpc_promise(dup)
+
+
+def _copy_collection(
+    payload: RpcPayload,
+    obj: tuple[Any, ...] | set[Any] | frozenset[Any],
+    stack: list[tuple[Any, Any, Any]],
+    memo: dict[int, Any],
+) -> Any:
+    """Rebuild an exact tuple, set or frozenset from copied items.
+
+    These cannot be filled in place, so their items are copied eagerly.
+    Subclasses such as namedtuples are left to copy.deepcopy().
+    """
+    if type(obj) is not set and _is_deeply_immutable(obj):
+        return obj
+    return type(obj)(payload._deep_copy_and_track(item, memo) for item in obj)
+
+
+def _deepcopy_or_share(obj: Any) -> Any:
+    """Copy a value with copy.deepcopy(), sharing it if that fails."""
+    try:
+        return copy.deepcopy(obj)
+    except Exception:
+        # If deepcopy fails, return as-is and hope it's immutable
+        return obj
+
+
+# Exact type -> cloner registered with register_payload_cloner()
+_cloners: dict[type, Callable[[Any, RpcPayload], Any]] = {}
+
+
+def register_payload_cloner(
+    cls: type,
+) -> Callable[[Callable[[Any, RpcPayload], Any]], Callable[[Any, RpcPayload], Any]]:
+    """Register a function that clones instances of a type in PARAMS payloads.
+
+    By default, instances of classes with ``__slots__``, custom
+    ``__deepcopy__``/``__reduce__`` or C-level state fall back to
+    ``copy.deepcopy()``, which pays for its dispatch and memo machinery on
+    every object. A registered cloner replaces that for exact instances of
+    ``cls`` (not subclasses).
+
+    The cloner receives the value and the payload being copied into. Values
+    inside the clone that may hold stubs should be copied with
+    ``payload._deep_copy_and_track()`` so the payload tracks them.
+
+    Example:
+        ```python
+        @register_payload_cloner(Vector)
+        def clone_vector(vector: Vector, payload: RpcPayload) -> Vector:
+            return Vector(vector.x, vector.y)
+        ```
+
+    Args:
+        cls: The exact type the cloner handles
+
+    Returns:
+        A decorator that registers the cloner and returns it unchanged
+    """
+
+    def decorator(
+        cloner: Callable[[Any, RpcPayload], Any],
+    ) -> Callable[[Any, RpcPayload], Any]:
+        _cloners[cls] = cloner
+        return cloner
+
+    return decorator
+
+
+@cache
+def _copy_dispatch() -> dict[type, Callable[..., Any]]:
+    """Return the exact-type -> copier table used by the deep copy.
+
+    Built on first use because it needs the stub classes.
+
+    Returns:
+        A dict mapping a type to the function that copies its instances
+    """
+    rpc_stub, rpc_promise = _stub_types()
+    return {
+        list: _copy_list,
+        dict: _copy_dict,
+        rpc_stub: _copy_stub,
+        rpc_promise: _copy_promise,
+        tuple: _copy_collection,
+        set: _copy_collection,
+        frozenset: _copy_collection,
+    }
+
+
+# Class -> whether its instances can be cloned by copying __dict__
+_plain_instance_cache: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
+
+# Class -> whether it is a frozen dataclass
+_frozen_dataclass_cache: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
+
+
+def _is_frozen_dataclass(cls: type) -> bool:
+    """Check whether a class is a frozen dataclass, caching the answer.
+
+    Args:
+        cls: The class to classify
+
+    Returns:
+        True if cls was declared with ``@dataclass(frozen=True)``
+    """
+    try:
+        return _frozen_dataclass_cache[cls]
+    except KeyError:
+        pass
+    params = getattr(cls, "__dataclass_params__", None)
+    result = params is not None and params.frozen
+    _frozen_dataclass_cache[cls] = result
+    return result
+
+
+def _is_deeply_immutable(obj: Any) -> bool:
+    """Check whether a value and everything it contains is immutable.
+
+    Recognizes primitives plus exact tuples and frozensets and frozen
+    dataclasses whose contents are themselves deeply immutable. Such values
+    can be shared instead of copied, and cannot contain stubs.
+
+    Args:
+        obj: The value to check
+
+    Returns:
+        True if no part of the value can be mutated
+    """
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type in _ATOMIC_TYPES:
+            continue
+        if node_type is tuple or node_type is frozenset:
+            stack.extend(node)
+        elif _is_frozen_dataclass(node_type):
+            stack.extend(getattr(node, f.name) for f in fields(node))
+        else:
+            return False
+    return True
+
+
+def _is_plain_instance(cls: type) -> bool:
+    """Check whether instances of a class are plain attribute holders.
+
+    Such instances are fully described by their ``__dict__``, so copying it
+    reproduces what copy.deepcopy() would do. Classes that customize
+    creation or the copy/pickle protocol, or that use ``__slots__``, are
+    left to copy.deepcopy().
+
+    Args:
+        cls: The class to classify
+
+    Returns:
+        True if instances can be cloned by copying their ``__dict__``
+    """
+    try:
+        return _plain_instance_cache[cls]
+    except KeyError:
+        pass
+
+    result = (
+        cls.__new__ is object.__new__
+        and cls.__reduce_ex__ is object.__reduce_ex__
+        and cls.__reduce__ is object.__reduce__
+        and cls.__getstate__ is object.__getstate__
+        and not hasattr(cls, "__setstate__")
+        and not hasattr(cls, "__deepcopy__")
+        and not any("__slots__" in vars(base) for base in cls.__mro__)
+        and "__dict__" in dir(cls)
+    )
+    _plain_instance_cache[cls] = result
+    return result
+
+
+_CONSTANT_TYPES: frozenset[type] = frozenset({type(None), bool, int, str})
+
+# (type, value) -> shared owned payload. Keyed on type as well so that
+# True/1/1.0, which compare equal, each keep their own payload.
+_CONSTANT_PAYLOADS: dict[tuple[type, Any], RpcPayload] = {
+    (type(v), v): RpcPayload(v, PayloadSource.OWNED)
+    for v in (None, True, False, *range(-5, 257), "", "ok", "error")
+}
@@ -14,22 +14,27 @@ from capnweb.error import RpcError
 from capnweb.ids import ImportId
 from capnweb.transports import create_transport
 from capnweb.wire import (
-    PropertyKey,
     WireMessage,
     WirePipeline,
     WirePull,
     WirePush,
     WireReject,
     WireResolve,
-    parse_wire_batch,
-    serialize_wire_batch,
+    parse_wire_batch_bytes,
+    property_key,
+    serialize_wire_batch_bytes,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
     from capnweb.client import Client
 
+# Marks an import ID whose result has not arrived
+_NO_RESULT = object()
+
 
-@dataclass
+@dataclass(slots=True)
 class PendingCall:
     """A pending RPC call in a pipeline batch."""
 
@@ -39,6 +44,26 @@ class PendingCall:
     args: list[Any]
     property_path: list[str] | None = None
 
+    def to_push_message(self) -> WirePush:
+        """Build the push message that sends this call.
+
+        Returns:
+            A push of a pipeline expression calling the method, after the
+            property path, on the target capability
+        """
+        # Build property path including method name in one list
+        property_path = self.property_path
+        path_keys = [property_key(p) for p in property_path] if property_path else []
+        path_keys.append(property_key(self.method))
+
+        return WirePush(
+            WirePipeline(
+                import_id=self.cap_id,
+                property_path=path_keys,
+                args=self.args,
+            )
+        )
+
 
 class PipelinePromise:
     """A promise that can be used in pipelined calls.
@@ -47,6 +72,16 @@ class PipelinePromise:
     to create pipelined references without awaiting the result.
     """
 
+    # One promise is created per pipelined call or property access
+    __slots__ = (
+        "_batch",
+        "_children",
+        "_client",
+        "_import_id",
+        "_resolved",
+        "_result",
+    )
+
     def __init__(
         self,
         client: Client,
@@ -65,6 +100,8 @@ class PipelinePromise:
         self._import_id = import_id
         self._result: Any = None
         self._resolved = False
+        # Property promises already created from this one, by name
+        self._children: dict[str, PipelinePromise] | None = None
 
     def __getattr__(self, name: str) -> PipelinePromise:
         """Access a property on the promised value, creating a pipelined reference.
@@ -73,15 +110,22 @@ class PipelinePromise:
             name: Property name to access
 
         Returns:
-            A new PipelinePromise representing the property access
+            A PipelinePromise representing the property access; repeated
+            accesses of the same name share one promise and one import
         """
+        children = self._children
+        if children is None:
+            children = self._children = {}
+        elif name in children:
+            return children[name]
+
         # Create a new import ID for the pipelined property access
         next_import_id = self._batch._allocate_import_id()
 
         # Create a WirePipeline expression for this property access
         pipeline_expr = WirePipeline(
             import_id=self._import_id.value,
-            property_path=[PropertyKey(name)],
+            property_path=[property_key(name)],
             args=None,
         )
 
@@ -89,7 +133,9 @@ class PipelinePromise:
         self._batch._add_pipeline_expr(next_import_id, pipeline_expr)
 
         # Return a new promise for the property value
-        return PipelinePromise(self._client, self._batch, next_import_id)
+        child = PipelinePromise(self._client, self._batch, next_import_id)
+        children[name] = child
+        return child
 
     def __await__(self):
         """Make this promise awaitable.
@@ -113,11 +159,13 @@ class PipelineBatch:
             client: The client instance
         """
         self._client = client
-        self._pending_calls: dict[ImportId, PendingCall | WirePipeline] = {}
-        self._results: dict[ImportId, Any] = {}
-        self._executed = False
-        self._executing_lock = asyncio.Lock()
-        self._next_import_id = 1
+        # Import IDs are allocated sequentially from 1, so both tables are
+        # plain lists indexed by ID - 1 rather than dicts keyed by ID
+        self._pending_items: list[PendingCall | WirePipeline | None] = []
+        self._results: list[Any] = []
+        # The single in-flight (or finished) batch round trip, shared by
+        # every awaiter
+        self._execution: asyncio.Future[None] | None = None
 
     def _allocate_import_id(self) -> ImportId:
         """Allocate a new import ID for this batch.
@@ -125,9 +173,9 @@ class PipelineBatch:
         Returns:
             A new import ID
         """
-        import_id = ImportId(self._next_import_id)
-        self._next_import_id += 1
-        return import_id
+        self._pending_items.append(None)
+        self._results.append(_NO_RESULT)
+        return ImportId(len(self._pending_items))
 
     def _add_call(self, pending_call: PendingCall) -> None:
         """Add a pending call to the batch.
@@ -135,7 +183,7 @@ class PipelineBatch:
         Args:
             pending_call: The call to add
         """
-        self._pending_calls[pending_call.import_id] = pending_call
+        self._pending_items[pending_call.import_id.value - 1] = pending_call
 
     def _add_pipeline_expr(
         self, import_id: ImportId, pipeline_expr: WirePipeline
@@ -146,7 +194,7 @@ class PipelineBatch:
             import_id: Import ID for this expression
             pipeline_expr: The pipeline expression
         """
-        self._pending_calls[import_id] = pipeline_expr
+        self._pending_items[import_id.value - 1] = pipeline_expr
 
     async def _execute_and_get_result(self, import_id: ImportId) -> Any:
         """Execute the batch and get the result for a specific import ID.
@@ -160,11 +208,12 @@ class PipelineBatch:
         Raises:
             RpcError: If the call fails
         """
-        # Execute if not already executed (with proper locking)
+        # Execute if not already executed (awaiters share one round trip)
         await self._execute()
 
-        if import_id in self._results:
-            result = self._results[import_id]
+        index = import_id.value - 1
+        result = self._results[index] if 0 <= index < len(self._results) else _NO_RESULT
+        if result is not _NO_RESULT:
             # If the result is an exception, raise it
             if isinstance(result, Exception):
                 raise result
@@ -193,46 +242,41 @@ class PipelineBatch:
         """
         return self._client.call_pipelined(self, cap_id, method, args, property_path)
 
-    async def _ensure_transport(self) -> None:
-        """Ensure the transport is available and connected."""
-        if not self._client._transport:
-            self._client._transport = create_transport(
-                self._client.config.url, timeout=self._client.config.timeout
-            )
-            await self._client._transport.__aenter__()  # noqa: PLC2801
-
-    def _build_batch_messages(self) -> list[WireMessage]:
-        """Build the batch of push and pull messages.
+    async def _ensure_transport(self) -> Callable[[bytes], Awaitable[bytes]]:
+        """Ensure the transport is available and connected.
 
         Returns:
-            List of wire messages to send
+            The transport's bound send_and_receive method, resolved once so
+            the send path skips the client -> transport attribute chain
         """
-        messages: list[WireMessage] = []
+        transport = self._client._transport
+        if not transport:
+            transport = self._client._transport = create_transport(
+                self._client.config.url, timeout=self._client.config.timeout
+            )
+            await transport.__aenter__()  # noqa: PLC2801
+        return transport.send_and_receive
 
-        # Add push messages for all pending calls
-        for call_or_expr in self._pending_calls.values():
-            if isinstance(call_or_expr, PendingCall):
-                pending_call = call_or_expr
-                # Build property path including method name
-                full_path = (pending_call.property_path or []) + [pending_call.method]
-                path_keys = [PropertyKey(p) for p in full_path]
+    def _iter_batch_messages(self) -> Iterator[WireMessage]:
+        """Yield the batch of push and pull messages.
 
-                # Create pipeline expression
-                pipeline_expr = WirePipeline(
-                    import_id=pending_call.cap_id,
-                    property_path=path_keys,
-                    args=pending_call.args,
-                )
-                messages.append(WirePush(pipeline_expr))
+        Messages are produced lazily so the serializer can consume them
+        without an intermediate list.
 
-            elif isinstance(call_or_expr, WirePipeline):
-                # Direct pipeline expression
-                messages.append(WirePush(call_or_expr))
+        Yields:
+            Wire messages to send, pushes first and then pulls
+        """
+        pending_items = self._pending_items
 
-        # Add pull messages for all import IDs we need results for
-        messages.extend(WirePull(import_id.value) for import_id in self._pending_calls)
+        # Push messages for all pending calls and pipeline expressions
+        for item in pending_items:
+            if item is not None:
+                yield item.to_push_message()
 
-        return messages
+        # Pull messages for all import IDs we need results for
+        for index, item in enumerate(pending_items):
+            if item is not None:
+                yield WirePull(index + 1)
 
     def _process_response_messages(self, response_messages: list[WireMessage]) -> None:
         """Process response messages and store results.
@@ -240,63 +284,59 @@ class PipelineBatch:
         Args:
             response_messages: List of response messages from the server
         """
+        pending_items = self._pending_items
+        results = self._results
+        parse_error = self._client._parse_error
+        count = len(pending_items)
         for msg in response_messages:
+            if not isinstance(msg, WireResolve | WireReject):
+                continue
+
+            # Export ID matches import ID (positive); IDs index the tables
+            # directly, so there is nothing to hash
+            index = msg.export_id - 1
+            if not (0 <= index < count and pending_items[index] is not None):
+                continue
+
             if isinstance(msg, WireResolve):
-                # Export ID matches import ID (positive)
-                result_import_id = ImportId(msg.export_id)
-                if result_import_id in self._pending_calls:
-                    self._results[result_import_id] = msg.value
-
-            elif isinstance(msg, WireReject):
-                # Export ID matches import ID (positive)
-                result_import_id = ImportId(msg.export_id)
-                if result_import_id in self._pending_calls:
-                    # Parse error and store it as an exception
-                    error = self._client._parse_error(msg.error)
-                    # Store the error - will be raised when awaited
-                    self._results[result_import_id] = error
+                results[index] = msg.value
+            else:
+                # Parse error and store it as an exception; it will be
+                # raised when awaited
+                results[index] = parse_error(msg.error)
 
     async def _execute(self) -> None:
         """Execute all pending calls in a single batch.
 
-        This method sends all pending calls to the server in a single
-        HTTP batch request and stores the results.
+        The first caller starts the round trip as a task; concurrent and
+        later callers await that same task instead of queueing on a lock.
+        Awaiters are shielded so cancelling one does not abort the batch
+        for the others.
         """
-        async with self._executing_lock:
-            if self._executed:
-                return
-
-            self._executed = True
-
-            # Ensure transport is available
-            await self._ensure_transport()
+        if self._execution is None:
+            self._execution = asyncio.ensure_future(self._send_batch())
+        await asyncio.shield(self._execution)
 
-            # Build batch of push and pull messages
-            messages = self._build_batch_messages()
+    async def _send_batch(self) -> None:
+        """Send all pending calls in a single HTTP batch and store the results."""
+        # Ensure transport is available
+        send_and_receive = await self._ensure_transport()
 
-            # Send the entire batch in one request
-            batch = serialize_wire_batch(messages)
+        # Serialize the push and pull messages in one pass
+        batch = serialize_wire_batch_bytes(self._iter_batch_messages())
 
-            # Verify transport is available (should always be true after _ensure_transport)
-            if not self._client._transport:
-                msg = "Transport not available after initialization"
-                raise RpcError.internal(msg)
-
-            try:
-                response_bytes = await self._client._transport.send_and_receive(
-                    batch.encode("utf-8")
-                )
-                response_text = response_bytes.decode("utf-8")
-
-                if not response_text:
-                    return
+        try:
+            response_bytes = await send_and_receive(batch)
+            if not response_bytes:
+                return
 
-                # Parse and process responses
-                response_messages = parse_wire_batch(response_text)
-                self._process_response_messages(response_messages)
+            # Parse and process responses
+            response_messages = parse_wire_batch_bytes(response_bytes)
+            self._process_response_messages(response_messages)
 
-            except Exception as e:
-                # Store the error for all pending calls
-                error = RpcError.internal(f"Batch execution failed: {e}")
-                for import_id in self._pending_calls:
-                    self._results[import_id] = error
+        except Exception as e:
+            # Store the error for all pending calls
+            error = RpcError.internal(f"Batch execution failed: {e}")
+            for index, item in enumerate(self._pending_items):
+                if item is not None:
+                    self._results[index] = error
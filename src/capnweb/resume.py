@@ -7,14 +7,21 @@ or re-establish capabilities.
 
 from __future__ import annotations
 
+import heapq
 import json
 import secrets
 import time
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
+from capnweb.wire import json_dumps_bytes, json_loads
 
-@dataclass
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(slots=True)
 class ResumeToken:
     """Resume token for session restoration.
 
@@ -45,7 +52,7 @@ class ResumeToken:
         }
         if self.metadata:
             data["metadata"] = self.metadata
-        return json.dumps(data)
+        return json_dumps_bytes(data).decode("utf-8")
 
     @staticmethod
     def from_json(token_str: str) -> ResumeToken:
@@ -61,7 +68,7 @@ class ResumeToken:
             ValueError: If token format is invalid
         """
         try:
-            data = json.loads(token_str)
+            data = json_loads(token_str)
             # Convert string keys back to integers for capabilities dict
             capabilities = {int(k): v for k, v in data["capabilities"].items()}
             return ResumeToken(
@@ -147,16 +154,24 @@ class ResumeTokenManager:
         self.default_ttl = default_ttl
         # Session ID -> (export_table_snapshot, import_table_snapshot)
         self._sessions: dict[str, dict[str, Any]] = {}
+        # Min-heap of (expires_at, session_id), so cleanup only visits
+        # expired sessions. Entries for sessions removed some other way
+        # are dropped lazily once they reach the top.
+        self._expiry: list[tuple[float, str]] = []
 
     def create_token(
         self,
-        imports: dict[int, Any],
-        exports: dict[int, Any],
+        imports: Mapping[int, Any],
+        exports: Mapping[int, Any],
         ttl: float | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> ResumeToken:
         """Create a new resume token.
 
+        The manager keeps references to ``imports`` and ``exports`` rather
+        than copying them, so they must not be mutated afterwards. Pass a
+        copy if the tables are still live.
+
         Args:
             imports: Current import table state (import_id -> (value, ref_count))
             exports: Current export table state (export_id -> (target, ref_count))
@@ -173,16 +188,17 @@ class ResumeTokenManager:
         # Create capability mapping (import_id -> export_id)
         # This allows the client to restore references
         # In a real implementation, we'd need to map to corresponding export IDs
-        capabilities = {import_id: import_id for import_id in imports}
+        capabilities = dict(zip(imports, imports, strict=True))
 
         # Store session state for server-side restoration
         # This allows same-server restoration to be more efficient
         self._sessions[session_id] = {
-            "imports": imports.copy(),
-            "exports": exports.copy(),
+            "imports": imports,
+            "exports": exports,
             "created_at": now,
             "expires_at": expires_at,
         }
+        heapq.heappush(self._expiry, (expires_at, session_id))
 
         return ResumeToken(
             session_id=session_id,
@@ -219,7 +235,7 @@ class ResumeTokenManager:
 
     def restore_session(
         self, token: ResumeToken
-    ) -> tuple[dict[int, Any], dict[int, Any], bool] | None:
+    ) -> tuple[Mapping[int, Any], Mapping[int, Any], bool] | None:
         """Restore session state from a resume token.
 
         Args:
@@ -227,6 +243,8 @@ class ResumeTokenManager:
 
         Returns:
             Tuple of (imports, exports, session_found) if successful, None if token is invalid
+            - imports and exports are read-only views of the stored tables;
+              callers that need to mutate them should copy with dict()
             - session_found is True if the session was found in this manager
 
         Note:
@@ -240,8 +258,14 @@ class ResumeTokenManager:
 
         # If session exists in this manager, return stored state
         if token.session_id in self._sessions:
+            # Read-only views instead of copies: restoring never pays for
+            # an O(n) copy, and the stored snapshot cannot be modified
             session = self._sessions[token.session_id]
-            return (session["imports"].copy(), session["exports"].copy(), True)
+            return (
+                MappingProxyType(session["imports"]),
+                MappingProxyType(session["exports"]),
+                True,
+            )
 
         # Otherwise return empty state (session may exist elsewhere, or be truly invalid)
         # In production, you'd check a shared session store here
@@ -262,11 +286,12 @@ class ResumeTokenManager:
             Number of sessions removed
         """
         now = time.time()
-        expired = [
-            sid
-            for sid, session in self._sessions.items()
-            if now > session["expires_at"]
-        ]
-        for sid in expired:
-            del self._sessions[sid]
-        return len(expired)
+        expiry = self._expiry
+        sessions = self._sessions
+        removed = 0
+        while expiry and now > expiry[0][0]:
+            _, sid = heapq.heappop(expiry)
+            # Already invalidated or cleaned up by validate_token
+            if sessions.pop(sid, None) is not None:
+                removed += 1
+        return removed
@@ -8,13 +8,16 @@ wire expressions.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Protocol
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
 
 from capnweb.error import RpcError
 from capnweb.payload import RpcPayload
 from capnweb.stubs import RpcPromise, RpcStub
-from capnweb.wire import WireError, WireExport, WirePromise
+from capnweb.wire import WireError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
 
 
 class Exporter(Protocol):
@@ -35,7 +38,7 @@ class Exporter(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Serializer:
     """Converts Python objects to wire format for RPC transmission.
 
@@ -50,61 +53,157 @@ class Serializer:
     """
 
     exporter: Exporter
+    # exporter.export_capability, bound once instead of looked up per stub
+    _export: Callable[[RpcStub | RpcPromise], int] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Bind the exporter's export method."""
+        self._export = self.exporter.export_capability
 
     def serialize(self, value: Any) -> Any:
         """Serialize a Python value to wire format.
 
-        This is the main entry point. It recursively walks the object tree
-        and converts it to a JSON-serializable structure.
+        This is the main entry point. It walks the object tree and converts
+        it to a JSON-serializable structure. Containers are walked with an
+        explicit worklist, so deeply nested values use a single Python frame
+        and cannot hit the recursion limit.
+
+        Containers are copied on write: only those on the path to a value
+        that actually changes (a stub, promise, error, payload or container
+        subclass) are copied, and every untouched subtree is shared with the
+        input. A value with nothing to replace is returned as-is.
 
         Args:
             value: The Python value to serialize (could be anything)
 
         Returns:
             A JSON-serializable wire expression
+
+        Raises:
+            ValueError: If a container contains itself
         """
-        # Import here to avoid circular dependencies
+        # Handle None and primitives
+        if type(value) in _SCALAR_TYPES:
+            return value
+
+        # Open containers; children are visited depth-first in order, so
+        # export IDs are allocated in the same order as a recursive walk
+        frames: list[_Frame] = []
+        # ids of the open containers, to detect a container inside itself
+        open_ids: set[int] = set()
+        result = self._enter(value, frames, open_ids)
+        while frames:
+            frame = frames[-1]
+            if result is not _PENDING:
+                # A child finished; copy the container the first time one
+                # of its children serializes to a different object
+                if frame.copy is None and result is not frame.child:
+                    frame.copy = frame.copy_type(frame.node)
+                if frame.copy is not None:
+                    frame.copy[frame.slot] = result
+
+            for slot, child in frame.items:
+                if type(child) not in _SCALAR_TYPES:
+                    frame.slot = slot
+                    frame.child = child
+                    result = self._enter(child, frames, open_ids)
+                    break
+            else:
+                frames.pop()
+                open_ids.discard(id(frame.node))
+                result = frame.node if frame.copy is None else frame.copy
+
+        return result
+
+    def _enter(self, value: Any, frames: list[_Frame], open_ids: set[int]) -> Any:
+        """Start serializing a non-scalar value.
 
-        match value:
-            case None | bool() | int() | float() | str():
-                # Handle None and primitives
+        Args:
+            value: The value to serialize
+            frames: The open container stack; containers are pushed onto it
+            open_ids: ids of the containers on the stack
+
+        Returns:
+            The serialized value, or _PENDING if a container frame was pushed
+
+        Raises:
+            ValueError: If the value is a container that is already open
+        """
+        # Payloads serialize as their (owned) value
+        while isinstance(value, RpcPayload):
+            value.ensure_deep_copied()
+            value = value.value
+
+        # Exact containers of only scalars are already in wire form
+        value_type = type(value)
+        if value_type is list:
+            if _all_scalar(value):
                 return value
+        elif value_type is dict and _all_scalar(value.values()):
+            return value
+
+        if isinstance(value, list):
+            frame = _Frame(value, list, iter(enumerate(value)))
+        elif isinstance(value, dict):
+            frame = _Frame(value, dict, iter(value.items()))
+        else:
+            return (
+                value if type(value) in _SCALAR_TYPES else self._serialize_leaf(value)
+            )
+
+        if id(value) in open_ids:
+            msg = "Circular reference detected"
+            raise ValueError(msg)
+        open_ids.add(id(value))
+        frames.append(frame)
+
+        if type(value) is not frame.copy_type:
+            # Subclasses are always converted to the plain JSON container
+            frame.copy = frame.copy_type(value)
+        return _PENDING
+
+    def _serialize_leaf(self, value: Any) -> Any:
+        """Serialize a value that is not a container or payload.
+
+        Args:
+            value: The value to serialize
 
+        Returns:
+            The wire expression for the value
+        """
+        # Exact types dispatch with a single dict lookup
+        serializer = _LEAF_SERIALIZERS.get(type(value))
+        if serializer is not None:
+            return serializer(self, value)
+
+        match value:
             case RpcError():
-                # Handle RPC errors
                 return self._serialize_error(value)
 
             case RpcStub():
-                # Handle RPC stubs - export them
-                export_id = self.exporter.export_capability(value)
-                return WireExport(export_id).to_json()
+                return self._serialize_stub(value)
 
             case RpcPromise():
-                # Handle RPC promises - export them as promises
-                export_id = self.exporter.export_capability(value)
-                # Promises are exported with their promise ID
-
-                return WirePromise(export_id).to_json()
-
-            case list():
-                # Handle lists
-                return [self.serialize(item) for item in value]
-
-            case dict():
-                # Handle dicts
-                return {key: self.serialize(val) for key, val in value.items()}
-
-            case RpcPayload():
-                # Handle RpcPayload - serialize its value
-                # Ensure it's owned first
-                value.ensure_deep_copied()
-                return self.serialize(value.value)
+                return self._serialize_promise(value)
 
             case _:
-                # For other types, try to serialize as-is
+                # Primitive subclasses and other types are kept as-is
                 # (might fail at JSON encoding time)
                 return value
 
+    def _serialize_stub(self, stub: RpcStub) -> list[Any]:
+        """Export an RpcStub and return its ["export", id] expression."""
+        # Equivalent to WireExport(export_id).to_json(), without building the
+        # intermediate WireExport for every capability sent
+        return ["export", self._export(stub)]
+
+    def _serialize_promise(self, promise: RpcPromise) -> list[Any]:
+        """Export an RpcPromise and return its ["promise", id] expression."""
+        # Equivalent to WirePromise(export_id).to_json()
+        return ["promise", self._export(promise)]
+
     def _serialize_error(self, error: RpcError) -> list[Any]:
         """Serialize an RpcError to wire format.
 
@@ -136,3 +235,44 @@ class Serializer:
         """
         payload.ensure_deep_copied()
         return self.serialize(payload.value)
+
+
+_SCALAR_TYPES = frozenset({type(None), bool, int, float, str})
+
+
+@dataclass(slots=True)
+class _Frame:
+    """A container being serialized.
+
+    Attributes:
+        node: The original list or dict
+        copy_type: list or dict, used to copy the container
+        items: Iterator over the (slot, value) pairs still to visit
+        copy: The copy being written, or None while nothing has changed
+        slot: The slot of the child currently being serialized
+        child: The original value of that child
+    """
+
+    node: Any
+    copy_type: Callable[[Any], Any]
+    items: Iterator[tuple[Any, Any]]
+    copy: Any = None
+    slot: Any = None
+    child: Any = None
+
+
+def _all_scalar(values: Iterable[Any]) -> bool:
+    """Check whether every value is a JSON scalar, without a Python-level loop."""
+    return all(map(_SCALAR_TYPES.__contains__, map(type, values)))
+
+
+# Marks a container whose serialization is still in progress
+_PENDING = object()
+
+
+# Exact leaf type -> serializer
+_LEAF_SERIALIZERS: dict[type, Callable[[Serializer, Any], Any]] = {
+    RpcStub: Serializer._serialize_stub,
+    RpcPromise: Serializer._serialize_promise,
+    RpcError: Serializer._serialize_error,
+}
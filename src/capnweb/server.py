@@ -6,8 +6,8 @@ import asyncio
 import contextlib
 import logging
 import traceback
-from collections import UserDict
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, Self, cast
 
@@ -15,8 +15,7 @@ import aiohttp
 from aiohttp import web
 
 from capnweb.error import RpcError
-from capnweb.hooks import ErrorStubHook, PromiseStubHook, StubHook
-from capnweb.ids import ImportId
+from capnweb.hooks import ErrorStubHook, PromiseStubHook, StubHook, _maybe_await
 from capnweb.payload import RpcPayload
 from capnweb.resume import ResumeToken, ResumeTokenManager
 from capnweb.session import RpcSession
@@ -30,8 +29,10 @@ from capnweb.wire import (
     WireReject,
     WireRelease,
     WireResolve,
+    json_dumps_bytes,
     parse_wire_batch,
-    serialize_wire_batch,
+    parse_wire_batch_bytes,
+    serialize_wire_batch_bytes,
 )
 
 # Optional WebTransport support
@@ -43,8 +44,19 @@ except ImportError:
     WEBTRANSPORT_AVAILABLE = False
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
+
     from capnweb.types import RpcTarget
 
+logger = logging.getLogger(__name__)
+
+# Eager task factory (Python 3.12+), None on older versions
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+# Error sent for unexpected server failures when stack traces are disabled;
+# WireError is frozen, so one instance can back every such rejection
+_INTERNAL_ERROR = WireError("internal", "Internal server error")
+
 
 class ExportsProtocol(Protocol):
     """Protocol for exports that support both dict and ExportTable API."""
@@ -79,7 +91,7 @@ class ExportsProtocol(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerConfig:
     """Configuration for the Cap'n Web server."""
 
@@ -159,9 +171,6 @@ class Server(RpcSession):
         self._resume_manager = ResumeTokenManager(
             default_ttl=self.config.resume_token_ttl
         )
-        # Track batch-local import tables for HTTP batch requests
-        self._batch_imports: dict[int, StubHook] = {}
-
         # WebTransport server (optional)
         self._webtransport_server: Any = None
         self._webtransport_task: asyncio.Task | None = None
@@ -169,6 +178,15 @@ class Server(RpcSession):
         # Create a wrapper that exposes both dict and ExportTable API
         self._exports_wrapper = self._create_exports_wrapper()
 
+        # Per-instance table of bound batch handlers, so dispatching an
+        # incoming message costs a single dict lookup on its type
+        self._batch_dispatch: dict[
+            type, Callable[..., Awaitable[WireMessage | None]]
+        ] = {
+            msg_type: handler.__get__(self)
+            for msg_type, handler in _BATCH_HANDLERS.items()
+        }
+
     @property
     def _exports_typed(self) -> ExportsProtocol:
         """Get _exports as ExportsProtocol for type checking."""
@@ -179,14 +197,14 @@ class Server(RpcSession):
         # Get the parent's _exports dict
         parent_exports = self.__dict__.get("_exports", {})
 
-        class ExportsWrapper(UserDict):
+        # A dict subclass (not UserDict) so item access and membership
+        # tests on the export table run in C
+        class ExportsWrapper(dict):  # noqa: FURB189
             """Wrapper that acts like both a dict and ExportTable."""
 
             def contains(self, export_id):
                 """ExportTable API compatibility."""
-                if hasattr(export_id, "value"):
-                    return export_id.value in self
-                return export_id in self
+                return getattr(export_id, "value", export_id) in self
 
             @property
             def _entries(self):
@@ -261,62 +279,106 @@ class Server(RpcSession):
         if self._runner:
             await self._runner.cleanup()
 
-    async def _handle_batch(self, request: web.Request) -> web.Response:
+    async def _handle_batch(self, request: web.Request) -> web.StreamResponse:
         """Handle HTTP batch requests."""
         try:
-            body = await request.text()
+            # Read and parse the raw bytes; the JSON decoder handles UTF-8
+            body = await request.read()
 
             # Parse messages
-            messages = parse_wire_batch(body)
+            messages = parse_wire_batch_bytes(body)
 
             if len(messages) > self.config.max_batch_size:
-                error = WireAbort(f"Batch size {len(messages)} exceeds maximum")
                 return web.Response(
-                    text=serialize_wire_batch([error]),
+                    body=_oversize_abort(len(messages)),
                     content_type="application/x-ndjson",
+                    charset="utf-8",
                     status=400,
                 )
 
-            # Process messages
-            # Create a batch-local import table for this request
-            # (HTTP batch is stateless - each request is a micro-session)
-            batch_imports: dict[int, StubHook] = {}
+            stream = await self._stream_batch(request, messages)
 
-            # Track push sequence for this batch (client's import ID space)
-            next_push_import_id = 1
-            responses: list[WireMessage] = []
-            for msg in messages:
-                match msg:
-                    case WirePush():
-                        # Assign the next sequential import ID for this push
-                        import_id = next_push_import_id
-                        next_push_import_id += 1
-                        response = await self._handle_push(
-                            msg.expression, import_id, batch_imports
-                        )
-                    case WirePull():
-                        response = await self._handle_pull(msg.import_id, batch_imports)
-                    case _:
-                        response = await self._process_message(msg)
+        except Exception as e:
+            error = WireAbort(self._failure_message("Server error", e))
+            return web.Response(
+                body=serialize_wire_batch_bytes([error]),
+                content_type="application/x-ndjson",
+                charset="utf-8",
+                status=500,
+            )
 
-                if response:
-                    responses.append(response)
+        return stream if stream is not None else web.Response(status=204)
 
-            # Send responses
-            if responses:
-                return web.Response(
-                    text=serialize_wire_batch(responses),
-                    content_type="application/x-ndjson",
-                )
-            return web.Response(status=204)
+    async def _stream_batch(
+        self, request: web.Request, messages: list[WireMessage]
+    ) -> web.StreamResponse | None:
+        """Process a batch, writing each response line as soon as it is ready.
+
+        The first reply is held back until a second one is produced. A batch
+        with a single reply, the common push + pull case, is therefore sent
+        as a plain Response, whose headers and body go out together. Larger
+        batches are streamed from the second reply on. A batch without
+        replies is answered with 204, and a failure before streaming starts
+        still gets a 500.
+
+        Args:
+            request: The HTTP request being answered
+            messages: The parsed batch messages
+
+        Returns:
+            The finished response, or None if no message produced a reply
+        """
+        # Create a batch-local import table for this request
+        # (HTTP batch is stateless - each request is a micro-session).
+        # Push N is stored at index N - 1 (see _handle_push).
+        batch_imports: list[StubHook | None] = []
+
+        dispatch = self._batch_dispatch
+        first: bytes | None = None
+        stream: web.StreamResponse | None = None
+        try:
+            for msg in messages:
+                handler = dispatch.get(type(msg))
+                if handler is None:
+                    continue
+                response = await handler(msg, batch_imports)
+                if not response:
+                    continue
+
+                line = json_dumps_bytes(response.to_json())
+                if first is None:
+                    first = line
+                    continue
+                if stream is None:
+                    stream = web.StreamResponse()
+                    stream.content_type = "application/x-ndjson"
+                    stream.charset = "utf-8"
+                    await stream.prepare(request)
+                    await stream.write(first)
+                # Lines are separated, not terminated, as in
+                # serialize_wire_batch_bytes
+                await stream.write(b"\n" + line)
 
         except Exception as e:
-            error = WireAbort(f"Server error: {e}")
+            if stream is None:
+                raise
+            # Headers are already sent, so report the failure in-band. The
+            # client may be gone, so this is best effort.
+            error = WireAbort(self._failure_message("Server error", e))
+            with contextlib.suppress(Exception):
+                await stream.write(b"\n" + json_dumps_bytes(error.to_json()))
+
+        if stream is not None:
+            # The response is already prepared, so it is the only answer this
+            # request can get, even if finishing it fails
+            with contextlib.suppress(Exception):
+                await stream.write_eof()
+            return stream
+        if first is not None:
             return web.Response(
-                text=serialize_wire_batch([error]),
-                content_type="application/x-ndjson",
-                status=500,
+                body=first, content_type="application/x-ndjson", charset="utf-8"
             )
+        return None
 
     async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
         """Handle WebSocket connections for RPC.
@@ -338,105 +400,29 @@ class Server(RpcSession):
 
         # Create session-specific import table for this WebSocket connection
         # Unlike HTTP batch (stateless), WebSocket maintains state for the connection lifetime
-        ws_imports: dict[int, StubHook] = {}
+        ws_imports: list[StubHook | None] = []
 
         try:
-            # Track push sequence for this WebSocket session
-            next_push_import_id = 1
+            # The config is frozen, so read the limit once per connection
+            max_batch = self.config.max_batch_size
 
             async for msg in ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    # Parse NDJSON batch
-                    try:
-                        messages = parse_wire_batch(msg.data)
-
-                        if len(messages) > self.config.max_batch_size:
-                            error = WireAbort(
-                                f"Batch size {len(messages)} exceeds maximum"
-                            )
-                            await ws.send_str(serialize_wire_batch([error]))
-                            break
-
-                        # Process messages
-                        responses: list[WireMessage] = []
-                        for wire_msg in messages:
-                            match wire_msg:
-                                case WirePush():
-                                    # Assign sequential import ID for this push
-                                    import_id = next_push_import_id
-                                    next_push_import_id += 1
-                                    response = await self._handle_push(
-                                        wire_msg.expression, import_id, ws_imports
-                                    )
-                                case WirePull():
-                                    response = await self._handle_pull(
-                                        wire_msg.import_id, ws_imports
-                                    )
-                                case _:
-                                    response = await self._process_message(wire_msg)
-
-                            if response:
-                                responses.append(response)
-
-                        # Send responses back over WebSocket
-                        if responses:
-                            response_text = serialize_wire_batch(responses)
-                            await ws.send_str(response_text)
-
-                    except Exception as e:
-                        # Send error and continue (don't break connection on parse errors)
-                        error = WireAbort(f"Error processing message: {e}")
-                        await ws.send_str(serialize_wire_batch([error]))
-
-                elif msg.type == aiohttp.WSMsgType.BINARY:
-                    # Handle binary messages same as text
-                    try:
-                        messages = parse_wire_batch(msg.data.decode("utf-8"))
-
-                        if len(messages) > self.config.max_batch_size:
-                            error = WireAbort(
-                                f"Batch size {len(messages)} exceeds maximum"
-                            )
-                            await ws.send_bytes(
-                                serialize_wire_batch([error]).encode("utf-8")
-                            )
-                            break
-
-                        # Process messages
-                        responses: list[WireMessage] = []
-                        for wire_msg in messages:
-                            match wire_msg:
-                                case WirePush():
-                                    import_id = next_push_import_id
-                                    next_push_import_id += 1
-                                    response = await self._handle_push(
-                                        wire_msg.expression, import_id, ws_imports
-                                    )
-                                case WirePull():
-                                    response = await self._handle_pull(
-                                        wire_msg.import_id, ws_imports
-                                    )
-                                case _:
-                                    response = await self._process_message(wire_msg)
-
-                            if response:
-                                responses.append(response)
-
-                        # Send responses
-                        if responses:
-                            response_data = serialize_wire_batch(responses).encode(
-                                "utf-8"
-                            )
-                            await ws.send_bytes(response_data)
-
-                    except Exception as e:
-                        error = WireAbort(f"Error processing message: {e}")
-                        await ws.send_bytes(
-                            serialize_wire_batch([error]).encode("utf-8")
-                        )
+                if msg.type in {aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY}:
+                    # Text and binary frames share one path; binary frames
+                    # are parsed as bytes without decoding them first
+                    reply, close = await self._process_ws_frame(
+                        msg.data, ws_imports, max_batch
+                    )
+                    if reply is not None:
+                        # Answer in the same frame type the client used
+                        if msg.type == aiohttp.WSMsgType.BINARY:
+                            await ws.send_bytes(reply)
+                        else:
+                            await ws.send_str(reply.decode("utf-8"))
+                    if close:
+                        break
 
                 elif msg.type == aiohttp.WSMsgType.ERROR:
-                    logger = logging.getLogger(__name__)
                     logger.error("WebSocket error: %s", ws.exception())
                     break
 
@@ -445,14 +431,65 @@ class Server(RpcSession):
 
         finally:
             # Clean up WebSocket session imports
-            # Dispose of any capabilities that were imported during this session
-            for hook in ws_imports.values():
+            # Dispose of any capabilities that were imported during this session.
+            # Popping one at a time stays safe if a dispose touches the table.
+            while ws_imports:
+                hook = ws_imports.pop()
+                if hook is None:
+                    continue
                 with contextlib.suppress(Exception):
                     # Best effort cleanup - ignore any disposal errors
                     hook.dispose()
 
         return ws
 
+    async def _process_ws_frame(
+        self,
+        data: str | bytes,
+        imports: list[StubHook | None],
+        max_batch: int,
+    ) -> tuple[bytes | None, bool]:
+        """Process one WebSocket frame holding an NDJSON batch.
+
+        Args:
+            data: The frame payload, str for text frames and bytes for binary
+            imports: The connection's import table
+            max_batch: The maximum number of messages allowed in one frame
+
+        Returns:
+            A tuple of (reply, close): the encoded NDJSON reply, or None if
+            there is nothing to send, and whether to close the connection
+        """
+        try:
+            messages = (
+                parse_wire_batch(data)
+                if isinstance(data, str)
+                else parse_wire_batch_bytes(data)
+            )
+
+            if len(messages) > max_batch:
+                return _oversize_abort(len(messages)), True
+
+            # Process messages
+            dispatch = self._batch_dispatch
+            responses: list[WireMessage] = []
+            for wire_msg in messages:
+                handler = dispatch.get(type(wire_msg))
+                if handler is None:
+                    continue
+                response = await handler(wire_msg, imports)
+                if response:
+                    responses.append(response)
+
+        except Exception as e:
+            # Send error and continue (don't break connection on parse errors)
+            error = WireAbort(f"Error processing message: {e}")
+            return serialize_wire_batch_bytes([error]), False
+
+        if not responses:
+            return None, False
+        return serialize_wire_batch_bytes(responses), False
+
     async def _process_message(self, msg: WireMessage) -> WireMessage | None:
         """Process a single wire message.
 
@@ -460,43 +497,68 @@ class Server(RpcSession):
         Note: WirePush and WirePull are handled separately in _handle_batch
         to track sequential IDs and use batch-local import table.
         """
-        match msg:
-            case WireRelease(import_id, refcount):
-                return await self._handle_release(ImportId(import_id), refcount)
+        # An exact type check instead of structural matching: this runs for
+        # every message on the WebTransport path
+        if type(msg) is WireRelease:
+            return await self._handle_release(msg.import_id, msg.refcount)
+
+        # Push, Pull, Resolve, Reject, Abort are handled elsewhere or not expected
+        return None
+
+    async def _batch_push(
+        self, msg: WirePush, imports: list[StubHook | None]
+    ) -> WireMessage | None:
+        """Dispatch a push, which takes the next sequential import ID."""
+        return await self._handle_push(msg.expression, imports)
 
-            case _:
-                # Push, Pull, Resolve, Reject, Abort are handled elsewhere or not expected
-                return None
+    async def _batch_pull(
+        self, msg: WirePull, imports: list[StubHook | None]
+    ) -> WireMessage | None:
+        """Dispatch a pull against the batch or connection import table."""
+        return await self._handle_pull(msg.import_id, imports)
+
+    async def _batch_release(
+        self, msg: WireRelease, imports: list[StubHook | None]
+    ) -> WireMessage | None:
+        """Dispatch a release to the session-wide import table."""
+        return await self._handle_release(msg.import_id, msg.refcount)
 
     async def _handle_push(
-        self, expression: Any, import_id: int, imports: dict[int, StubHook]
+        self, expression: Any, imports: list[StubHook | None]
     ) -> WireMessage | None:
         """Handle a push message - evaluate pipeline expression and store result.
 
         Args:
             expression: The wire expression (expected to be WirePipeline)
-            import_id: The import ID assigned sequentially for this push in the current batch
             imports: The batch-local import table
 
         The client's push messages are implicitly numbered sequentially (1, 2, 3...).
-        The server tracks these in the import table so they can be pulled later.
+        The server stores push N at index N - 1 of the import table so it can be
+        pulled later. The slot is taken even if the push fails, keeping later
+        pushes numbered as the client expects.
 
         Note: WirePipeline expressions are handled directly here, not through the Parser,
         because they are a server-side execution construct, not a serialized data type.
         """
+        # Reserve this push's slot before anything can fail
+        imports.append(None)
+        import_id = len(imports)
+
         try:
-            # Validate the pipeline expression
-            if not isinstance(expression, WirePipeline):
+            # Validate the pipeline expression (wire classes are never
+            # subclassed, so an exact type check is enough)
+            if type(expression) is not WirePipeline:
                 msg = "Expected WirePipeline expression in push"
                 raise RpcError.bad_request(msg)
 
             # Get the target hook (either from batch imports or our exports)
-            target_hook = imports.get(expression.import_id)
+            target_id = expression.import_id
+            target_hook = _batch_import(imports, target_id)
             if target_hook is None:
-                target_hook = self.get_export_hook(expression.import_id)
+                target_hook = self.get_export_hook(target_id)
 
             if target_hook is None:
-                msg = f"Capability {expression.import_id} not found"
+                msg = f"Capability {target_id} not found"
                 raise RpcError.not_found(msg)
 
             # Parse arguments using the session's parser
@@ -507,10 +569,11 @@ class Server(RpcSession):
                 else RpcPayload.owned([])
             )
 
-            # Extract the path (method and property names)
-            path: list[str | int] = [
+            # Extract the path (method and property names). Segments are
+            # normalized to str here so hooks can use them without coercion.
+            path: tuple[str | int, ...] = tuple(
                 str(pk.value) for pk in (expression.property_path or [])
-            ]
+            )
 
             # Execute the call asynchronously
             async def execute_call() -> StubHook:
@@ -524,50 +587,43 @@ class Server(RpcSession):
 
                 except RpcError as e:
                     # RPC errors become ErrorStubHook
-                    return ErrorStubHook(e)
+                    return ErrorStubHook.of(e)
                 except Exception as e:
                     # Other errors become internal RPC errors
-                    logger = logging.getLogger(__name__)
                     logger.exception("Call execution failed: %s", e)
-                    return ErrorStubHook(RpcError.internal(f"Target call failed: {e}"))
-
-            # Create a future for the result
-            result_future: asyncio.Future[StubHook] = asyncio.create_task(
-                execute_call()
+                    return ErrorStubHook(
+                        RpcError.internal(
+                            self._failure_message("Target call failed", e)
+                        )
+                    )
+
+            # Create a future for the result. Where supported, the task starts
+            # eagerly, so a call that never suspends finishes right here.
+            result_future: asyncio.Future[StubHook] = _start_task(execute_call())
+
+            # Store the result in the batch imports so the client can pull it
+            # later: the hook itself if the call already finished, otherwise
+            # the pending future wrapped in a PromiseStubHook
+            imports[import_id - 1] = (
+                result_future.result()
+                if result_future.done()
+                else PromiseStubHook(result_future)
             )
 
-            # Store the future in the batch imports as a PromiseStubHook
-            # so the client can pull it later
-            imports[import_id] = PromiseStubHook(result_future)
-
             # No immediate response - client will pull when ready
             return None
 
         except RpcError as e:
             # If setup fails immediately, we should reject
-            stack = (
-                str(e.data)
-                if e.data
-                else None
-                if self.config.include_stack_traces
-                else None
-            )
-            data = e.data if isinstance(e.data, dict) else None
-            error_expr = WireError(str(e.code.value), e.message, stack, data)
-            return WireReject(-import_id, error_expr)
+            return self._to_wire_reject(e, -import_id)
 
         except Exception as e:
             # Unexpected error - log it server-side but don't expose details to client
-            logger = logging.getLogger(__name__)
             logger.exception("Unexpected error in push: %s", e)
-
-            # Only include stack trace if configured (security)
-            stack = traceback.format_exc() if self.config.include_stack_traces else None
-            error_expr = WireError("internal", "Internal server error", stack)
-            return WireReject(-import_id, error_expr)
+            return self._to_wire_reject(e, -import_id)
 
     async def _handle_pull(
-        self, import_id: int, imports: dict[int, StubHook]
+        self, import_id: int, imports: list[StubHook | None]
     ) -> WireMessage | None:
         """Handle a pull message - resolve and send the result.
 
@@ -580,15 +636,16 @@ class Server(RpcSession):
         """
         try:
             # Get the hook from batch imports
-            hook = imports.get(import_id)
+            hook = _batch_import(imports, import_id)
 
             if hook is None:
                 msg = f"Import {import_id} not found in batch"
                 raise RpcError.not_found(msg)
 
             # Pull the final payload from the hook
-            # This awaits the promise if it's a PromiseStubHook
-            payload = await hook.pull()
+            # This awaits the promise if it's a PromiseStubHook; locally
+            # resolved hooks hand back the payload without a coroutine
+            payload = await _maybe_await(hook.pull())
 
             # Serialize the payload using the session's serializer
             # This will handle exporting any RpcStub/RpcPromise within the result
@@ -602,26 +659,64 @@ class Server(RpcSession):
 
         except RpcError as e:
             # Send rejection
-            export_id = import_id
-            stack = (
-                str(e.data)
-                if e.data
-                else None
-                if self.config.include_stack_traces
-                else None
-            )
-            data = e.data if isinstance(e.data, dict) else None
-            error_expr = WireError(str(e.code.value), e.message, stack, data)
-            return WireReject(export_id, error_expr)
+            return self._to_wire_reject(e, import_id)
         except Exception as e:
             # Unexpected error - log but don't expose details
-            logger = logging.getLogger(__name__)
             logger.exception("Unexpected error in pull: %s", e)
+            return self._to_wire_reject(e, import_id)
 
-            export_id = import_id
-            stack = traceback.format_exc() if self.config.include_stack_traces else None
-            error_expr = WireError("internal", "Internal server error", stack)
-            return WireReject(export_id, error_expr)
+    def _to_wire_reject(self, exc: Exception, export_id: int) -> WireReject:
+        """Convert an exception raised while handling a message to a rejection.
+
+        RpcErrors keep their code, message and data. Any other exception
+        becomes the generic internal error, so details are not leaked.
+
+        Args:
+            exc: The exception being handled
+            export_id: The ID the rejection is sent for
+
+        Returns:
+            The WireReject to send to the client
+        """
+        if not isinstance(exc, RpcError):
+            return WireReject(export_id, self._internal_error())
+
+        stack = str(exc.data) if exc.data else None
+        data = exc.data if isinstance(exc.data, dict) else None
+        error_expr = WireError(str(exc.code.value), exc.message, stack, data)
+        return WireReject(export_id, error_expr)
+
+    def _failure_message(self, summary: str, exc: Exception) -> str:
+        """Build the client-facing message for an unexpected server failure.
+
+        The exception is only formatted when ``include_stack_traces`` is
+        enabled, so production servers neither leak its details nor pay
+        for formatting a message the client will not see.
+
+        Args:
+            summary: Short description of what failed
+            exc: The exception that caused the failure
+
+        Returns:
+            The summary, followed by the exception text if enabled
+        """
+        if self.config.include_stack_traces:
+            return f"{summary}: {exc}"
+        return summary
+
+    def _internal_error(self) -> WireError:
+        """Build the error expression for an unexpected server failure.
+
+        Must be called from inside an ``except`` block.
+
+        Returns:
+            The shared internal error, or a copy carrying the current
+            traceback when ``include_stack_traces`` is enabled
+        """
+        # Only include stack trace if configured (security)
+        if not self.config.include_stack_traces:
+            return _INTERNAL_ERROR
+        return replace(_INTERNAL_ERROR, stack=traceback.format_exc())
 
     def create_resume_token(
         self, metadata: dict[str, Any] | None = None
@@ -693,7 +788,7 @@ class Server(RpcSession):
         return self._resume_manager.cleanup_expired()
 
     async def _handle_release(
-        self, import_id: ImportId, refcount: int
+        self, import_id: int, refcount: int
     ) -> WireMessage | None:
         """Handle a release message - cleanup import table entries.
 
@@ -702,7 +797,7 @@ class Server(RpcSession):
             refcount: The total number of times this import has been introduced
         """
         # Release the import
-        self.release_import(import_id.value)
+        self.release_import(import_id)
 
         # No response needed for release
         return None
@@ -712,7 +807,7 @@ class Server(RpcSession):
     def send_pipeline_call(
         self,
         import_id: int,
-        path: list[str | int],
+        path: tuple[str | int, ...],
         args: RpcPayload,
         result_import_id: int,
     ) -> None:
@@ -726,7 +821,7 @@ class Server(RpcSession):
     def send_pipeline_get(
         self,
         import_id: int,
-        path: list[str | int],
+        path: tuple[str | int, ...],
         result_import_id: int,
     ) -> None:
         """Send a pipelined property get message.
@@ -793,6 +888,8 @@ class Server(RpcSession):
             protocol: The WebTransport protocol instance
             stream_id: The stream ID for this session
         """
+        # The config is frozen, so read the limit once per session
+        max_batch = self.config.max_batch_size
         try:
             while True:
                 # Receive request data
@@ -803,12 +900,10 @@ class Server(RpcSession):
                     break
 
                 # Parse NDJSON batch
-                messages = parse_wire_batch(data.decode("utf-8"))
+                messages = parse_wire_batch_bytes(data)
 
-                if len(messages) > self.config.max_batch_size:
-                    error = WireAbort(f"Batch size {len(messages)} exceeds maximum")
-                    response_data = serialize_wire_batch([error]).encode("utf-8")
-                    await protocol.send_data(stream_id, response_data)
+                if len(messages) > max_batch:
+                    await protocol.send_data(stream_id, _oversize_abort(len(messages)))
                     break
 
                 # Process messages
@@ -819,7 +914,7 @@ class Server(RpcSession):
                         responses.append(response)
 
                 # Send responses
-                response_data = serialize_wire_batch(responses).encode("utf-8")
+                response_data = serialize_wire_batch_bytes(responses)
                 await protocol.send_data(stream_id, response_data)
 
         except TimeoutError:
@@ -827,8 +922,70 @@ class Server(RpcSession):
             pass
         except Exception as e:
             # Send error and close
-            error = WireAbort(f"Server error: {e}")
-            error_data = serialize_wire_batch([error]).encode("utf-8")
+            error = WireAbort(self._failure_message("Server error", e))
+            error_data = serialize_wire_batch_bytes([error])
             with contextlib.suppress(Exception):
                 # Best effort - ignore if sending error fails
                 await protocol.send_data(stream_id, error_data)
+
+
+def _start_task(coro: Coroutine[Any, Any, StubHook]) -> asyncio.Future[StubHook]:
+    """Start a call as a task, eagerly when the event loop supports it.
+
+    An eager task runs synchronously up to its first real suspension, so
+    calls on local targets that never await complete without a scheduler
+    round trip. ``asyncio.eager_task_factory`` only exists from Python 3.12;
+    earlier versions fall back to a regular task.
+
+    Args:
+        coro: The call coroutine
+
+    Returns:
+        The task running the call
+    """
+    loop = asyncio.get_running_loop()
+    if _eager_task_factory is not None:
+        return _eager_task_factory(loop, coro)
+    return loop.create_task(coro)
+
+
+def _batch_import(imports: list[StubHook | None], import_id: int) -> StubHook | None:
+    """Look up a push result in a batch or connection import table.
+
+    Args:
+        imports: The import table, holding push N at index N - 1
+        import_id: The import ID sent by the client
+
+    Returns:
+        The stored hook, or None if the ID is out of range or its push failed
+    """
+    # Client IDs are untrusted: reject 0 and negatives rather than letting
+    # them index from the end of the list
+    if 0 < import_id <= len(imports):
+        return imports[import_id - 1]
+    return None
+
+
+@lru_cache(maxsize=64)
+def _oversize_abort(size: int) -> bytes:
+    """Get the encoded abort batch sent for a batch that is too large.
+
+    Clients that keep sending oversized batches usually repeat the same
+    size, so the encoded reply is cached per size.
+
+    Args:
+        size: The number of messages in the rejected batch
+
+    Returns:
+        The NDJSON-encoded abort message
+    """
+    error = WireAbort(f"Batch size {size} exceeds maximum")
+    return serialize_wire_batch_bytes([error])
+
+
+# Batch message type -> handler; types not listed here produce no response
+_BATCH_HANDLERS: dict[type, Callable[..., Awaitable[WireMessage | None]]] = {
+    WirePush: Server._batch_push,
+    WirePull: Server._batch_pull,
+    WireRelease: Server._batch_release,
+}
@@ -8,6 +8,8 @@ and Server extend this class to get unified capability management.
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from capnweb.hooks import (
@@ -20,10 +22,23 @@ from capnweb.parser import Parser
 from capnweb.serializer import Serializer
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from capnweb.payload import RpcPayload
     from capnweb.stubs import RpcPromise, RpcStub
     from capnweb.types import RpcTarget
 
 
+@dataclass
+class PendingPipelineOp:
+    """A pipelined call or property get waiting to be sent."""
+
+    import_id: int
+    path: tuple[str | int, ...]
+    args: RpcPayload | None  # None for property gets
+    result_import_id: int
+
+
 class RpcSession:
     """Base class for RPC sessions (Client and Server).
 
@@ -38,6 +53,10 @@ class RpcSession:
     5. Handle promise resolution
     """
 
+    # Seconds to keep collecting releases before sending them; 0 coalesces
+    # only the releases queued during the current event-loop turn
+    release_delay: float = 0.0
+
     def __init__(self) -> None:
         """Initialize the RPC session."""
         # Import table: import_id -> StubHook (remote capabilities)
@@ -51,6 +70,17 @@ class RpcSession:
         # Pending promises: promise_id -> Future[StubHook]
         self._pending_promises: dict[int, asyncio.Future[StubHook]] = {}
 
+        # Released import IDs whose release messages are deferred to the end
+        # of the current event-loop turn, so they go out together in one frame
+        self._pending_releases: list[int] = []
+        # Scheduled flush of _pending_releases, if one is outstanding
+        self._release_handle: asyncio.Handle | None = None
+        # Depth of nested hold_releases() blocks
+        self._release_holds = 0
+
+        # Pipelined calls/gets queued during the current event-loop turn
+        self._pending_ops: list[PendingPipelineOp] = []
+
         # Create serializer and parser
         self.serializer = Serializer(exporter=self)
         self.parser = Parser(importer=self)
@@ -134,11 +164,10 @@ class RpcSession:
             A PromiseStubHook that will resolve when the promise settles
         """
         # Check if we already have a pending promise for this ID
-        if promise_id in self._pending_promises:
-            future = self._pending_promises[promise_id]
-        else:
+        future = self._pending_promises.get(promise_id)
+        if future is None:
             # Create a new future for this promise
-            future: asyncio.Future[StubHook] = asyncio.Future()
+            future = _new_future()
             self._pending_promises[promise_id] = future
 
         return PromiseStubHook(future)
@@ -169,6 +198,22 @@ class RpcSession:
         """
         self._pending_promises[import_id] = future
 
+    def create_pending_import(self) -> tuple[int, asyncio.Future[StubHook]]:
+        """Allocate a result import ID together with its pending future.
+
+        This combines ID allocation, future creation and registration for
+        the pipelining hot path. The future comes from the running loop's
+        factory, which avoids the event-loop lookup done by ``asyncio.Future()``.
+
+        Returns:
+            A tuple of (import_id, future) for the pending result
+        """
+        import_id = self._next_import_id
+        self._next_import_id = import_id + 1
+        future: asyncio.Future[StubHook] = _new_future()
+        self._pending_promises[import_id] = future
+        return import_id, future
+
     def resolve_promise(self, promise_id: int, hook: StubHook) -> None:
         """Resolve a pending promise with a hook.
 
@@ -176,10 +221,9 @@ class RpcSession:
             promise_id: The promise ID to resolve
             hook: The StubHook to resolve with
         """
-        if promise_id in self._pending_promises:
-            future = self._pending_promises.pop(promise_id)
-            if not future.done():
-                future.set_result(hook)
+        future = self._pending_promises.pop(promise_id, None)
+        if future is not None and not future.done():
+            future.set_result(hook)
 
     def reject_promise(self, promise_id: int, error: Exception) -> None:
         """Reject a pending promise with an error.
@@ -188,10 +232,9 @@ class RpcSession:
             promise_id: The promise ID to reject
             error: The error to reject with
         """
-        if promise_id in self._pending_promises:
-            future = self._pending_promises.pop(promise_id)
-            if not future.done():
-                future.set_exception(error)
+        future = self._pending_promises.pop(promise_id, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
 
     def release_import(self, import_id: int) -> None:
         """Release an imported capability.
@@ -202,12 +245,95 @@ class RpcSession:
         Args:
             import_id: The import ID to release
         """
-        if import_id in self._imports:
-            hook = self._imports.pop(import_id)
-            hook.dispose()
+        self._release_imports([import_id])
 
-            # Subclasses should override to send release message
-            self._send_release_message(import_id)
+    def queue_release(self, import_id: int) -> None:
+        """Queue an imported capability for release.
+
+        The import is dropped from the import table at once, so if the remote
+        side exports the same ID again it gets a fresh hook. Only the release
+        message waits: releases queued during the same event-loop turn, or
+        within ``release_delay`` seconds when that is set, are coalesced and
+        sent to the remote side as a single frame. Without a running event
+        loop there is nothing to coalesce with, so the message is sent
+        immediately.
+
+        Args:
+            import_id: The import ID to release
+        """
+        hook = self._imports.pop(import_id, None)
+        if hook is None:
+            return
+        hook.dispose()
+
+        if self._release_holds:
+            # hold_releases() sends everything when its block exits
+            self._pending_releases.append(import_id)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._send_release_messages([import_id])
+            return
+
+        if self._release_handle is None:
+            if self.release_delay > 0:
+                self._release_handle = loop.call_later(
+                    self.release_delay, self._flush_releases
+                )
+            else:
+                self._release_handle = loop.call_soon(self._flush_releases)
+        self._pending_releases.append(import_id)
+
+    @contextmanager
+    def hold_releases(self) -> Generator[None, None, None]:
+        """Collect every release queued inside the block into one frame.
+
+        Use this around bulk disposal, such as disposing a payload that holds
+        many remote stubs, to send a single release frame even without a
+        running event loop or across awaits. Blocks may nest; the frame is
+        sent when the outermost block exits.
+
+        Yields:
+            None
+        """
+        self._release_holds += 1
+        try:
+            yield
+        finally:
+            self._release_holds -= 1
+            if not self._release_holds and self._pending_releases:
+                self._flush_releases()
+
+    def _flush_releases(self) -> None:
+        """Send the release messages queued by queue_release()."""
+        # Flushing early (hold_releases() or closing) makes the scheduled
+        # flush redundant
+        if self._release_handle is not None:
+            self._release_handle.cancel()
+            self._release_handle = None
+        import_ids = self._pending_releases
+        if not import_ids:
+            return
+        self._pending_releases = []
+        self._send_release_messages(import_ids)
+
+    def _release_imports(self, import_ids: list[int]) -> None:
+        """Drop imports from the import table and notify the remote side.
+
+        Args:
+            import_ids: The import IDs to release
+        """
+        released: list[int] = []
+        for import_id in import_ids:
+            hook = self._imports.pop(import_id, None)
+            if hook is not None:
+                hook.dispose()
+                released.append(import_id)
+
+        if released:
+            self._send_release_messages(released)
 
     def release_export(self, export_id: int) -> None:
         """Release an exported capability.
@@ -232,6 +358,18 @@ class RpcSession:
         # Default implementation does nothing
         # Client/Server will override to send release messages
 
+    def _send_release_messages(self, import_ids: list[int]) -> None:
+        """Send release messages for several imports to the remote side.
+
+        Subclasses that can send several messages in one frame should
+        override this; the default sends one release message per import.
+
+        Args:
+            import_ids: The import IDs to release
+        """
+        for import_id in import_ids:
+            self._send_release_message(import_id)
+
     # Target Management (for Server)
 
     def register_target(self, export_id: int, target: RpcTarget) -> None:
@@ -248,10 +386,85 @@ class RpcSession:
 
     # Pipelining Support (used by RpcImportHook)
 
+    def queue_pipeline_op(
+        self,
+        import_id: int,
+        path: tuple[str | int, ...],
+        args: RpcPayload | None,
+        result_import_id: int,
+    ) -> None:
+        """Queue a pipelined call (or property get, when args is None).
+
+        Operations queued during the same event-loop turn are handed to
+        send_pipeline_batch() together, so they can go out in one frame.
+        If sending fails, the result promise of each operation is rejected
+        with the error. Without a running event loop the operation is sent
+        immediately and errors are raised to the caller.
+
+        Args:
+            import_id: The import ID to call on
+            path: Property path (+ method name for calls)
+            args: Arguments for a call, or None for a property get
+            result_import_id: Import ID for the result
+        """
+        op = PendingPipelineOp(import_id, path, args, result_import_id)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._send_pipeline_op(op)
+            return
+
+        if not self._pending_ops:
+            loop.call_soon(self._flush_pending_ops)
+        self._pending_ops.append(op)
+
+    def _flush_pending_ops(self) -> None:
+        """Send every operation queued by queue_pipeline_op()."""
+        ops = self._pending_ops
+        if not ops:
+            return
+        self._pending_ops = []
+        try:
+            self.send_pipeline_batch(ops)
+        except Exception as e:
+            # This runs as a loop callback, so nobody would see the error:
+            # settle the callers' promises instead. reject_promise skips any
+            # operation the batch already settled.
+            for op in ops:
+                self.reject_promise(op.result_import_id, e)
+
+    def send_pipeline_batch(self, ops: list[PendingPipelineOp]) -> None:
+        """Send several pipelined operations.
+
+        Subclasses that can put several messages in one frame should
+        override this; the default sends each operation on its own. An
+        operation that fails to send has its result promise rejected, and
+        the remaining operations are still sent.
+
+        Args:
+            ops: The queued operations, in the order they were made
+        """
+        for op in ops:
+            try:
+                self._send_pipeline_op(op)
+            except Exception as e:
+                self.reject_promise(op.result_import_id, e)
+
+    def _send_pipeline_op(self, op: PendingPipelineOp) -> None:
+        """Send a single pipelined call or property get.
+
+        Args:
+            op: The operation to send
+        """
+        if op.args is None:
+            self.send_pipeline_get(op.import_id, op.path, op.result_import_id)
+        else:
+            self.send_pipeline_call(op.import_id, op.path, op.args, op.result_import_id)
+
     def send_pipeline_call(
         self,
         import_id: int,
-        path: list[str | int],
+        path: tuple[str | int, ...],
         args: Any,
         result_import_id: int,
     ) -> None:
@@ -272,7 +485,7 @@ class RpcSession:
     def send_pipeline_get(
         self,
         import_id: int,
-        path: list[str | int],
+        path: tuple[str | int, ...],
         result_import_id: int,
     ) -> None:
         """Send a pipelined property get message.
@@ -323,3 +536,19 @@ class RpcSession:
             The StubHook for this import, or None if not found
         """
         return self._imports.get(import_id)
+
+
+def _new_future() -> asyncio.Future[Any]:
+    """Create a future on the running loop.
+
+    ``loop.create_future()`` avoids the event-loop lookup that
+    ``asyncio.Future()`` does; the latter is only used when no loop is
+    running (e.g. a session used from synchronous code).
+
+    Returns:
+        A new pending future
+    """
+    try:
+        return asyncio.get_running_loop().create_future()
+    except RuntimeError:
+        return asyncio.Future()
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 from typing import TYPE_CHECKING, Any, Self
 
+from capnweb.hooks import _maybe_await
 from capnweb.payload import RpcPayload
 
 if TYPE_CHECKING:
@@ -60,7 +61,7 @@ class RpcStub:
             raise AttributeError(msg)
 
         # Get the property through the hook
-        result_hook = self._hook.get([name])
+        result_hook = self._hook.get((name,))
         return RpcPromise(result_hook)  # type: ignore[arg-type]
 
     def __call__(self, *args: Any, **kwargs: Any) -> RpcPromise:
@@ -82,7 +83,7 @@ class RpcStub:
 
         # Call through the hook (empty path = call the stub itself)
         async def do_call():
-            result_hook = await self._hook.call([], args_payload)
+            result_hook = await self._hook.call((), args_payload)
             return result_hook
 
         future = asyncio.ensure_future(do_call())
@@ -154,7 +155,7 @@ class RpcPromise:
             msg = f"'{type(self).__name__}' object has no attribute '{name}'"
             raise AttributeError(msg)
 
-        result_hook = self._hook.get([name])
+        result_hook = self._hook.get((name,))
         return RpcPromise(result_hook)  # type: ignore[arg-type]
 
     def __call__(self, *args: Any, **kwargs: Any) -> RpcPromise:
@@ -176,7 +177,7 @@ class RpcPromise:
         args_payload = RpcPayload.from_app_params(list(args))
 
         async def do_call():
-            result_hook = await self._hook.call([], args_payload)
+            result_hook = await self._hook.call((), args_payload)
             return result_hook
 
         future = asyncio.ensure_future(do_call())
@@ -193,7 +194,7 @@ class RpcPromise:
         """
 
         async def resolve():
-            payload = await self._hook.pull()
+            payload = await _maybe_await(self._hook.pull())
             return payload.value
 
         return resolve().__await__()
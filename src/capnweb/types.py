@@ -28,6 +28,17 @@ class RpcTarget(ABC):
     For advanced use cases, you can override `call()` and `get_property()`
     to implement custom dispatch logic (e.g., for backward compatibility
     with match/case dispatch patterns).
+
+    Targets whose properties are expensive to fetch one at a time (e.g.
+    backed by a database or another service) can also define
+    `async def get_property_path(self, path: list[str]) -> Any`. When
+    present, it is called once to resolve a whole property path (such as
+    `user.profile` in `user.profile.getName()`) instead of awaiting
+    `get_property()` once per segment.
+
+    An overridden `get_property()` may also be a plain (non-async) method
+    when properties are cheap to read; its result is then used directly
+    without scheduling a task.
     """
 
     async def call(self, method: str, args: list[Any]) -> Any:
@@ -8,7 +8,18 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 @dataclass(frozen=True)
@@ -24,10 +35,8 @@ class PropertyKey:
     @staticmethod
     def from_json(value: Any) -> PropertyKey:
         """Parse from JSON value."""
-        if isinstance(value, str):
-            return PropertyKey(value)
-        if isinstance(value, int):
-            return PropertyKey(value)
+        if isinstance(value, str | int):
+            return property_key(value)
         msg = f"Invalid property key: {value}"
         raise ValueError(msg)
 
@@ -160,6 +169,10 @@ class WirePipeline:
                 result.append(wire_expression_to_json(self.args, escape_arrays=True))
         return result
 
+    def to_push_message(self) -> WirePush:
+        """Wrap this expression in a push message."""
+        return WirePush(self)
+
     @staticmethod
     def from_json(arr: list[Any]) -> WirePipeline:
         """Parse from JSON array."""
@@ -456,10 +469,58 @@ class WireAbort:
 
 WireMessage = WirePush | WirePull | WireResolve | WireReject | WireRelease | WireAbort
 
+# Shared compact encoder; json.dumps() with non-default arguments would build
+# a new encoder on every call
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+@lru_cache(maxsize=1024, typed=True)
+def property_key(value: str | int) -> PropertyKey:
+    """Get the shared PropertyKey for a property name or index.
+
+    PropertyKey is frozen, and the names used on a typical RPC surface are
+    few and repeat constantly, so one instance per value is reused instead
+    of allocating a key for every path segment. The cache is typed so that
+    ``1`` and ``True`` do not share a key.
+
+    Args:
+        value: The property name or numeric index
+
+    Returns:
+        The PropertyKey for the value
+    """
+    return PropertyKey(value)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON text, with orjson when it is installed.
+
+    orjson rejects the non-standard NaN/Infinity tokens that ``json.dumps``
+    emits, so anything it cannot decode is retried with the stdlib.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps_bytes(value: Any) -> bytes:
+    """Encode a JSON value as compact UTF-8 bytes.
+
+    This always uses the stdlib encoder, even when orjson is installed:
+    orjson writes NaN and Infinity as ``null`` and encodes types the stdlib
+    rejects (UUID, Enum, datetime, dataclasses), so using it would make the
+    wire output depend on an optional package. Checking a value for those
+    cases first costs more than the stdlib's C encoder saves.
+    """
+    return _json_encode(value).encode("utf-8")
 
-def parse_wire_message(data: str) -> WireMessage:  # noqa: C901
-    """Parse a wire message from JSON string."""
-    arr = json.loads(data)
+
+def parse_wire_message(data: str | bytes) -> WireMessage:  # noqa: C901
+    """Parse a wire message from a JSON string or UTF-8 encoded bytes."""
+    arr = json_loads(data)
     if not isinstance(arr, list) or not arr:
         msg = "Wire message must be a non-empty array"
         raise ValueError(msg)
@@ -513,7 +574,7 @@ def parse_wire_message(data: str) -> WireMessage:  # noqa: C901
 
 def serialize_wire_message(msg: WireMessage) -> str:
     """Serialize a wire message to JSON string."""
-    return json.dumps(msg.to_json())
+    return json_dumps_bytes(msg.to_json()).decode("utf-8")
 
 
 def parse_wire_batch(data: str) -> list[WireMessage]:
@@ -522,6 +583,37 @@ def parse_wire_batch(data: str) -> list[WireMessage]:
     return [parse_wire_message(line) for line in lines if line.strip()]
 
 
+def parse_wire_batch_bytes(data: bytes) -> list[WireMessage]:
+    """Parse a UTF-8 encoded batch of newline-delimited wire messages.
+
+    Both ``json.loads`` and orjson decode bytes themselves, so the batch is
+    split and parsed without first decoding the whole payload to a string.
+
+    Args:
+        data: The newline-delimited JSON batch as received from a transport
+
+    Returns:
+        The parsed wire messages, in order
+    """
+    return [parse_wire_message(line) for line in data.split(b"\n") if line.strip()]
+
+
 def serialize_wire_batch(messages: list[WireMessage]) -> str:
     """Serialize a batch of wire messages to newline-delimited JSON."""
-    return "\n".join(serialize_wire_message(msg) for msg in messages)
+    return serialize_wire_batch_bytes(messages).decode("utf-8")
+
+
+def serialize_wire_batch_bytes(messages: Iterable[WireMessage]) -> bytes:
+    """Serialize wire messages straight to UTF-8 encoded NDJSON.
+
+    Unlike ``serialize_wire_batch``, this accepts any iterable so callers
+    can stream messages from a generator without materializing a list,
+    and it returns the bytes a transport sends.
+
+    Args:
+        messages: Wire messages to serialize, in order
+
+    Returns:
+        The newline-delimited JSON batch encoded as UTF-8
+    """
+    return b"\n".join(json_dumps_bytes(msg.to_json()) for msg in messages)
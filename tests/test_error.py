@@ -17,6 +17,12 @@ class TestErrorCode:
         assert str(ErrorCode.CANCELED) == "canceled"
         assert str(ErrorCode.INTERNAL) == "internal"
 
+    def test_from_wire(self) -> None:
+        """Test mapping wire error types to codes."""
+        assert ErrorCode.from_wire("not_found") is ErrorCode.NOT_FOUND
+        assert ErrorCode.from_wire("some_future_code") is ErrorCode.INTERNAL
+        assert ErrorCode.from_wire(["not", "a", "string"]) is ErrorCode.INTERNAL
+
 
 class TestRpcError:
     """Tests for RpcError."""
@@ -1,10 +1,12 @@
 """Tests for StubHook implementations - the core of capability management."""
 
 import asyncio
+import operator
 
 import pytest
 
-from capnweb.error import RpcError
+from capnweb import hooks
+from capnweb.error import ErrorCode, RpcError
 from capnweb.hooks import (
     ErrorStubHook,
     PayloadStubHook,
@@ -14,6 +16,7 @@ from capnweb.hooks import (
 )
 from capnweb.payload import RpcPayload
 from capnweb.session import RpcSession
+from capnweb.stubs import RpcPromise
 from capnweb.types import RpcTarget
 
 
@@ -83,6 +86,59 @@ class TestErrorStubHook:
         with pytest.raises(RpcError, match="Test error"):
             await hook.pull()
 
+    @pytest.mark.asyncio
+    async def test_error_hook_shared_interns_hook_not_error(self):
+        """Test that shared hooks are reused but raise a new error each pull."""
+        hook1 = ErrorStubHook.shared(ErrorCode.NOT_FOUND, "Missing")
+        hook2 = ErrorStubHook.shared(ErrorCode.NOT_FOUND, "Missing")
+        other = ErrorStubHook.shared(ErrorCode.BAD_REQUEST, "Missing")
+
+        assert hook1 is hook2
+        assert other is not hook1
+        assert other.error.code == ErrorCode.BAD_REQUEST
+
+        with pytest.raises(RpcError, match="Missing") as first:
+            await hook1.pull()
+        first.value.add_note("seen by the first caller")
+        with pytest.raises(RpcError, match="Missing") as second:
+            await hook2.pull()
+        assert second.value is not first.value
+        assert second.value.code == ErrorCode.NOT_FOUND
+        assert not getattr(second.value, "__notes__", None)
+
+    def test_formatted_failures_not_interned(self):
+        """Test that errors embedding failure details bypass the shared cache."""
+        before = hooks._shared_error_hook.cache_info().currsize
+
+        hook1 = PayloadStubHook(RpcPayload.owned({})).get(("missing",))
+        hook2 = PayloadStubHook(RpcPayload.owned({})).get(("missing",))
+
+        assert hook1 is not hook2
+        assert "missing" in hook1.error.message
+        assert hooks._shared_error_hook.cache_info().currsize == before
+
+    @pytest.mark.asyncio
+    async def test_error_hook_of_keeps_caller_error(self):
+        """Test that of() wraps the caller's own exception unchanged."""
+
+        class QuotaError(RpcError):
+            pass
+
+        cause = ValueError("over quota")
+        error = QuotaError(ErrorCode.PERMISSION_DENIED, "Denied")
+        error.__cause__ = cause
+        hook = ErrorStubHook.of(error)
+
+        assert hook.error is error
+        assert (
+            ErrorStubHook.of(QuotaError(ErrorCode.PERMISSION_DENIED, "Denied"))
+            is not hook
+        )
+        with pytest.raises(QuotaError) as raised:
+            await hook.pull()
+        assert raised.value is error
+        assert raised.value.__cause__ is cause
+
     def test_error_hook_dispose(self):
         """Test that disposing error hook does nothing."""
         error = RpcError.not_found("Test error")
@@ -208,9 +264,34 @@ class TestTargetStubHookNavigation:
         result_hook = await hook.call(["nested", "getValue"], args)
 
         assert isinstance(result_hook, PayloadStubHook)
-        result = await result_hook.pull()
+        result = result_hook.pull()
         assert result.value == "nested_value"
 
+    @pytest.mark.asyncio
+    async def test_navigate_uses_get_property_path(self):
+        """Test that a target can resolve a whole path in one call."""
+
+        class PathTarget(RpcTarget):
+            def __init__(self):
+                self.paths = []
+
+            async def get_property_path(self, path: list[str]):
+                self.paths.append(path)
+                return SimpleTarget("deep_value")
+
+            async def get_property(self, property: str):
+                msg = "get_property should not be used"
+                raise AssertionError(msg)
+
+        target = PathTarget()
+        hook = TargetStubHook(target)
+
+        result_hook = await hook.call(["a", "b", "getValue"], RpcPayload.owned([]))
+
+        assert isinstance(result_hook, PayloadStubHook)
+        assert result_hook.pull().value == "deep_value"
+        assert target.paths == [["a", "b"]]
+
     @pytest.mark.asyncio
     async def test_navigate_to_target_failure(self):
         """Test navigation failure returns error."""
@@ -313,6 +394,26 @@ class TestTargetStubHookProperty:
         assert isinstance(result_hook, ErrorStubHook)
         assert "not yet supported" in result_hook.error.message
 
+    def test_sync_get_property_resolves_immediately(self):
+        """Test that a synchronous get_property() needs no promise."""
+
+        class SyncPropertyTarget(SimpleTarget):
+            def get_property(self, property: str):  # type: ignore[override]
+                if property == "name":
+                    return "sync"
+                msg = f"Property {property} not found"
+                raise RpcError.not_found(msg)
+
+        hook = TargetStubHook(SyncPropertyTarget())
+
+        result_hook = hook.get(["name"])
+        assert isinstance(result_hook, PayloadStubHook)
+        assert result_hook.pull().value == "sync"
+
+        missing_hook = hook.get(["missing"])
+        assert isinstance(missing_hook, ErrorStubHook)
+        assert missing_hook.error.code == ErrorCode.NOT_FOUND
+
     @pytest.mark.asyncio
     async def test_pull_target_raises(self):
         """Test that pulling a target hook raises error."""
@@ -363,6 +464,22 @@ class TestTargetStubHookDisposal:
         assert hook.ref_count == 0
         assert target.disposed  # Now it should be disposed
 
+    def test_extra_dispose_is_ignored(self):
+        """Test that over-disposal never drives the refcount negative."""
+        dispose_calls = []
+
+        class CountingTarget(SimpleTarget):
+            def dispose(self):
+                dispose_calls.append(1)
+
+        hook = TargetStubHook(CountingTarget())
+
+        hook.dispose()
+        hook.dispose()
+
+        assert hook.ref_count == 0
+        assert len(dispose_calls) == 1
+
     def test_dispose_without_dispose_method(self):
         """Test disposing target without dispose method doesn't raise."""
 
@@ -401,9 +518,57 @@ class TestRpcImportHook:
         hook = RpcImportHook(session=session, import_id=1)
         args = RpcPayload.owned([])
 
-        # This will raise NotImplementedError because session doesn't implement send_pipeline_call
+        # The call is queued until the end of the event-loop turn
+        result_hook = await hook.call(["method"], args)
+        assert isinstance(result_hook, PromiseStubHook)
+        assert len(session._pending_ops) == 1
+
+        # The base session doesn't implement send_pipeline_call, so the
+        # flush fails and the result promise is rejected with that error
         with pytest.raises(NotImplementedError, match="send_pipeline_call"):
-            await hook.call(["method"], args)
+            await asyncio.wait_for(result_hook.pull(), timeout=1)
+        assert session._pending_ops == []
+        assert session._pending_promises == {}
+
+    @pytest.mark.asyncio
+    async def test_import_hook_failed_batch_rejects_every_op(self):
+        """Test that a batch that fails to send settles all of its promises."""
+        session = RpcSession()
+
+        def fail(ops):
+            msg = "transport gone"
+            raise ConnectionError(msg)
+
+        session.send_pipeline_batch = fail  # type: ignore[method-assign]
+        hook = RpcImportHook(session=session, import_id=1)
+
+        call_hook = await hook.call(["method"], RpcPayload.owned([]))
+        get_hook = hook.get(["property"])
+
+        for result_hook in (call_hook, get_hook):
+            with pytest.raises(ConnectionError, match="transport gone"):
+                await asyncio.wait_for(result_hook.pull(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_import_hook_ops_are_batched(self):
+        """Test that calls and gets made in one loop turn are sent together."""
+        session = RpcSession()
+        sent: list[list] = []
+        session.send_pipeline_batch = sent.append  # type: ignore[method-assign]
+        hook = RpcImportHook(session=session, import_id=1)
+
+        await hook.call(["method"], RpcPayload.owned([1]))
+        hook.get(["property"])
+        assert sent == []
+
+        await asyncio.sleep(0)
+
+        assert len(sent) == 1
+        call_op, get_op = sent[0]
+        assert call_op.path == ["method"]
+        assert call_op.args.value == [1]
+        assert get_op.path == ["property"]
+        assert get_op.args is None
 
     def test_import_hook_get(self):
         """Test getting property through import hook."""
@@ -438,6 +603,19 @@ class TestRpcImportHook:
         # Import should be released from session
         assert 1 not in session._imports
 
+    def test_import_hook_extra_dispose_releases_once(self):
+        """Test that disposing an import hook twice releases it only once."""
+        session = RpcSession()
+        released: list[int] = []
+        session.queue_release = released.append  # type: ignore[method-assign]
+        hook = RpcImportHook(session=session, import_id=1)
+
+        hook.dispose()
+        hook.dispose()
+
+        assert hook.ref_count == 0
+        assert released == [1]
+
     def test_import_hook_dup(self):
         """Test duplicating import hook."""
         session = RpcSession()
@@ -470,6 +648,33 @@ class TestPromiseStubHook:
 
         # The chained promise should also work (though we can't easily await it here)
 
+    @pytest.mark.asyncio
+    async def test_promise_hook_chained_call_and_get_resolve(self):
+        """Test that chained calls and gets resolve once the promise does."""
+        future: asyncio.Future = asyncio.Future()
+        hook = PromiseStubHook(future)
+
+        call_hook = await hook.call(["add"], RpcPayload.owned([2, 3]))
+        get_hook = hook.get(["name"])
+
+        payload = RpcPayload.owned({"add": operator.add, "name": "calc"})
+        future.set_result(PayloadStubHook(payload))
+
+        assert await RpcPromise(call_hook) == 5
+        assert await RpcPromise(get_hook) == "calc"
+
+    @pytest.mark.asyncio
+    async def test_promise_hook_chained_get_propagates_error(self):
+        """Test that a rejected promise rejects chained operations."""
+        future: asyncio.Future = asyncio.Future()
+        hook = PromiseStubHook(future)
+
+        get_hook = hook.get(["name"])
+        future.set_exception(RpcError.not_found("gone"))
+
+        with pytest.raises(RpcError, match="gone"):
+            await get_hook.pull()
+
     def test_promise_hook_get(self):
         """Test getting property through promise hook."""
         future: asyncio.Future = asyncio.Future()
@@ -490,8 +695,9 @@ class TestPromiseStubHook:
         resolved_hook = PayloadStubHook(payload)
         future.set_result(resolved_hook)
 
-        # Pull should return the payload
-        result = await hook.pull()
+        # Pull should return the payload without suspending
+        result = hook.pull()
+        assert isinstance(result, RpcPayload)
         assert result.value == "resolved"
 
     def test_promise_hook_dispose_not_done(self):
@@ -532,3 +738,50 @@ class TestPromiseStubHook:
 
         dup = hook.dup()
         assert dup.future is future
+
+
+class TestIsAsync:
+    """Test the cached coroutine-function check used for dispatch."""
+
+    def test_classifies_functions_and_bound_methods(self):
+        """Test that async and sync callables are told apart."""
+
+        class Service:
+            async def fetch(self):
+                return 1
+
+            def compute(self):
+                return 2
+
+        service = Service()
+
+        assert hooks._is_async(service.fetch)
+        assert hooks._is_async(service.fetch)  # Cached on the underlying function
+        assert not hooks._is_async(service.compute)
+        assert not hooks._is_async(len)
+
+    def test_handles_callables_without_weakref_support(self):
+        """Test that callables that can't be cached are still classified."""
+
+        class SlottedCallable:
+            __slots__ = ()
+
+            def __call__(self):
+                return None
+
+        assert not hooks._is_async(SlottedCallable())
+
+
+class TestMaybeAwait:
+    """Test the helper that takes a pull() result to its payload."""
+
+    @pytest.mark.asyncio
+    async def test_payload_and_awaitable(self):
+        """Test that payloads pass through and awaitables are awaited."""
+        payload = RpcPayload.owned(42)
+
+        async def later():
+            return payload
+
+        assert await hooks._maybe_await(payload) is payload
+        assert await hooks._maybe_await(later()) is payload
@@ -13,6 +13,7 @@ class TestImportId:
         import_id = ImportId.main()
         assert import_id.value == 0
         assert import_id.is_main()
+        assert ImportId.main() is import_id
 
     def test_local_id(self) -> None:
         """Test local (positive) ID detection."""
@@ -46,6 +47,7 @@ class TestExportId:
     def test_main_id(self) -> None:
         """Test main interface ID creation."""
         export_id = ExportId.main()
+        assert ExportId.main() is export_id
         assert export_id.value == 0
         assert export_id.is_main()
 
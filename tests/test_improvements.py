@@ -1,12 +1,18 @@
 """Tests for recent improvements: WireError data, stack trace redaction, etc."""
 
+import asyncio
+from unittest import mock
+
 import pytest
+from aiohttp.test_utils import make_mocked_request
 
 from capnweb.client import Client, ClientConfig
 from capnweb.error import RpcError
+from capnweb.hooks import PromiseStubHook
+from capnweb.payload import RpcPayload
 from capnweb.server import Server, ServerConfig
 from capnweb.types import RpcTarget
-from capnweb.wire import WireError
+from capnweb.wire import PropertyKey, WireError, WirePipeline, WirePull, WireReject
 
 
 class TestWireErrorEnhancements:
@@ -150,6 +156,207 @@ class TestStackTraceRedaction:
         finally:
             await server.stop()
 
+    def test_internal_error_stack_follows_config(self):
+        """Test that internal errors carry a traceback only when enabled."""
+        redacted = Server(ServerConfig(include_stack_traces=False))
+        verbose = Server(ServerConfig(include_stack_traces=True))
+
+        try:
+            msg = "boom"
+            raise ValueError(msg)
+        except ValueError:
+            hidden = redacted._internal_error()
+            shown = verbose._internal_error()
+
+        assert hidden.error_type == "internal"
+        assert hidden.stack is None
+        assert shown.error_type == "internal"
+        assert shown.message == hidden.message
+        assert "ValueError: boom" in shown.stack
+
+    def test_failure_message_follows_config(self):
+        """Test that exception details reach clients only when enabled."""
+        error = ValueError("db password rejected")
+
+        redacted = Server(ServerConfig(include_stack_traces=False))
+        verbose = Server(ServerConfig(include_stack_traces=True))
+
+        assert redacted._failure_message("Server error", error) == "Server error"
+        assert (
+            verbose._failure_message("Server error", error)
+            == "Server error: db password rejected"
+        )
+
+    def test_to_wire_reject(self):
+        """Test exception to rejection conversion for both error kinds."""
+        server = Server(ServerConfig())
+
+        reject = server._to_wire_reject(RpcError.not_found("missing", {"id": 7}), -3)
+        assert reject.export_id == -3
+        assert reject.error.error_type == "not_found"
+        assert reject.error.message == "missing"
+        assert reject.error.data == {"id": 7}
+
+        reject = server._to_wire_reject(ValueError("secret detail"), 4)
+        assert reject.export_id == 4
+        assert reject.error.error_type == "internal"
+        assert "secret detail" not in reject.error.message
+
+
+class TestPushScheduling:
+    """Tests for how pushed calls are scheduled."""
+
+    @pytest.mark.asyncio
+    async def test_finished_call_stored_without_promise(self, monkeypatch):
+        """Test that an eagerly finished call stores its result hook directly."""
+
+        class Echo(RpcTarget):
+            async def call(self, method: str, args: list) -> list:
+                return args
+
+            async def get_property(self, property: str) -> None:
+                pass
+
+        def eager_factory(loop, coro):
+            # Stand-in for asyncio.eager_task_factory on older Pythons
+            future = loop.create_future()
+            try:
+                coro.send(None)
+            except StopIteration as stop:
+                future.set_result(stop.value)
+                return future
+            coro.close()
+            msg = "call suspended"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr("capnweb.server._eager_task_factory", eager_factory)
+        server = Server(ServerConfig())
+        server.register_capability(0, Echo())
+        imports = []
+
+        expression = WirePipeline(0, [PropertyKey("echo")], [1, 2])
+        assert await server._handle_push(expression, imports) is None
+
+        assert not isinstance(imports[0], PromiseStubHook)
+        response = await server._handle_pull(1, imports)
+        assert response.value == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_independent_pushes_run_concurrently(self):
+        """Test that pushes in one batch overlap instead of running in turn."""
+        ready = asyncio.Event()
+
+        class Rendezvous(RpcTarget):
+            async def call(self, method: str, args: list) -> str:
+                if method == "wait":
+                    # Only finishes if "signal" runs while this call is pending
+                    await ready.wait()
+                else:
+                    ready.set()
+                return method
+
+            async def get_property(self, property: str) -> None:
+                pass
+
+        server = Server(ServerConfig())
+        server.register_capability(0, Rendezvous())
+        imports = []
+
+        await server._handle_push(WirePipeline(0, [PropertyKey("wait")], []), imports)
+        await server._handle_push(WirePipeline(0, [PropertyKey("signal")], []), imports)
+
+        first = await asyncio.wait_for(server._handle_pull(1, imports), timeout=1)
+        second = await asyncio.wait_for(server._handle_pull(2, imports), timeout=1)
+        assert first.value == "wait"
+        assert second.value == "signal"
+
+    @pytest.mark.asyncio
+    async def test_push_target_uses_export_lookup(self):
+        """Test that pushes resolve targets through get_export_hook."""
+
+        class Echo(RpcTarget):
+            async def call(self, method: str, args: list) -> list:
+                return args
+
+            async def get_property(self, property: str) -> None:
+                pass
+
+        class AliasingServer(Server):
+            def get_export_hook(self, export_id):
+                # Serve every unknown ID from the main capability
+                return super().get_export_hook(export_id) or super().get_export_hook(0)
+
+        server = AliasingServer(ServerConfig())
+        server.register_capability(0, Echo())
+        imports = []
+
+        await server._handle_push(WirePipeline(7, [PropertyKey("echo")], [5]), imports)
+
+        response = await server._handle_pull(1, imports)
+        assert response.value == [5]
+
+    @pytest.mark.asyncio
+    async def test_failed_push_keeps_numbering(self):
+        """Test that a rejected push still takes its import ID."""
+
+        class Echo(RpcTarget):
+            async def call(self, method: str, args: list) -> list:
+                return args
+
+            async def get_property(self, property: str) -> None:
+                pass
+
+        server = Server(ServerConfig())
+        server.register_capability(0, Echo())
+        imports = []
+
+        reject = await server._handle_push(
+            WirePipeline(99, [PropertyKey("echo")], []), imports
+        )
+        assert reject.export_id == -1
+        await server._handle_push(WirePipeline(0, [PropertyKey("echo")], [7]), imports)
+
+        response = await server._handle_pull(2, imports)
+        assert response.value == [7]
+        for import_id in (0, -1, 3):
+            response = await server._handle_pull(import_id, imports)
+            assert response.error.error_type == "not_found"
+
+
+class TestBatchStreaming:
+    """Tests for streamed HTTP batch responses."""
+
+    @pytest.mark.asyncio
+    async def test_failed_abort_write_keeps_prepared_response(self):
+        """Test that a client gone mid-stream doesn't get a second response."""
+        server = Server(ServerConfig())
+
+        async def pull(msg, imports):
+            if msg.import_id == 3:
+                error = "boom"
+                raise RuntimeError(error)
+            return WireReject(msg.import_id, WireError("not_found", "missing"))
+
+        server._batch_dispatch = {WirePull: pull}
+
+        # The first two lines go out, then the client disconnects
+        writer = mock.Mock()
+        writer.write_headers = mock.AsyncMock()
+        writer.drain = mock.AsyncMock()
+        writer.write = mock.AsyncMock(
+            side_effect=[None, None, ConnectionResetError("gone")]
+        )
+        writer.write_eof = mock.AsyncMock(side_effect=ConnectionResetError("gone"))
+        request = make_mocked_request("POST", "/rpc/batch", writer=writer)
+
+        response = await server._stream_batch(
+            request, [WirePull(1), WirePull(2), WirePull(3)]
+        )
+
+        assert response.prepared
+        assert writer.write.await_count == 3
+        writer.write_eof.assert_awaited_once()
+
 
 class TestTransportAbstraction:
     """Tests for client using transport abstraction."""
@@ -170,6 +377,58 @@ class TestTransportAbstraction:
         # After exiting, transport should be closed
         assert client._transport is None
 
+    @pytest.mark.asyncio
+    async def test_close_sends_queued_releases(self):
+        """Test that releases still waiting for their delay are sent on close."""
+        sent: list[bytes] = []
+
+        class RecordingTransport:
+            async def send_and_receive(self, data: bytes) -> bytes:
+                sent.append(data)
+                return b""
+
+            async def close(self) -> None:
+                pass
+
+        client = Client(ClientConfig(url="http://localhost:1/rpc/batch"))
+        client.release_delay = 60
+        client._transport = RecordingTransport()
+        client.import_capability(3).dispose()
+
+        await client.close()
+
+        assert sent == [b'["release",3,1]']
+        assert client._release_handle is None
+        assert client._transport is None
+
+    @pytest.mark.asyncio
+    async def test_pipelined_calls_rejected_when_send_fails(self):
+        """Test that a failed or unanswered batch rejects every queued call."""
+
+        class FailingTransport:
+            async def send_and_receive(self, data: bytes) -> bytes:
+                msg = "connection reset"
+                raise OSError(msg)
+
+        class SilentTransport:
+            async def send_and_receive(self, data: bytes) -> bytes:
+                return b""
+
+        for transport, message in (
+            (FailingTransport(), "Transport error: connection reset"),
+            (SilentTransport(), "No response for pipelined call"),
+        ):
+            client = Client(ClientConfig(url="http://localhost:1/rpc/batch"))
+            client._transport = transport
+            root = client.import_capability(0)
+
+            first = await root.call(("a",), RpcPayload.owned([]))
+            second = await root.call(("b",), RpcPayload.owned([]))
+
+            for hook in (first, second):
+                with pytest.raises(RpcError, match=message):
+                    await asyncio.wait_for(hook.pull(), timeout=1)
+
     def test_client_config_stores_url(self):
         """Test that client config properly stores URL."""
         config = ClientConfig(url="ws://localhost:8080/rpc/ws", timeout=60.0)
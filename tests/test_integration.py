@@ -3,9 +3,13 @@
 import asyncio
 from typing import Any
 
+import aiohttp
 import pytest
 
 from capnweb import Client, ClientConfig, RpcError, RpcTarget, Server, ServerConfig
+from capnweb.hooks import TargetStubHook
+from capnweb.payload import RpcPayload
+from capnweb.stubs import RpcStub
 
 
 class Calculator(RpcTarget):
@@ -508,6 +512,64 @@ class TestServerConfiguration:
         finally:
             await server.stop()
 
+    async def test_batch_response_is_ndjson(self, server: Server) -> None:
+        """Test the streamed batch body is newline-separated, with no trailer."""
+        body = "\n".join([
+            '["push",["pipeline",0,["add"],[1,2]]]',
+            '["push",["pipeline",0,["multiply"],[3,4]]]',
+            '["pull",1]',
+            '["pull",2]',
+        ])
+
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                "http://127.0.0.1:18080/rpc/batch", data=body
+            ) as response:
+                assert response.status == 200
+                assert response.content_type == "application/x-ndjson"
+                text = await response.text()
+
+            assert text == '["resolve",1,3]\n["resolve",2,12]'
+
+            # A batch with no replies still gets an empty 204
+            async with session.post(
+                "http://127.0.0.1:18080/rpc/batch", data='["release",5,1]'
+            ) as response:
+                assert response.status == 204
+
+    async def test_oversized_batch_is_aborted(self, server: Server) -> None:
+        """Test a batch over max_batch_size is rejected with the same abort."""
+        size = server.config.max_batch_size + 1
+        body = "\n".join(f'["pull",{i}]' for i in range(1, size + 1))
+
+        async with aiohttp.ClientSession() as session:
+            for _ in range(2):
+                async with session.post(
+                    "http://127.0.0.1:18080/rpc/batch", data=body
+                ) as response:
+                    assert response.status == 400
+                    text = await response.text()
+                assert text == f'["abort","Batch size {size} exceeds maximum"]'
+
+    async def test_websocket_replies_in_frame_type(self, server: Server) -> None:
+        """Test text and binary WebSocket frames get replies of the same type."""
+        batch = '["push",["pipeline",0,["add"],[1,2]]]\n["pull",1]'
+
+        async with (
+            aiohttp.ClientSession() as session,
+            session.ws_connect("http://127.0.0.1:18080/rpc/ws") as ws,
+        ):
+            await ws.send_str(batch)
+            reply = await ws.receive()
+            assert reply.type == aiohttp.WSMsgType.TEXT
+            assert reply.data == '["resolve",1,3]'
+
+            # Push IDs continue across frames of the same connection
+            await ws.send_bytes(b'["push",["pipeline",0,["add"],[3,4]]]\n["pull",2]')
+            reply = await ws.receive()
+            assert reply.type == aiohttp.WSMsgType.BINARY
+            assert reply.data == b'["resolve",2,7]'
+
 
 @pytest.mark.asyncio
 class TestCapabilityManagement:
@@ -674,3 +736,53 @@ class TestClientStubCreation:
             await client.close()
         finally:
             await server.stop()
+
+
+@pytest.mark.asyncio
+class TestPipelinedImportCalls:
+    """Test calls made on imported capabilities in the same loop turn."""
+
+    async def test_calls_in_one_turn_reach_the_capability(self) -> None:
+        """Test that batched calls run on their target, not on earlier pushes."""
+        calls: list[str] = []
+
+        class Item(RpcTarget):
+            async def call(self, method: str, args: list[Any]) -> Any:
+                calls.append(method)
+                return method
+
+            async def get_property(self, property: str) -> Any:
+                return property
+
+        class Factory(RpcTarget):
+            async def call(self, method: str, args: list[Any]) -> Any:
+                return RpcStub(TargetStubHook(Item()))
+
+            async def get_property(self, property: str) -> Any:
+                return None
+
+        config = ServerConfig(host="127.0.0.1", port=18109)
+        server = Server(config)
+        server.register_capability(0, Factory())
+        await server.start()
+
+        try:
+            client_config = ClientConfig(
+                url="http://127.0.0.1:18109/rpc/batch", timeout=5.0
+            )
+            async with Client(client_config) as client:
+                root = client.import_capability(0)
+                made = await root.call(("make",), RpcPayload.owned([]))
+                item = (await made.pull()).value
+
+                # Issued in the same loop turn, so sent together
+                first = await item._hook.call(("a",), RpcPayload.owned([]))
+                second = await item._hook.call(("b",), RpcPayload.owned([]))
+                results = await asyncio.wait_for(
+                    asyncio.gather(first.pull(), second.pull()), timeout=5
+                )
+
+            assert [r.value for r in results] == ["a", "b"]
+            assert calls == ["a", "b"]
+        finally:
+            await server.stop()
@@ -1,5 +1,8 @@
 """Tests for Parser - wire format to Python object conversion."""
 
+import sys
+from collections import OrderedDict
+
 import pytest
 
 from capnweb.error import ErrorCode
@@ -391,6 +394,45 @@ class TestParseEdgeCases:
         assert isinstance(nested_cap, RpcStub)
         assert result.value["level1"]["level2"]["level3"]["level4"]["value"] == 42
 
+    def test_parse_nesting_beyond_recursion_limit(self):
+        """Test that nesting depth is not bounded by the recursion limit."""
+        session = RpcSession()
+        parser = Parser(importer=session)
+
+        depth = sys.getrecursionlimit() * 2
+        wire_value: list = [["export", 7]]
+        for _ in range(depth):
+            wire_value = [wire_value]
+        result = parser.parse(wire_value)
+
+        node = result.value
+        for _ in range(depth):
+            node = node[0]
+        assert isinstance(node[0], RpcStub)
+
+    def test_parse_container_subclasses(self):
+        """Test that dict subclasses are still walked."""
+        session = RpcSession()
+        parser = Parser(importer=session)
+
+        wire_value = OrderedDict(nested=OrderedDict(cap=["export", 1]), value=2)
+        result = parser.parse(wire_value)
+
+        assert isinstance(result.value["nested"]["cap"], RpcStub)
+        assert result.value["value"] == 2
+
+    def test_parse_many(self):
+        """Test parsing several wire values into separate payloads."""
+        session = RpcSession()
+        parser = Parser(importer=session)
+
+        results = parser.parse_many([1, ["export", 3], {"a": [1, 2]}])
+
+        assert all(isinstance(result, RpcPayload) for result in results)
+        assert results[0].value == 1
+        assert isinstance(results[1].value, RpcStub)
+        assert results[2].value == {"a": [1, 2]}
+
     def test_parse_payload_value_method(self):
         """Test the convenience parse_payload_value method."""
         session = RpcSession()
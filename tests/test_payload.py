@@ -1,10 +1,12 @@
 """Tests for RpcPayload - ownership semantics and resource tracking."""
 
 import copy
+import sys
 from dataclasses import dataclass
+from typing import NamedTuple
 
 from capnweb.hooks import PayloadStubHook
-from capnweb.payload import PayloadSource, RpcPayload
+from capnweb.payload import PayloadSource, RpcPayload, register_payload_cloner
 from capnweb.session import RpcSession
 from capnweb.stubs import RpcPromise, RpcStub
 
@@ -84,6 +86,62 @@ class TestPayloadEnsureDeepCopied:
         assert payload.value is original
         assert payload.source == PayloadSource.OWNED
 
+    def test_pure_data_payload_allocates_no_tracking_lists(self):
+        """Test that payloads without references keep the empty tuples."""
+        payload = RpcPayload.from_app_params({"data": [1, {"nested": "x"}]})
+
+        payload.ensure_deep_copied()
+        payload.dispose()
+
+        assert payload.stubs == ()
+        assert payload.promises == ()
+
+    def test_immutable_payload_shared_without_copy(self):
+        """Test that IMMUTABLE payloads are owned without copying."""
+        original = (1, ("nested", 2.5))
+        payload = RpcPayload.from_app_params_immutable(original)
+        assert payload.source == PayloadSource.IMMUTABLE
+
+        payload.ensure_deep_copied()
+
+        assert payload.value is original
+        assert payload.source == PayloadSource.OWNED
+
+    def test_deeply_immutable_params_not_copied(self):
+        """Test that deeply immutable PARAMS values are shared."""
+
+        @dataclass(frozen=True)
+        class Point:
+            x: int
+            tags: frozenset
+
+        point = Point(1, frozenset({"a"}))
+        shared = RpcPayload.from_app_params((point, (1, 2)))
+        shared.ensure_deep_copied()
+
+        nested = RpcPayload.from_app_params([point, (1, 2)])
+        nested.ensure_deep_copied()
+
+        assert shared.value[0] is point
+        assert nested.value[0] is point
+        assert nested.value[1] == (1, 2)
+
+    def test_frozen_params_with_mutable_contents_copied(self):
+        """Test that frozen containers holding mutable data are still copied."""
+
+        @dataclass(frozen=True)
+        class Box:
+            items: list
+
+        box = Box([1, 2])
+        payload = RpcPayload.from_app_params((box,))
+
+        payload.ensure_deep_copied()
+
+        assert payload.value[0] is not box
+        assert payload.value[0].items is not box.items
+        assert payload.value[0] == box
+
     def test_ensure_deep_copied_idempotent(self):
         """Test that ensure_deep_copied can be called multiple times."""
         original = {"data": "test"}
@@ -205,6 +263,134 @@ class TestPayloadDeepCopyTracking:
         # Should return the same object (fallback behavior)
         assert payload.value["obj"] is obj
 
+    def test_deep_copy_registered_cloner(self):
+        """Test that a registered cloner replaces copy.deepcopy for its type."""
+
+        class Point:
+            __slots__ = ("items", "x")
+
+            def __init__(self, x, items):
+                self.x = x
+                self.items = items
+
+            def __deepcopy__(self, memo):
+                msg = "deepcopy should not be used"
+                raise AssertionError(msg)
+
+        @register_payload_cloner(Point)
+        def clone_point(point, payload):
+            return Point(point.x, payload._deep_copy_and_track(point.items))
+
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("data")))
+        original = Point(1, [stub])
+        payload = RpcPayload.from_app_params([original])
+
+        payload.ensure_deep_copied()
+
+        copied = payload.value[0]
+        assert copied is not original
+        assert copied.x == 1
+        assert copied.items is not original.items
+        assert payload.stubs == [copied.items[0]]
+
+    def test_deep_copy_plain_instance_tracks_stubs(self):
+        """Test that plain instances are cloned and their stubs tracked."""
+
+        @dataclass
+        class Holder:
+            items: list
+            stub: RpcStub
+
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("inner")))
+        obj = Holder([1, 2], stub)
+        payload = RpcPayload.from_app_params(obj)
+
+        payload.ensure_deep_copied()
+
+        assert payload.value is not obj
+        assert payload.value.items == [1, 2]
+        assert payload.value.items is not obj.items
+        assert payload.value.stub is not stub
+        assert payload.stubs == [payload.value.stub]
+
+    def test_deep_copy_self_referencing_instance(self):
+        """Test that reference cycles through attributes are preserved."""
+
+        @dataclass
+        class Node:
+            parent: object = None
+
+        obj = Node()
+        obj.parent = obj
+        payload = RpcPayload.from_app_params(obj)
+
+        payload.ensure_deep_copied()
+
+        assert payload.value is not obj
+        assert payload.value.parent is payload.value
+
+    def test_deep_copy_cyclic_containers(self):
+        """Test that lists and dicts referencing themselves are copied once."""
+        cyclic_list: list = [1]
+        cyclic_list.append(cyclic_list)
+        cyclic_dict: dict = {"n": 1}
+        cyclic_dict["self"] = cyclic_dict
+        payload = RpcPayload.from_app_params([cyclic_list, cyclic_dict])
+
+        payload.ensure_deep_copied()
+
+        copied_list, copied_dict = payload.value
+        assert copied_list is not cyclic_list
+        assert copied_list[1] is copied_list
+        assert copied_dict is not cyclic_dict
+        assert copied_dict["self"] is copied_dict
+
+    def test_deep_copy_builtin_collections(self):
+        """Test copying tuples, sets and frozensets, including subclasses."""
+
+        class Point(NamedTuple):
+            x: int
+            y: list
+
+        point = Point(1, [2])
+        original = {"tuple": (1, [2]), "set": {1, 2}, "frozen": frozenset({3})}
+        original["point"] = point
+        payload = RpcPayload.from_app_params(original)
+
+        payload.ensure_deep_copied()
+
+        assert payload.value == original
+        assert payload.value["tuple"][1] is not original["tuple"][1]
+        assert payload.value["set"] is not original["set"]
+        assert type(payload.value["point"]) is type(point)
+        assert payload.value["point"].y is not point.y
+
+    def test_deep_copy_beyond_recursion_limit(self):
+        """Test that nesting depth is not bounded by the recursion limit."""
+        depth = sys.getrecursionlimit() * 2
+        original: list = [1]
+        for _ in range(depth):
+            original = [original]
+        payload = RpcPayload.from_app_params(original)
+
+        payload.ensure_deep_copied()
+
+        copied, node = payload.value, original
+        for _ in range(depth):
+            assert copied is not node
+            copied, node = copied[0], node[0]
+        assert copied == [1]
+
+    def test_deep_copy_tracks_stubs_in_order(self):
+        """Test that stubs are tracked in the order they appear."""
+        stubs = [RpcStub(PayloadStubHook(RpcPayload.owned(i))) for i in range(3)]
+        payload = RpcPayload.from_app_params([stubs[0], {"a": stubs[1]}, stubs[2]])
+
+        payload.ensure_deep_copied()
+
+        value = payload.value
+        assert payload.stubs == [value[0], value[1]["a"], value[2]]
+
 
 class TestPayloadTrackReferences:
     """Test tracking references in RETURN payloads."""
@@ -270,6 +456,45 @@ class TestPayloadTrackReferences:
         assert len(payload.stubs) == 2  # stub appears twice
         assert len(payload.promises) == 2  # promise appears twice
 
+    def test_track_primitive_containers_beside_stub(self):
+        """Test that all-primitive containers are skipped without hiding stubs."""
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("stub_data")))
+
+        payload = RpcPayload.from_app_return({
+            "numbers": [1, 2.5, None],
+            "meta": {"name": "x", "ok": True},
+            "items": [{"id": 1}, {"id": 2, "stub": stub}],
+        })
+        payload.ensure_deep_copied()
+
+        assert payload.stubs == [stub]
+        assert not payload.promises
+
+    def test_track_cyclic_containers(self):
+        """Test that self-referencing returns are scanned once and terminate."""
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("stub_data")))
+        value: dict = {"stub": stub}
+        value["self"] = value
+        value["items"] = [value, stub]
+
+        payload = RpcPayload.from_app_return(value)
+        payload.ensure_deep_copied()
+
+        assert payload.value is value
+        assert payload.stubs == [stub, stub]
+
+    def test_track_beyond_recursion_limit_in_order(self):
+        """Test tracking deep returns without recursion, preserving order."""
+        stubs = [RpcStub(PayloadStubHook(RpcPayload.owned(i))) for i in range(3)]
+        value: list = [stubs[2]]
+        for _ in range(sys.getrecursionlimit() * 2):
+            value = [value]
+
+        payload = RpcPayload.from_app_return([stubs[0], {"a": stubs[1]}, value])
+        payload.ensure_deep_copied()
+
+        assert payload.stubs == stubs
+
 
 class TestPayloadDispose:
     """Test payload disposal."""
@@ -348,3 +573,24 @@ class TestPayloadRepr:
         assert "RpcPayload" in repr_str
         assert "RETURN" in repr_str
         assert "value" in repr_str
+
+
+class TestPayloadInterning:
+    """Test interning of owned payloads for common constants."""
+
+    def test_common_constants_share_a_payload(self):
+        """Test that owned payloads of common constants are shared."""
+        assert RpcPayload.owned(None) is RpcPayload.owned(None)
+        assert RpcPayload.owned(42) is RpcPayload.owned(42)
+        assert RpcPayload.owned("ok") is RpcPayload.owned("ok")
+
+    def test_equal_values_of_different_types_stay_distinct(self):
+        """Test that True, 1 and 1.0 don't share a payload."""
+        assert RpcPayload.owned(True).value is True
+        assert type(RpcPayload.owned(1).value) is int
+        assert type(RpcPayload.owned(1.0).value) is float
+
+    def test_other_values_get_fresh_payloads(self):
+        """Test that containers and uncommon values are not interned."""
+        assert RpcPayload.owned([]) is not RpcPayload.owned([])
+        assert RpcPayload.owned(10_000) is not RpcPayload.owned(10_000)
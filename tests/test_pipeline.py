@@ -7,9 +7,11 @@ import pytest
 
 from capnweb.client import Client, ClientConfig
 from capnweb.error import RpcError
-from capnweb.pipeline import PipelinePromise
+from capnweb.ids import ImportId
+from capnweb.pipeline import PendingCall, PipelinePromise
 from capnweb.server import Server, ServerConfig
 from capnweb.types import RpcTarget
+from capnweb.wire import PropertyKey, WirePipeline, WirePush
 
 
 class UserService(RpcTarget):
@@ -207,10 +209,55 @@ class TestPipelineBatch:
         finally:
             await server.stop()
 
+    async def test_concurrent_awaiters_share_one_round_trip(self) -> None:
+        """Test that racing awaiters share a single send, even if one is cancelled."""
+        sent: list[bytes] = []
+        release = asyncio.Event()
+
+        class SlowTransport:
+            async def send_and_receive(self, data: bytes) -> bytes:
+                sent.append(data)
+                await release.wait()
+                return b'["resolve", 1, "a"]\n["resolve", 2, "b"]'
+
+        client = Client(ClientConfig(url="http://127.0.0.1:1/rpc/batch"))
+        client._transport = SlowTransport()  # type: ignore[assignment]
+        batch = client.pipeline()
+        first = batch.call(0, "first", [])
+        second = batch.call(0, "second", [])
+
+        cancelled = asyncio.ensure_future(first)
+        waiters = asyncio.gather(first, second)
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        release.set()
+
+        assert await waiters == ["a", "b"]
+        assert len(sent) == 1
+
 
 class TestPipelinePromise:
     """Tests for PipelinePromise class."""
 
+    def test_pending_call_to_push_message(self) -> None:
+        """Test that a pending call pushes a pipeline through its path."""
+        call = PendingCall(ImportId(1), 0, "getName", [1], property_path=["user"])
+
+        assert call.to_push_message() == WirePush(
+            WirePipeline(0, [PropertyKey("user"), PropertyKey("getName")], [1])
+        )
+
+    def test_repeated_property_access_reuses_promise(self) -> None:
+        """Test that accessing the same property twice shares one import."""
+        client = Client(ClientConfig(url="http://127.0.0.1:1/rpc/batch"))
+        batch = client.pipeline()
+        user = batch.call(0, "authenticate", ["token-123"])
+
+        assert user.id is user.id
+        assert user.name is not user.id
+        # One import for the call plus one per distinct property
+        assert len(batch._pending_items) == 3
+
     async def test_promise_property_access(self) -> None:
         """Test property access on pipeline promises."""
         config = ServerConfig(host="127.0.0.1", port=18105)
@@ -242,8 +242,8 @@ class TestAsyncCallableSupport:
         # Should return a PayloadStubHook directly (not async)
         assert isinstance(result_hook, PayloadStubHook)
 
-        # Pull the result
-        result_payload = await result_hook.pull()
+        # Pull the result - already resolved, so no await needed
+        result_payload = result_hook.pull()
         assert result_payload.value == 8
 
 
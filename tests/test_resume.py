@@ -148,6 +148,10 @@ class TestResumeTokenManager:
         assert restored_imports == imports
         assert restored_exports == exports
 
+        # The restored tables are read-only views of the stored snapshot
+        with pytest.raises(TypeError):
+            restored_imports[3] = "import3"  # type: ignore[index]
+
     def test_invalidate_token(self) -> None:
         """Test token invalidation."""
         manager = ResumeTokenManager()
@@ -178,6 +182,23 @@ class TestResumeTokenManager:
         assert not manager.validate_token(token1)
         assert not manager.validate_token(token2)
 
+    def test_cleanup_expired_mixed_ttls(self) -> None:
+        """Test cleanup removes only expired sessions when TTLs differ."""
+        manager = ResumeTokenManager(default_ttl=3600.0)
+
+        long_lived = manager.create_token(imports={}, exports={})
+        short1 = manager.create_token(imports={}, exports={}, ttl=0.1)
+        short2 = manager.create_token(imports={}, exports={}, ttl=0.1)
+        manager.invalidate_token(short2.session_id)
+
+        time.sleep(0.2)
+
+        # The invalidated session is not counted again
+        assert manager.cleanup_expired() == 1
+        assert not manager.validate_token(short1)
+        assert manager.validate_token(long_lived)
+        assert manager.cleanup_expired() == 0
+
     def test_custom_ttl(self) -> None:
         """Test custom TTL for tokens."""
         manager = ResumeTokenManager(default_ttl=7200.0)
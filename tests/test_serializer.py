@@ -1,5 +1,9 @@
 """Tests for Serializer - Python object to wire format conversion."""
 
+import sys
+
+import pytest
+
 from capnweb.error import ErrorCode, RpcError
 from capnweb.hooks import PayloadStubHook
 from capnweb.payload import RpcPayload
@@ -301,6 +305,93 @@ class TestSerializeEdgeCases:
         result = serializer.serialize(data)
         assert result == data
 
+    def test_serialize_beyond_recursion_limit(self):
+        """Test that nesting depth is not bounded by the recursion limit."""
+        serializer = Serializer(exporter=RpcSession())
+        depth = sys.getrecursionlimit() * 2
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("data")))
+        data: list = [stub]
+        for _ in range(depth):
+            data = [data]
+
+        result = serializer.serialize(data)
+
+        for _ in range(depth):
+            assert result is not data
+            result, data = result[0], data[0]
+        assert result == [["export", 1]]
+
+    def test_serialize_cycle_raises(self):
+        """Test that a container inside itself is rejected, not walked forever."""
+        serializer = Serializer(exporter=RpcSession())
+        data: list = [object()]
+        data.append(data)
+
+        with pytest.raises(ValueError, match="Circular reference"):
+            serializer.serialize(data)
+
+    def test_serialize_shared_container_is_not_a_cycle(self):
+        """Test that a container reached twice without nesting is allowed."""
+        serializer = Serializer(exporter=RpcSession())
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("data")))
+        shared = [stub]
+
+        result = serializer.serialize({"a": shared, "b": shared})
+
+        assert result["a"][0][0] == "export"
+        assert result["b"][0][0] == "export"
+
+    def test_serialize_pure_json_shared(self):
+        """Test that containers of only scalars are passed through uncopied."""
+        serializer = Serializer(exporter=RpcSession())
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("data")))
+        numbers = [1, 2.5, None]
+        data = {"numbers": numbers, "stub": stub}
+
+        result = serializer.serialize(data)
+
+        assert result is not data
+        assert result["numbers"] is numbers
+        assert result["stub"] == ["export", 1]
+
+    def test_serialize_copies_only_changed_path(self):
+        """Test that only containers leading to a replaced value are copied."""
+        serializer = Serializer(exporter=RpcSession())
+        stub = RpcStub(PayloadStubHook(RpcPayload.owned("data")))
+        rows = [[i, {"name": str(i)}] for i in range(3)]
+        data = {"rows": rows, "meta": {"tags": ["a"]}, "call": [{"target": stub}]}
+
+        result = serializer.serialize(data)
+
+        assert result is not data
+        assert result["rows"] is rows
+        assert result["meta"] is data["meta"]
+        assert result["call"] is not data["call"]
+        assert result["call"] == [{"target": ["export", 1]}]
+        # The input is left untouched
+        assert data["call"][0]["target"] is stub
+
+    def test_serialize_pure_json_returned_as_is(self):
+        """Test that a value with nothing to replace is not copied at all."""
+        serializer = Serializer(exporter=RpcSession())
+        data = {"a": [1, {"b": [2, 3]}], "c": {"d": None}}
+
+        assert serializer.serialize(data) is data
+
+    def test_serialize_exports_in_order(self):
+        """Test that capabilities are exported in depth-first order."""
+        session = RpcSession()
+        serializer = Serializer(exporter=session)
+        stubs = [RpcStub(PayloadStubHook(RpcPayload.owned(i))) for i in range(3)]
+
+        result = serializer.serialize([stubs[0], {"a": [stubs[1]]}, stubs[2]])
+
+        assert [result[0], result[1]["a"][0], result[2]] == [
+            ["export", 1],
+            ["export", 2],
+            ["export", 3],
+        ]
+
     def test_serialize_mixed_stubs_and_data(self):
         """Test serializing mix of stubs, promises, and plain data."""
         session = RpcSession()
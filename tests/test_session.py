@@ -7,7 +7,7 @@ import pytest
 from capnweb.error import RpcError
 from capnweb.hooks import PayloadStubHook, PromiseStubHook, TargetStubHook
 from capnweb.payload import RpcPayload
-from capnweb.session import RpcSession
+from capnweb.session import PendingPipelineOp, RpcSession
 from capnweb.stubs import RpcPromise, RpcStub
 from capnweb.types import RpcTarget
 
@@ -216,7 +216,7 @@ class TestPromiseManagement:
 
         # Verify it resolved
         assert 1 not in session._pending_promises
-        resolved = await hook.pull()
+        resolved = hook.pull()
         assert resolved.value == {"result": "success"}
 
     @pytest.mark.asyncio
@@ -234,7 +234,7 @@ class TestPromiseManagement:
         session.resolve_promise(1, PayloadStubHook(payload2))
 
         # Should have first result
-        resolved = await hook.pull()
+        resolved = hook.pull()
         assert resolved.value == {"result": "first"}
 
     @pytest.mark.asyncio
@@ -284,6 +284,48 @@ class TestPromiseManagement:
         assert 5 in session._pending_promises
         assert session._pending_promises[5] is future
 
+    @pytest.mark.asyncio
+    async def test_create_pending_import(self):
+        """Test allocating a result import ID with a registered future."""
+        session = RpcSession()
+
+        id1, future1 = session.create_pending_import()
+        id2, future2 = session.create_pending_import()
+
+        assert (id1, id2) == (1, 2)
+        assert session._pending_promises[id1] is future1
+        assert session._pending_promises[id2] is future2
+        assert future1.get_loop() is asyncio.get_running_loop()
+
+
+class TestPipelineBatch:
+    """Test the default pipelined batch sending."""
+
+    @pytest.mark.asyncio
+    async def test_failed_op_does_not_stop_the_batch(self):
+        """Test that one failing operation is rejected and the rest are sent."""
+        session = RpcSession()
+        sent: list[int] = []
+
+        def send_pipeline_call(import_id, path, args, result_import_id):
+            if path == ("bad",):
+                msg = "cannot serialize"
+                raise ValueError(msg)
+            sent.append(result_import_id)
+
+        session.send_pipeline_call = send_pipeline_call  # type: ignore[method-assign]
+        bad_id, bad_future = session.create_pending_import()
+        good_id, good_future = session.create_pending_import()
+
+        session.send_pipeline_batch([
+            PendingPipelineOp(1, ("bad",), RpcPayload.owned([]), bad_id),
+            PendingPipelineOp(1, ("good",), RpcPayload.owned([]), good_id),
+        ])
+
+        assert sent == [good_id]
+        assert isinstance(bad_future.exception(), ValueError)
+        assert not good_future.done()
+
 
 class TestReleaseManagement:
     """Test import/export release functionality."""
@@ -300,6 +342,94 @@ class TestReleaseManagement:
         session.release_import(1)
         assert 1 not in session._imports
 
+    @pytest.mark.asyncio
+    async def test_queued_releases_are_coalesced(self):
+        """Test that releases queued in one loop turn are sent together."""
+        session = RpcSession()
+        sent: list[list[int]] = []
+        session._send_release_messages = sent.append  # type: ignore[method-assign]
+
+        session.import_capability(1).dispose()
+        session.import_capability(2).dispose()
+
+        # The imports are dropped at once; only the messages wait for the
+        # event loop to get a turn
+        assert 1 not in session._imports
+        assert 2 not in session._imports
+        assert sent == []
+
+        await asyncio.sleep(0)
+
+        assert sent == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_reexport_while_release_is_queued(self):
+        """Test that an ID exported again before the flush gets a live hook."""
+        session = RpcSession()
+        sent: list[list[int]] = []
+        session._send_release_messages = sent.append  # type: ignore[method-assign]
+
+        old_hook = session.import_capability(1)
+        old_hook.dispose()
+        new_hook = session.import_capability(1)
+
+        assert new_hook is not old_hook
+        assert new_hook.ref_count == 1
+
+        await asyncio.sleep(0)
+
+        assert sent == [[1]]
+        assert session._imports[1] is new_hook
+
+    @pytest.mark.asyncio
+    async def test_release_delay_widens_coalescing_window(self):
+        """Test that release_delay batches releases across loop turns."""
+        session = RpcSession()
+        session.release_delay = 0.01
+        sent: list[list[int]] = []
+        session._send_release_messages = sent.append  # type: ignore[method-assign]
+
+        session.import_capability(1).dispose()
+        await asyncio.sleep(0)
+        session.import_capability(2).dispose()
+
+        assert sent == []
+        await asyncio.sleep(0.02)
+        assert sent == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_early_flush_cancels_delayed_flush(self):
+        """Test that flushing before the delay ends cancels the timer."""
+        session = RpcSession()
+        session.release_delay = 60
+        sent: list[list[int]] = []
+        session._send_release_messages = sent.append  # type: ignore[method-assign]
+
+        session.import_capability(1).dispose()
+        handle = session._release_handle
+        session._flush_releases()
+
+        assert sent == [[1]]
+        assert handle.cancelled()
+        assert session._release_handle is None
+
+    def test_hold_releases_sends_one_frame_for_a_payload(self):
+        """Test that disposing a payload inside hold_releases sends one frame."""
+        session = RpcSession()
+        sent: list[list[int]] = []
+        session._send_release_messages = sent.append  # type: ignore[method-assign]
+        payload = RpcPayload.from_app_return([
+            RpcStub(session.import_capability(i)) for i in (1, 2, 3)
+        ])
+        payload.ensure_deep_copied()
+
+        with session.hold_releases():
+            with session.hold_releases():
+                payload.dispose()
+            assert sent == []
+
+        assert sent == [[1, 2, 3]]
+
     def test_release_nonexistent_import(self):
         """Test releasing a non-existent import does nothing."""
         session = RpcSession()
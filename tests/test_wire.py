@@ -1,6 +1,7 @@
 """Tests for wire protocol implementation."""
 
 import math
+import uuid
 
 import pytest
 
@@ -18,9 +19,13 @@ from capnweb.wire import (
     WireReject,
     WireRelease,
     WireResolve,
+    json_dumps_bytes,
     parse_wire_batch,
+    parse_wire_batch_bytes,
     parse_wire_message,
+    property_key,
     serialize_wire_batch,
+    serialize_wire_batch_bytes,
     wire_expression_to_json,
 )
 
@@ -55,6 +60,13 @@ class TestPropertyKey:
         with pytest.raises(ValueError):
             PropertyKey.from_json([1, 2, 3])
 
+    def test_from_json_interned(self) -> None:
+        """Test that parsed keys are shared per value and type."""
+        assert PropertyKey.from_json("name") is PropertyKey.from_json("name")
+        assert PropertyKey.from_json(1) is property_key(1)
+        assert property_key(True).value is True
+        assert property_key(1) is not property_key(True)
+
 
 class TestWireExpressions:
     """Tests for wire expression types."""
@@ -144,6 +156,11 @@ class TestWireMessages:
         json_arr = release.to_json()
         assert json_arr == ["release", 42, 3]
 
+    def test_wire_types_have_no_subclasses(self) -> None:
+        """Test that dispatch on exact wire types cannot miss a subclass."""
+        for wire_type in (WirePipeline, WirePush, WirePull, WireRelease):
+            assert wire_type.__subclasses__() == []
+
 
 class TestWireExpressionConversion:
     """Tests for wire expression conversion."""
@@ -237,6 +254,41 @@ class TestBatchOperations:
         assert "pull" in lines[1]
         assert "release" in lines[2]
 
+    def test_serialize_batch_bytes_from_generator(self) -> None:
+        """Test streaming a batch of messages straight to bytes."""
+        messages: list[WireMessage] = [WirePush("h\u00e9llo"), WirePull(42)]
+        result = serialize_wire_batch_bytes(msg for msg in messages)
+
+        assert result.count(b"\n") == 1
+        assert parse_wire_batch_bytes(result) == messages
+
+    def test_batch_bytes_beyond_orjson_range(self) -> None:
+        """Test values orjson rejects still round-trip through the stdlib."""
+        messages: list[WireMessage] = [WirePush(2**70), WireResolve(1, {1: "x"})]
+        result = serialize_wire_batch_bytes(messages)
+
+        assert parse_wire_batch_bytes(result) == [
+            WirePush(2**70),
+            WireResolve(1, {"1": "x"}),
+        ]
+        (nan_resolve,) = parse_wire_batch_bytes(b'["resolve", 1, NaN]')
+        assert isinstance(nan_resolve, WireResolve)
+        assert math.isnan(nan_resolve.value)
+
+    def test_encoding_matches_stdlib(self) -> None:
+        """Test that encoding does not depend on orjson being installed."""
+        messages: list[WireMessage] = [
+            WireResolve(1, [math.nan, math.inf, -math.inf]),
+        ]
+        result = serialize_wire_batch_bytes(messages)
+
+        assert result == b'["resolve",1,[[NaN,Infinity,-Infinity]]]'
+        (resolve,) = parse_wire_batch_bytes(result)
+        assert math.isnan(resolve.value[0])
+        assert resolve.value[1:] == [math.inf, -math.inf]
+        with pytest.raises(TypeError):
+            json_dumps_bytes({"id": uuid.uuid4()})
+
     def test_parse_batch(self) -> None:
         """Test parsing a batch of messages."""
         batch_str = '["push", "value1"]\n["pull", 42]\n["release", 1, 2]'
@@ -247,6 +299,13 @@ class TestBatchOperations:
         assert isinstance(messages[1], WirePull)
         assert isinstance(messages[2], WireRelease)
 
+    def test_parse_batch_bytes(self) -> None:
+        """Test parsing a UTF-8 encoded batch without decoding it first."""
+        batch = '["resolve", 1, "h\u00e9llo"]\n\n["pull", 42]\n'.encode()
+        messages = parse_wire_batch_bytes(batch)
+
+        assert messages == [WireResolve(1, "h\u00e9llo"), WirePull(42)]
+
     def test_roundtrip_batch(self) -> None:
         """Test serialization and parsing roundtrip."""
         original: list[WireMessage] = [WirePush(123), WirePull(42)]